@@ -2,13 +2,263 @@
 
 import pytest
 import os
+import uuid
 from datetime import datetime
+try:
+    import pytest_html
+except ImportError:
+    pytest_html = None
+from utils.api_cassette import MODES as CASSETTE_MODES, save_cassettes
+from utils.action_profiler import action_profiler, is_enabled as profiling_enabled
+from utils.config import get_setting, get_int_setting, get_bool_setting, set_setting, get_base_url
+from utils.driver_factory import BROWSER_PROFILES
+from utils.driver_pool import DriverPool
+from utils.http_transport import close_transport, transport_stats
+from utils.driver_resolver import resolve_chromedriver, get_last_resolution
+from utils.sharding import DEFAULT_DURATIONS_FILE, load_durations, save_durations, assign_shards
+from utils.parallel_runner import run_shards, shard_file
+from utils.local_server import LocalSiteServer
+from utils.results_db import DEFAULT_RESULTS_DB, DEFAULT_TREND_PAGE, ResultsDB, run_environment, write_trend_page
+from utils.resilience import resilience_stats
+from utils.response_cache import response_cache_stats
+from utils.page_timing import page_timings, timing_summary_html, is_enabled as page_timing_enabled
+from utils.user_pool import get_user_pool, close_user_pool
+from utils.request_blocking import (is_enabled as request_blocking_enabled, collect_network_stats,
+                                    write_blocking_report)
+from utils.screenshot_utils import (save_screenshot, save_page_source, flush_screenshots,
+                                    persist_step_screenshots, discard_step_screenshots)
+
+# Per-test durations (setup + call + teardown) recorded during this run
+_test_durations = {}
+
+# (nodeid, phase, outcome, duration) of every test phase, stored in the results database
+_test_results = []
+_run_started = datetime.now().isoformat(timespec='seconds')
+_run_environment = {}
+
+# Per-test blocked/loaded request stats when request blocking is enabled
+_blocking_results = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("qa-ecommerce")
+    group.addoption("--driver-pool-size", action="store", type=int, default=None,
+                    help="Number of warm browsers kept for the session (env DRIVER_POOL_SIZE, default 1)")
+    group.addoption("--browser-profile", action="store", default=None, choices=list(BROWSER_PROFILES),
+                    help="Browser preset: default, headless or lean (env BROWSER_PROFILE)")
+    group.addoption("--workers", action="store", type=int, default=None,
+                    help="Run the suite in N parallel worker processes (env TEST_WORKERS)")
+    group.addoption("--shard-count", action="store", type=int, default=None,
+                    help="Only run one of N duration-balanced shards (env SHARD_COUNT)")
+    group.addoption("--shard-index", action="store", type=int, default=None,
+                    help="Index of the shard to run, 0-based (env SHARD_INDEX)")
+    group.addoption("--site-base-url", action="store", default=None,
+                    help="Site under test (env BASE_URL, default https://automationexercise.com)")
+    group.addoption("--local-server", action="store_true", default=None,
+                    help="Run against the bundled local stand-in server (env LOCAL_SERVER)")
+    group.addoption("--api-cassette", action="store", default=None, choices=list(CASSETTE_MODES),
+                    help="Record API responses to cassettes or replay them (env API_CASSETTE)")
+    group.addoption("--api-retries", action="store", type=int, default=None,
+                    help="Retry transient failures of idempotent API calls up to N times (env API_RETRIES)")
+    group.addoption("--api-cache", action="store_true", default=None,
+                    help="Cache productsList/brandsList responses between tests (env API_CACHE)")
+    group.addoption("--benchmark", action="store_true", default=None,
+                    help="Run the API latency benchmark in tests/api/test_api_benchmark.py (env API_BENCHMARK)")
+    group.addoption("--screenshot-retention", action="store", default=None, choices=["all", "on-failure"],
+                    help="Keep step screenshots always or only for failed tests (env SCREENSHOT_RETENTION)")
+    group.addoption("--block-requests", action="store", default=None,
+                    help="Comma separated request categories to block: ads, analytics, fonts, images, "
+                         "'default' or 'none' to only measure (env BLOCK_REQUESTS)")
+    group.addoption("--profile-actions", action="store_true", default=None,
+                    help="Time every BasePage action and write a flame-style profile (env ACTION_PROFILE)")
+    group.addoption("--durations-file", action="store", default=None,
+                    help=f"Recorded test durations used for sharding (env DURATIONS_FILE, default {DEFAULT_DURATIONS_FILE})")
+    group.addoption("--results-db", action="store", default=None,
+                    help=f"SQLite database of results across runs, 'off' to disable (env RESULTS_DB, default {DEFAULT_RESULTS_DB})")
+
+
+def pytest_cmdline_main(config):
+    # Parallel mode: this process only coordinates the worker processes
+    set_setting("TEST_WORKERS", config.getoption("--workers"))
+    set_setting("DURATIONS_FILE", config.getoption("--durations-file"))
+    set_setting("RESULTS_DB", config.getoption("--results-db"))
+    workers = get_int_setting("TEST_WORKERS", 1)
+    if workers <= 1 or get_setting("SHARD_COUNT") or config.option.collectonly:
+        return None
+
+    # Ties the workers' rows in the results database to one run
+    set_setting("TEST_RUN_GROUP", uuid.uuid4().hex)
+    exit_code = run_shards(
+        list(config.invocation_params.args),
+        workers,
+        html_path=config.getoption("htmlpath", default=None),
+        junit_path=config.getoption("xmlpath", default=None),
+        durations_file=get_setting("DURATIONS_FILE", DEFAULT_DURATIONS_FILE),
+    )
+    _write_trend_page()
+    return exit_code
+
+
+def _results_db_path():
+    # None when the results database is switched off
+    path = get_setting("RESULTS_DB", DEFAULT_RESULTS_DB)
+    return None if path.lower() in ("off", "none", "0") else path
+
+
+def _write_trend_page():
+    path = _results_db_path()
+    if path is None or not os.path.exists(path):
+        return
+    db = ResultsDB(path)
+    try:
+        trend_path = write_trend_page(db, get_setting("TREND_PAGE", DEFAULT_TREND_PAGE))
+        print(f"📈 Duration trends: {trend_path}")
+    finally:
+        db.close()
+
+
+def pytest_configure(config):
+    # Copy command line options into the environment so utils see them
+    set_setting("DRIVER_POOL_SIZE", config.getoption("--driver-pool-size"))
+    set_setting("BROWSER_PROFILE", config.getoption("--browser-profile"))
+    set_setting("SHARD_COUNT", config.getoption("--shard-count"))
+    set_setting("SHARD_INDEX", config.getoption("--shard-index"))
+    set_setting("BASE_URL", config.getoption("--site-base-url"))
+    set_setting("LOCAL_SERVER", config.getoption("--local-server"))
+    set_setting("API_BENCHMARK", config.getoption("--benchmark"))
+    set_setting("API_CASSETTE", config.getoption("--api-cassette"))
+    set_setting("API_RETRIES", config.getoption("--api-retries"))
+    set_setting("API_CACHE", config.getoption("--api-cache"))
+    set_setting("SCREENSHOT_RETENTION", config.getoption("--screenshot-retention"))
+    set_setting("BLOCK_REQUESTS", config.getoption("--block-requests"))
+    set_setting("ACTION_PROFILE", config.getoption("--profile-actions"))
+
+
+def pytest_collection_modifyitems(config, items):
+    # Keep only this worker's shard, balanced by recorded durations
+    shard_count = get_int_setting("SHARD_COUNT", 1)
+    if shard_count <= 1:
+        return
+    shard_index = get_int_setting("SHARD_INDEX", 0)
+    durations = load_durations(get_setting("DURATIONS_FILE", DEFAULT_DURATIONS_FILE))
+    db_path = _results_db_path()
+    if db_path and os.path.exists(db_path):
+        # Median of recent runs is steadier than the last run alone; rows of this
+        # run are ignored so that every worker computes the same shards
+        db = ResultsDB(db_path)
+        try:
+            durations.update(db.test_durations(runs=get_int_setting("SHARD_HISTORY_RUNS", 5),
+                                               exclude_group=get_setting("TEST_RUN_GROUP")))
+        finally:
+            db.close()
+    shards, totals = assign_shards([item.nodeid for item in items], durations, shard_count)
+
+    selected_ids = set(shards[shard_index])
+    selected = [item for item in items if item.nodeid in selected_ids]
+    deselected = [item for item in items if item.nodeid not in selected_ids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+    print(f"\n🧩 Shard {shard_index + 1}/{shard_count}: {len(selected)} tests, ~{totals[shard_index]:.1f}s expected")
+
+
+def pytest_runtest_logreport(report):
+    # Sum setup, call and teardown time per test for duration-based sharding
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+    _test_results.append((report.nodeid, report.when, report.outcome, report.duration))
+    if not _run_environment:
+        # Taken while session fixtures (e.g. the local server's BASE_URL) are active
+        _run_environment.update(run_environment())
+
+
+def pytest_runtest_setup(item):
+    if page_timing_enabled():
+        page_timings.start_test(item.nodeid)
+    if profiling_enabled():
+        action_profiler.start_test(item.nodeid)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    outcome = yield
+    # Pages slower than the PERF_BUDGET_* limits fail an otherwise passing test
+    violations = page_timings.budget_violations(item.nodeid)
+    if violations and outcome.excinfo is None:
+        outcome.force_exception(AssertionError("Page performance budget exceeded: " + "; ".join(violations)))
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    discard_step_screenshots()
+    page_timings.finish_test()
+    action_profiler.finish_test()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Make sure screenshots queued by the background writer are on disk
+    flush_screenshots()
+    save_cassettes()
+    close_transport()
+    if page_timings.results:
+        timing_path = get_setting("PAGE_TIMING_FILE", "reports/page_timings.json")
+        if get_setting("SHARD_COUNT"):
+            timing_path = timing_path.replace(".json", f"-shard{get_int_setting('SHARD_INDEX', 0)}.json")
+        page_timings.write(timing_path)
+    if action_profiler.actions:
+        shard_suffix = f"-shard{get_int_setting('SHARD_INDEX', 0)}" if get_setting("SHARD_COUNT") else ""
+        action_profiler.write(f"reports/action_profile{shard_suffix}.json",
+                              f"reports/action_profile{shard_suffix}.folded")
+    if _blocking_results:
+        report_path = get_setting("BLOCKING_REPORT_FILE", "reports/blocked_requests.json")
+        if get_setting("SHARD_COUNT"):
+            report_path = report_path.replace(".json", f"-shard{get_int_setting('SHARD_INDEX', 0)}.json")
+        write_blocking_report(_blocking_results, report_path)
+    if not _test_durations:
+        return
+    _record_results(exitstatus)
+    if get_setting("SHARD_COUNT") and get_bool_setting("SHARD_COORDINATED"):
+        # The coordinator merges every shard's file once all workers are done
+        save_durations(_test_durations, shard_file('durations', get_int_setting("SHARD_INDEX", 0), 'json'))
+    else:
+        save_durations(_test_durations, get_setting("DURATIONS_FILE", DEFAULT_DURATIONS_FILE))
+
+
+def _record_results(exitstatus):
+    # One transaction per run; shards of a parallel run share TEST_RUN_GROUP
+    path = _results_db_path()
+    if path is None:
+        return
+    shard_count = get_int_setting("SHARD_COUNT", 0)
+    db = ResultsDB(path)
+    try:
+        db.record_run(
+            _run_started, _test_results, exit_status=int(exitstatus),
+            run_group=get_setting("TEST_RUN_GROUP"),
+            shard_index=get_int_setting("SHARD_INDEX", 0) if shard_count else None,
+            shard_count=shard_count or None,
+            environment=_run_environment,
+        )
+    finally:
+        db.close()
+    if not get_bool_setting("SHARD_COORDINATED"):
+        # The coordinator writes the page once every worker has recorded its results
+        _write_trend_page()
+
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture screenshots on test failures when using pytest"""
     outcome = yield
     rep = outcome.get_result()
+
+    if rep.failed:
+        # Buffered step screenshots are only kept for failed tests
+        for filepath in persist_step_screenshots():
+            print(f"\n📸 Step screenshot saved: {filepath}")
+
+    timings = page_timings.timings(item.nodeid)
+    if rep.when == "call" and timings and pytest_html is not None:
+        # Page timing table in the pytest-html report
+        rep.extras = getattr(rep, 'extras', []) + [pytest_html.extras.html(timing_summary_html(timings))]
     
     # Only capture screenshot on test failure and during the call phase
     if rep.when == "call" and rep.failed:
@@ -27,28 +277,127 @@ def pytest_runtest_makereport(item, call):
             filepath = os.path.join(screenshot_dir, filename)
             
             try:
-                # Capture screenshot
-                driver.save_screenshot(filepath)
+                # Capture screenshot, the same PNG is embedded in the HTML report
+                png_base64 = driver.get_screenshot_as_base64()
+                filepath = save_screenshot(driver, filepath, item.nodeid, "PYTEST_FAILURE", png_base64)
                 
                 # Also save page source
                 source_filename = filename.replace('.png', '_page_source.html')
                 source_filepath = os.path.join(screenshot_dir, source_filename)
                 
-                with open(source_filepath, 'w', encoding='utf-8') as f:
-                    f.write(driver.page_source)
+                save_page_source(driver, source_filepath)
                 
                 print(f"\n📸 Failure screenshot saved: {filepath}")
                 print(f"📄 Page source saved: {source_filepath}")
                 
-                # Add screenshot to pytest-html report
-                if hasattr(rep, 'extra'):
-                    rep.extra.append(pytest_html.extras.png(filepath))
+                # Add screenshot to pytest-html report as data: a path would be resolved
+                # relative to the report and is dropped from self-contained reports
+                if pytest_html is not None:
+                    rep.extras = getattr(rep, 'extras', []) + [pytest_html.extras.png(png_base64)]
                 
             except Exception as e:
                 print(f"❌ Failed to capture screenshot: {str(e)}")
 
+def pytest_terminal_summary(terminalreporter):
+    # Report driver startup cost so it can be tracked between runs
+    resolution = get_last_resolution()
+    if resolution is not None:
+        terminalreporter.write_line(
+            f"chromedriver resolution: {resolution.seconds:.3f}s ({resolution.source}, "
+            f"Chrome {resolution.chrome_version or 'unknown'})"
+        )
+    transport = transport_stats()
+    if transport['requests']:
+        terminalreporter.write_line(
+            f"API transport: {transport['requests']} requests over {transport['connections']} connections "
+            f"({transport['reused']} reused), DNS {transport['dns_lookups']} lookups / {transport['dns_hits']} cached"
+        )
+    cache = response_cache_stats()
+    if cache:
+        terminalreporter.write_line(
+            f"API response cache: {cache['hits']} hits, {cache['misses']} misses, {cache['revalidated']} revalidated, "
+            f"{cache['bypassed']} bypassed, {cache['evictions']} evicted"
+        )
+    resilience = resilience_stats()
+    if resilience and resilience['endpoints']:
+        # Endpoints that needed retries point at flaky infrastructure even when the tests passed
+        for endpoint, counters in sorted(resilience['endpoints'].items()):
+            if counters['retries'] or counters['short_circuited'] or counters['budget_exhausted']:
+                terminalreporter.write_line(
+                    f"API retries {endpoint}: {counters['retries']} retries, {counters['recovered']} recovered, "
+                    f"{counters['gave_up']} gave up, {counters['budget_exhausted']} over budget, "
+                    f"{counters['short_circuited']} short-circuited"
+                )
+        if resilience['open_breakers']:
+            terminalreporter.write_line(f"API circuit breakers open: {', '.join(resilience['open_breakers'])}")
+    if action_profiler.actions:
+        terminalreporter.write_line("slowest page actions (total s, calls, WebDriver commands):")
+        for name, (seconds, calls, commands) in action_profiler.top_actions():
+            terminalreporter.write_line(f"  {seconds:8.3f}s {calls:5d} {commands:6d}  {name}")
+    if _blocking_results:
+        saved = sum(stats['bytes_saved'] for stats in _blocking_results.values())
+        blocked = sum(stats['blocked_requests'] for stats in _blocking_results.values())
+        unknown = sum(stats['blocked_unknown_size'] for stats in _blocking_results.values())
+        terminalreporter.write_line(
+            f"request blocking: {blocked} requests blocked, ~{saved / 1024:.0f} KiB saved "
+            f"({unknown} of unknown size)"
+        )
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_reports_directory():
     """Create reports directory structure"""
     os.makedirs("reports/screenshots", exist_ok=True)
-    os.makedirs("reports/logs", exist_ok=True)
\ No newline at end of file
+    os.makedirs("reports/logs", exist_ok=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_site_server():
+    """Start the local stand-in site and point BASE_URL at it when requested"""
+    if not get_bool_setting("LOCAL_SERVER"):
+        yield None
+        return
+    server = LocalSiteServer().start()
+    previous_base_url = get_setting("BASE_URL")
+    set_setting("BASE_URL", server.base_url)
+    print(f"\n🏠 Local stand-in server running on {get_base_url()}")
+    yield server
+    server.stop()
+    if previous_base_url is None:
+        os.environ.pop("BASE_URL", None)
+    else:
+        set_setting("BASE_URL", previous_base_url)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def user_pool(local_site_server):
+    """Pooled test accounts, provisioned before the first test and saved or deleted at session end"""
+    pool = get_user_pool()
+    # Signups happen here, concurrently, instead of inside the first tests that lease an account
+    pool.provision()
+    yield pool
+    close_user_pool()
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Session-wide pool of warm browsers"""
+    resolution = resolve_chromedriver()
+    print(f"\n🔧 chromedriver resolved from {resolution.source} in {resolution.seconds:.2f}s: {resolution.path}")
+    pool = DriverPool(size=get_int_setting("DRIVER_POOL_SIZE", 1))
+    yield pool
+    pool.close()
+    print(f"\n🧹 Driver pool closed: {pool.stats}")
+
+
+@pytest.fixture
+def driver(driver_pool, request):
+    """Browser leased from the pool for one test, reset afterwards"""
+    leased = driver_pool.acquire()
+    if request_blocking_enabled():
+        # Drop log entries from earlier tests and the pool reset
+        collect_network_stats(leased)
+    yield leased
+    if request_blocking_enabled():
+        _blocking_results[request.node.nodeid] = collect_network_stats(leased)
+    driver_pool.release(leased)
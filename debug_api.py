@@ -1,8 +1,9 @@
 # debug_api.py - Quick test to see what's happening
 import requests
+from utils.config import get_base_url
 
 # Test search API directly
-url = "https://automationexercise.com/api/searchProduct"
+url = f"{get_base_url()}/api/searchProduct"
 data = {'search_product': 'top'}
 
 response = requests.post(url, data=data)
@@ -1,59 +1,343 @@
 # pages/base_page.py
 
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.alert import Alert
-from selenium.common.exceptions import TimeoutException, NoAlertPresentException
+from selenium.common.exceptions import (TimeoutException, NoAlertPresentException, WebDriverException,
+                                        StaleElementReferenceException, UnexpectedAlertPresentException)
+from utils.action_profiler import InstrumentedWait, action_profiler, profiled_action, is_enabled as profiling_enabled
+from utils.config import get_int_setting
+from utils.locator_cache import LocatorGroup, locator_cache
+from utils.page_timing import page_timings
 from utils.screenshot_utils import ScreenshotManager
 
+# Checks used by find_any for the first element a locator matches
+ELEMENT_CONDITIONS = {
+    'present': lambda element: True,
+    'visible': lambda element: element.is_displayed(),
+    'clickable': lambda element: element.is_displayed() and element.is_enabled(),
+}
+
+# Tracks pending XHR/fetch calls, DOM mutations and page unloads in every document
+PAGE_TRACKER_JS = """
+(function () {
+  if (window.__qaTracker) { return; }
+  var tracker = window.__qaTracker = {pending: 0, lastMutation: Date.now(), navigating: false};
+  var send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    tracker.pending++;
+    this.addEventListener('loadend', function () { tracker.pending--; });
+    return send.apply(this, arguments);
+  };
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      tracker.pending++;
+      return originalFetch.apply(this, arguments).finally(function () { tracker.pending--; });
+    };
+  }
+  new MutationObserver(function () { tracker.lastMutation = Date.now(); })
+    .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+  window.addEventListener('beforeunload', function () { tracker.navigating = true; });
+})();
+"""
+
+PAGE_STATE_JS = """
+var tracker = window.__qaTracker;
+return {
+  readyState: document.readyState,
+  installed: !!tracker,
+  pending: tracker ? tracker.pending : 0,
+  quietFor: tracker ? Date.now() - tracker.lastMutation : 0,
+  navigating: tracker ? tracker.navigating : false,
+  jqueryActive: window.jQuery ? window.jQuery.active : 0
+};
+"""
+
+# Resolves {field: [[kind, value], ...]} in one call, first visible match wins per field
+EXTRACT_TEXTS_JS = """
+var fields = arguments[0], result = {};
+function visible(el) {
+  return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+    && window.getComputedStyle(el).visibility !== 'hidden';
+}
+function find(kind, value) {
+  if (kind === 'xpath') {
+    var nodes = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var found = [];
+    for (var i = 0; i < nodes.snapshotLength; i++) { found.push(nodes.snapshotItem(i)); }
+    return found;
+  }
+  return Array.prototype.slice.call(document.querySelectorAll(value));
+}
+Object.keys(fields).forEach(function (name) {
+  var locators = fields[name];
+  for (var i = 0; i < locators.length; i++) {
+    var elements;
+    try { elements = find(locators[i][0], locators[i][1]); } catch (e) { continue; }
+    if (elements.length && visible(elements[0])) {
+      result[name] = {text: elements[0].innerText.trim(), index: i};
+      return;
+    }
+  }
+  result[name] = null;
+});
+return result;
+"""
+
+# Identity of the current document and whether it is being unloaded
+DOCUMENT_STATE_JS = """
+return [performance.timeOrigin, !!(window.__qaTracker && window.__qaTracker.navigating)];
+"""
+
+# Selenium locator strategies expressed as CSS selectors for EXTRACT_TEXTS_JS
+CSS_STRATEGIES = {
+    'id': lambda value: f'[id="{value}"]',
+    'name': lambda value: f'[name="{value}"]',
+    'class name': lambda value: f".{value}",
+    'tag name': lambda value: value,
+}
+
+
+def _first_match(driver, alternatives, check):
+    # (element, locator) of the first alternative whose first element passes check, else None
+    for locator in alternatives:
+        try:
+            elements = driver.find_elements(*locator)
+            if elements and check(elements[0]):
+                return elements[0], locator
+        except StaleElementReferenceException:
+            continue
+    return None
+
+
+def _xpath_literal(value):
+    # XPath 1.0 has no escape character, a value with both quote kinds goes through concat()
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat('" + "', \"'\", '".join(value.split("'")) + "')"
+
+
+def _to_js_locator(locator):
+    by, value = locator
+    if by in ("xpath", "css selector"):
+        return [by, value]
+    if by in CSS_STRATEGIES:
+        return ["css selector", CSS_STRATEGIES[by](value)]
+    if by == "link text":
+        return ["xpath", f"//a[normalize-space(.)={_xpath_literal(value)}]"]
+    if by == "partial link text":
+        return ["xpath", f"//a[contains(., {_xpath_literal(value)})]"]
+    raise ValueError(f"Unsupported locator strategy for bulk extraction: {by}")
+
+
 class BasePage:
+    # How long the DOM must stay unchanged before the page counts as ready
+    DOM_QUIET_MS = get_int_setting("DOM_QUIET_MS", 150)
+    POLL_FREQUENCY = 0.05
+
     def __init__(self, driver, test_name="BasePage"):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.wait = InstrumentedWait(driver, 10)
         self.screenshot_manager = ScreenshotManager(driver, test_name)
+        self._install_page_tracker()
+        if profiling_enabled():
+            action_profiler.instrument(driver)
+
+    def _install_page_tracker(self):
+        # Register the tracker for every future document, once per browser
+        if getattr(self.driver, '_qa_page_tracker', False):
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {'source': PAGE_TRACKER_JS})
+        except (AttributeError, WebDriverException):
+            # Not Chrome: the tracker is injected into the current page on demand instead
+            pass
+        self.driver._qa_page_tracker = True
+
+    @profiled_action
+    def open(self, url):
+        # Navigate and wait until the page has settled
+        self.driver.get(url)
+        self.wait_for_page_ready(step=f"open {url}")
 
+    @profiled_action
     def click(self, locator):
         element = self.wait.until(EC.element_to_be_clickable(locator))
+        document = self._document_before_click()
         element.click()
+        self._time_click_navigation(document, f"click {locator[1]}")
 
+    @profiled_action
     def enter_text(self, locator, text):
         element = self.wait.until(EC.visibility_of_element_located(locator))
         element.send_keys(text)
     
+    @profiled_action
     def clear_and_enter_text(self, locator, text):
         element = self.wait.until(EC.visibility_of_element_located(locator))
         element.clear()
         element.send_keys(text)
 
+    @profiled_action
     def get_text(self, locator):
         return self.wait.until(EC.visibility_of_element_located(locator)).text
 
+    @profiled_action
     def is_visible(self, locator):
         element = self.wait.until(EC.visibility_of_element_located(locator))
         return element.is_displayed()
 
+    @profiled_action
     def select_dropdown(self, locator, value):
         dropdown = self.wait.until(EC.visibility_of_element_located(locator))
         Select(dropdown).select_by_visible_text(value)
     
+    @profiled_action
     def is_present(self, locator, timeout=10):
         # Check if element is present in DOM (not necessarily visible)
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = InstrumentedWait(self.driver, timeout)
             wait.until(EC.presence_of_element_located(locator))
             return True
         except TimeoutException:
             return False
 
+    @profiled_action
+    def find_any(self, group, condition="visible", timeout=10):
+        """Wait for the first locator of a LocatorGroup that meets condition.
+
+        Every poll tries all alternatives (last winner first), so a stale
+        primary locator costs one poll instead of a full timeout. Returns
+        (element, locator) and remembers the winner, raises TimeoutException.
+        """
+        check = ELEMENT_CONDITIONS[condition]
+        alternatives = locator_cache.ordered(group)
+
+        wait = InstrumentedWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY)
+        element, locator = wait.until(lambda driver: _first_match(driver, alternatives, check) or False,
+                                      f"No locator of {group.name} matched")
+        locator_cache.record(group, locator)
+        return element, locator
+
+    @profiled_action
+    def wait_for_any(self, conditions, timeout=10, condition="visible"):
+        """Wait until the first of several named outcomes happens.
+
+        conditions maps a name to a locator, a LocatorGroup or a callable
+        taking the driver. All of them are checked on every poll, so failure
+        outcomes (an error message, a finished page without the element) end
+        the wait as soon as they appear instead of after a full timeout.
+        Returns (name, result) of the first match in mapping order, where
+        result is the element or the callable's value, or (None, None) when
+        nothing matched within timeout.
+
+            outcome, _ = self.wait_for_any({'loaded': self.TITLE, 'error': self.ERROR})
+        """
+        check = ELEMENT_CONDITIONS[condition]
+        alternatives = {name: locator_cache.ordered(spec) if isinstance(spec, LocatorGroup) else [spec]
+                        for name, spec in conditions.items() if not callable(spec)}
+
+        def first_outcome(driver):
+            for name, spec in conditions.items():
+                if callable(spec):
+                    result = spec(driver)
+                    if result:
+                        return name, result
+                    continue
+                match = _first_match(driver, alternatives[name], check)
+                if match:
+                    if isinstance(spec, LocatorGroup):
+                        locator_cache.record(spec, match[1])
+                    return name, match[0]
+            return False
+
+        wait = InstrumentedWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY)
+        try:
+            return wait.until(first_outcome)
+        except TimeoutException:
+            return None, None
+
+    def document_loaded(self, url_contains=None):
+        """Condition for wait_for_any: the current document finished loading (at a matching URL)"""
+        def loaded(driver):
+            if url_contains and url_contains not in driver.current_url:
+                return False
+            return driver.execute_script("return document.readyState") == "complete"
+        return loaded
+
+    @profiled_action
+    def click_any(self, group, timeout=10):
+        element, locator = self.find_any(group, "clickable", timeout)
+        document = self._document_before_click()
+        element.click()
+        self._time_click_navigation(document, f"click {group.name}")
+        return locator
+
+    @profiled_action
+    def get_text_any(self, group, timeout=10):
+        element, _ = self.find_any(group, "visible", timeout)
+        return element.text
+
+    @profiled_action
+    def is_visible_any(self, group, timeout=10):
+        # Same as is_visible, raises TimeoutException when nothing matched
+        element, _ = self.find_any(group, "visible", timeout)
+        return element.is_displayed()
+
+    @profiled_action
+    def is_present_any(self, group, timeout=10):
+        try:
+            self.find_any(group, "present", timeout)
+            return True
+        except TimeoutException:
+            return False
+
+    @profiled_action
+    def extract_texts(self, fields):
+        """Read the text of many elements with a single execute_script call.
+
+        fields maps a field name to a LocatorGroup or a list of locators; the
+        first locator whose first match is visible wins. Returns (texts,
+        missing) where texts maps found fields to their text and missing
+        lists the fields no locator matched.
+        """
+        groups = {}
+        payload = {}
+        for name, locators in fields.items():
+            if isinstance(locators, LocatorGroup):
+                groups[name] = (locators, locator_cache.ordered(locators))
+                locators = groups[name][1]
+            payload[name] = [_to_js_locator(locator) for locator in locators]
+
+        results = self.driver.execute_script(EXTRACT_TEXTS_JS, payload)
+
+        texts = {}
+        missing = []
+        for name in fields:
+            found = results.get(name)
+            if found is None:
+                missing.append(name)
+                continue
+            texts[name] = found['text']
+            if name in groups:
+                group, ordered = groups[name]
+                locator_cache.record(group, ordered[found['index']])
+        return texts, missing
+
+    @profiled_action
     def wait_for_alert(self, timeout=10):
         # Wait for alert to appear and return it
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = InstrumentedWait(self.driver, timeout)
             return wait.until(EC.alert_is_present())
         except TimeoutException:
             return None
     
+    @profiled_action
     def handle_alert(self, action="accept"):
         """Handle JavaScript alert
         Args:
@@ -71,6 +355,93 @@ class BasePage:
             pass
         return False
     
+    def get_page_state(self):
+        # Snapshot of readyState, pending requests and DOM activity
+        state = self.driver.execute_script(PAGE_STATE_JS)
+        if not state['installed'] and state['readyState'] == "complete":
+            # Page was loaded before the tracker existed (or no CDP), inject it now
+            self.driver.execute_script(PAGE_TRACKER_JS)
+        return state
+
+    @profiled_action
+    def wait_for_page_ready(self, timeout=10, quiet_ms=None, step=None):
+        """Wait until the document is loaded, no XHR/fetch is pending and the DOM is quiet.
+
+        Returns True as soon as the page is ready, False on timeout. The
+        first time a document is ready its Navigation/Resource Timing is
+        recorded for the running test under `step` (default: the URL).
+        """
+        quiet_ms = self.DOM_QUIET_MS if quiet_ms is None else quiet_ms
+
+        def page_is_ready(driver):
+            state = self.get_page_state()
+            return (state['readyState'] == "complete" and state['installed']
+                    and not state['navigating'] and state['pending'] == 0
+                    and not state['jqueryActive'] and state['quietFor'] >= quiet_ms)
+
+        try:
+            InstrumentedWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY).until(page_is_ready)
+        except TimeoutException:
+            return False
+        page_timings.capture(self.driver, step)
+        return True
+
+    def _document_before_click(self):
+        # timeOrigin of the current document, None when no test records page timings
+        if page_timings.current_test is None:
+            return None
+        try:
+            return self.driver.execute_script(DOCUMENT_STATE_JS)[0]
+        except WebDriverException:
+            return None
+
+    def _alert_open(self):
+        # Reading the alert text leaves an open dialog untouched
+        try:
+            self.driver.switch_to.alert.text
+            return True
+        except WebDriverException:
+            # NoAlertPresentException, or a driver without alert support
+            return False
+
+    def _time_click_navigation(self, document, step):
+        # A click that loaded a new document gets its timing recorded like open()
+        if document is None or self._alert_open():
+            # A script would make ChromeDriver dismiss the dialog the click opened
+            return
+        try:
+            time_origin, navigating = self.driver.execute_script(DOCUMENT_STATE_JS)
+        except UnexpectedAlertPresentException:
+            return
+        except WebDriverException:
+            # The old document is going away
+            time_origin, navigating = None, True
+        if navigating or time_origin != document:
+            self.wait_for_page_ready(step=step)
+
+    def wait_for_dom_quiet(self, quiet_ms=None, timeout=10):
+        # Wait until no DOM mutation happened for quiet_ms
+        return self.wait_for_page_ready(timeout=timeout, quiet_ms=quiet_ms)
+
+    @profiled_action
+    def wait_for_url_change(self, previous_url, timeout=10):
+        # Wait until the browser leaves previous_url, then until the new page is ready
+        try:
+            InstrumentedWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY).until(EC.url_changes(previous_url))
+        except TimeoutException:
+            return False
+        return self.wait_for_page_ready(timeout=timeout)
+
+    @profiled_action
+    def wait_for_url_contains(self, text, timeout=10):
+        # Wait until the URL contains text, then until the page is ready
+        try:
+            InstrumentedWait(self.driver, timeout, poll_frequency=self.POLL_FREQUENCY).until(EC.url_contains(text))
+        except TimeoutException:
+            return False
+        return self.wait_for_page_ready(timeout=timeout)
+
+    @profiled_action
     def capture_screenshot(self, step_name):
         # Capture screenshot for debugging
         return self.screenshot_manager.capture_step_screenshot(step_name)
\ No newline at end of file
@@ -1,7 +1,10 @@
 # pages/cart_page.py
 
+import re
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
+from utils.locator_cache import LocatorGroup
 
 class CartPage(BasePage):
     PRODUCT_NAME_IN_CART = (By.XPATH, "//td[@class='cart_description']//a")
@@ -13,6 +16,8 @@ class CartPage(BasePage):
     ALT_QUANTITY = (By.XPATH, "//td[contains(@class,'quantity')]//button")
     ALT_QUANTITY_2 = (By.XPATH, "//button[@class='disabled']")
     ALT_QUANTITY_3 = (By.XPATH, "//td[@class='cart_quantity']")
+    QUANTITY_LOCATORS = LocatorGroup("CartPage.quantity", PRODUCT_QUANTITY_IN_CART,
+                                     ALT_QUANTITY, ALT_QUANTITY_2, ALT_QUANTITY_3)
     
     def get_product_name(self):
         # Get product name from cart
@@ -21,35 +26,22 @@ class CartPage(BasePage):
     def get_product_quantity(self):
         # Get product quantity from cart
         try:
-            quantity_text = self.get_text(self.PRODUCT_QUANTITY_IN_CART)
+            quantity_text = self.get_text_any(self.QUANTITY_LOCATORS)
             return int(quantity_text.strip())
-        except:
+        except (TimeoutException, ValueError):
+            # Look for any number in cart table
             try:
-                quantity_text = self.get_text(self.ALT_QUANTITY)
-                return int(quantity_text.strip())
-            except:
-                try:
-                    quantity_text = self.get_text(self.ALT_QUANTITY_2)
-                    return int(quantity_text.strip())
-                except:
-                    try:
-                        quantity_text = self.get_text(self.ALT_QUANTITY_3)
-                        return int(quantity_text.strip())
-                    except:
-                        # Look for any number in cart table
-                        try:
-                            table = self.driver.find_element(*self.CART_TABLE)
-                            # Search for quantity in table text
-                            import re
-                            numbers = re.findall(r'\b\d+\b', table.text)
-                            # Usually quantity is one of the numbers found
-                            for num in numbers:
-                                if int(num) >= 1 and int(num) <= 10:  # Reasonable quantity range
-                                    return int(num)
-                            return 1  # Default fallback
-                        except Exception as e:
-                            print(f"Could not extract quantity: {e}")
-                            return None
+                table = self.driver.find_element(*self.CART_TABLE)
+                # Search for quantity in table text
+                numbers = re.findall(r'\b\d+\b', table.text)
+                # Usually quantity is one of the numbers found
+                for num in numbers:
+                    if int(num) >= 1 and int(num) <= 10:  # Reasonable quantity range
+                        return int(num)
+                return 1  # Default fallback
+            except Exception as e:
+                print(f"Could not extract quantity: {e}")
+                return None
     
     def is_product_displayed_in_cart(self):
         # Verify product is displayed in cart
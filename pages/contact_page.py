@@ -5,6 +5,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.alert import Alert
 from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
+from utils.locator_cache import LocatorGroup
 
 
 class ContactPage(BasePage):
@@ -23,6 +24,8 @@ class ContactPage(BasePage):
     
     # Success message and navigation
     SUCCESS_MESSAGE = (By.XPATH, "//div[contains(@class,'status alert') and contains(text(),'Success! Your details have been submitted successfully.')]")
+    ALT_SUCCESS_MESSAGE = (By.XPATH, "//div[contains(text(),'Success! Your details have been submitted successfully.')]")
+    SUCCESS_MESSAGE_LOCATORS = LocatorGroup("ContactPage.success_message", SUCCESS_MESSAGE, ALT_SUCCESS_MESSAGE)
     HOME_BUTTON = (By.XPATH, "//a[contains(text(),'Home')]")
 
     # Methods
@@ -68,18 +71,13 @@ class ContactPage(BasePage):
     def is_success_message_visible(self):
         # Verify success message is visible
         try:
-            return self.is_visible(self.SUCCESS_MESSAGE)
+            return self.is_visible_any(self.SUCCESS_MESSAGE_LOCATORS)
         except TimeoutException:
-            # Try alternative locator if the first one doesn't work
-            alternative_success = (By.XPATH, "//div[contains(text(),'Success! Your details have been submitted successfully.')]")
-            try:
-                return self.is_visible(alternative_success)
-            except TimeoutException:
-                print("Success message not found with either locator")
-                # Print page source for debugging
-                if "Success!" in self.driver.page_source:
-                    print("Success text found in page source but element not located")
-                return False
+            print("Success message not found with either locator")
+            # Print page source for debugging
+            if "Success!" in self.driver.page_source:
+                print("Success text found in page source but element not located")
+            return False
 
     def click_home_button(self):
         # Click 'Home' button
@@ -3,6 +3,7 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from selenium.webdriver.common.action_chains import ActionChains
+from utils.locator_cache import LocatorGroup
 
 class HomePage(BasePage):
     # locators
@@ -19,6 +20,7 @@ class HomePage(BasePage):
     # locators for Login/Logout
     SIGNUP_LOGIN_LINK = (By.XPATH, "//a[contains(text(),'Signup') and contains(text(),'Login')]")
     ALT_SIGNUP_LOGIN_LINK = (By.XPATH, "//a[@href='/login']")
+    SIGNUP_LOGIN_LOCATORS = LocatorGroup("HomePage.signup_login", SIGNUP_LOGIN_LINK, ALT_SIGNUP_LOGIN_LINK)
     
     def is_home_page_visible(self):
         # Verify that home page is visible
@@ -26,10 +28,7 @@ class HomePage(BasePage):
     
     def click_signup_login(self):
         # Click on 'Signup / Login' button
-        try:
-            self.click(self.SIGNUP_LOGIN_LINK)
-        except:
-            self.click(self.ALT_SIGNUP_LOGIN_LINK)
+        self.click_any(self.SIGNUP_LOGIN_LOCATORS)
     
     def click_view_product_on_home_page(self):
         # Click 'View Product' for any product on home page
@@ -1,7 +1,9 @@
 # pages/login_page.py
 
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
+from utils.locator_cache import LocatorGroup
 
 class LoginPage(BasePage):
     # locators
@@ -16,6 +18,8 @@ class LoginPage(BasePage):
     # locators for login
     LOGIN_TO_ACCOUNT_TEXT = (By.XPATH, "//h2[contains(text(),'Login to your account')]")
     ALT_LOGIN_TO_ACCOUNT_TEXT = (By.XPATH, "//div[@class='login-form']//h2")
+    LOGIN_TO_ACCOUNT_LOCATORS = LocatorGroup("LoginPage.login_to_account", LOGIN_TO_ACCOUNT_TEXT,
+                                             ALT_LOGIN_TO_ACCOUNT_TEXT)
     
     def go_to_login_page(self):
         # Navigate to login page
@@ -24,12 +28,9 @@ class LoginPage(BasePage):
     def is_login_to_account_visible(self):
         # Verify 'Login to your account' is visible
         try:
-            return self.is_visible(self.LOGIN_TO_ACCOUNT_TEXT)
-        except:
-            try:
-                return self.is_visible(self.ALT_LOGIN_TO_ACCOUNT_TEXT)
-            except:
-                return False
+            return self.is_visible_any(self.LOGIN_TO_ACCOUNT_LOCATORS)
+        except TimeoutException:
+            return False
     
     def login(self, email, password):
         # Enter email and password and click login
@@ -1,6 +1,8 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from pages.base_page import BasePage
+from utils.locator_cache import LocatorGroup
 
 class ProductDetailPage(BasePage):
     # Product detail page elements
@@ -15,23 +17,25 @@ class ProductDetailPage(BasePage):
     ALT_ADD_TO_CART = (By.XPATH, "//button[text()='Add to cart']")
     ALT_VIEW_CART = (By.XPATH, "//p//a[@href='/view_cart']")
     ALT_VIEW_CART_2 = (By.XPATH, "//u[text()='View Cart']")
+
+    NAME_LOCATORS = LocatorGroup("ProductDetailPage.product_name", PRODUCT_NAME, ALT_PRODUCT_NAME)
+    ADD_TO_CART_LOCATORS = LocatorGroup("ProductDetailPage.add_to_cart", ADD_TO_CART_BTN, ALT_ADD_TO_CART)
+    VIEW_CART_LOCATORS = LocatorGroup("ProductDetailPage.view_cart", VIEW_CART_LINK, ALT_VIEW_CART, ALT_VIEW_CART_2)
     
     def is_product_detail_opened(self):
-        # Verify product detail page is opened
-        try:
-            return self.is_present(self.PRODUCT_NAME) or self.is_present(self.ALT_PRODUCT_NAME)
-        except:
-            return False
+        # Verify product detail page is opened, without waiting out a loaded page that lacks the name
+        outcome, _ = self.wait_for_any({
+            'opened': self.NAME_LOCATORS,
+            'missing': self.document_loaded("/product_details"),
+        }, condition="present")
+        return outcome == 'opened'
     
     def get_product_name(self):
         # Get product name from detail page
         try:
-            return self.get_text(self.PRODUCT_NAME)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_NAME)
-            except:
-                return None
+            return self.get_text_any(self.NAME_LOCATORS)
+        except TimeoutException:
+            return None
     
     def increase_quantity_to(self, quantity):
         # Increase quantity to specified number
@@ -55,38 +59,21 @@ class ProductDetailPage(BasePage):
     def click_add_to_cart(self):
         # Click 'Add to cart' button
         try:
-            self.click(self.ADD_TO_CART_BTN)
-            print("Clicked Add to cart button")
-        except:
+            locator = self.click_any(self.ADD_TO_CART_LOCATORS)
+            print(f"Clicked Add to cart button ({locator[1]})")
+        except WebDriverException:
+            # Try JavaScript click as fallback
             try:
-                self.click(self.ALT_ADD_TO_CART)
-                print("Clicked Add to cart button (alternative locator)")
-            except:
-                # Try JavaScript click as fallback
-                try:
-                    button = self.driver.find_element(*self.ADD_TO_CART_BTN)
-                    self.driver.execute_script("arguments[0].click();", button)
-                    print("Clicked Add to cart button (JS click)")
-                except:
-                    try:
-                        button = self.driver.find_element(*self.ALT_ADD_TO_CART)
-                        self.driver.execute_script("arguments[0].click();", button)
-                        print("Clicked Add to cart button (JS click alternative)")
-                    except Exception as e:
-                        print(f"Could not click add to cart: {e}")
+                button, _ = self.find_any(self.ADD_TO_CART_LOCATORS, "present", timeout=1)
+                self.driver.execute_script("arguments[0].click();", button)
+                print("Clicked Add to cart button (JS click)")
+            except WebDriverException as e:
+                print(f"Could not click add to cart: {e}")
     
     def click_view_cart(self):
         # Click 'View Cart' button
         try:
-            self.click(self.VIEW_CART_LINK)
-            print("Clicked View Cart link")
-        except:
-            try:
-                self.click(self.ALT_VIEW_CART)
-                print("Clicked View Cart link (alternative)")
-            except:
-                try:
-                    self.click(self.ALT_VIEW_CART_2)
-                    print("Clicked View Cart link (alternative 2)")
-                except Exception as e:
-                    print(f"Could not click view cart: {e}")
+            locator = self.click_any(self.VIEW_CART_LOCATORS)
+            print(f"Clicked View Cart link ({locator[1]})")
+        except WebDriverException as e:
+            print(f"Could not click view cart: {e}")
@@ -65,32 +65,31 @@ class RegisterPage(BasePage):
         self.click(self.SIGNUP_BUTTON)
 
     def is_account_info_visible(self):
+        # Resolves as soon as either the form or the "email exists" error shows up
+        outcome, _ = self.wait_for_any({
+            'account_info': self.ENTER_ACCOUNT_INFO_TEXT,
+            'email_exists': self.EMAIL_ERROR,
+        })
+        if outcome == 'account_info':
+            return True
+        if outcome == 'email_exists':
+            print("Error: Email address already exists!")
+            return False
+        # Print current URL for debugging
+        print(f"Current URL: {self.driver.current_url}")
+        print("Page title:", self.driver.title)
+        
+        # Try to find any text on the page for debugging
         try:
-            return self.is_visible(self.ENTER_ACCOUNT_INFO_TEXT)
-        except TimeoutException:
-            # Check if there's an error message about email already existing
-            try:
-                if self.is_visible(self.EMAIL_ERROR):
-                    print("Error: Email address already exists!")
-                    return False
-            except TimeoutException:
-                pass
-            
-            # Print current URL for debugging
-            print(f"Current URL: {self.driver.current_url}")
-            print("Page title:", self.driver.title)
-            
-            # Try to find any text on the page for debugging
-            try:
-                page_source = self.driver.page_source
-                if "Enter Account Information" in page_source:
-                    print("Text 'Enter Account Information' found in page source but element not located")
-                else:
-                    print("Text 'Enter Account Information' NOT found in page source")
-            except:
-                pass
-            
-            raise
+            page_source = self.driver.page_source
+            if "Enter Account Information" in page_source:
+                print("Text 'Enter Account Information' found in page source but element not located")
+            else:
+                print("Text 'Enter Account Information' NOT found in page source")
+        except:
+            pass
+        
+        raise TimeoutException("Neither account information nor an error appeared after signup")
 
     def fill_account_details(self, title, password, day, month, year,
                              first_name, last_name, company, address1,
@@ -4,6 +4,15 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
+from utils.locator_cache import LocatorGroup
+
+
+def _info_paragraph_containing(*words):
+    # XPath for a product information paragraph whose lowercased text contains any of words
+    text = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    conditions = " or ".join(f"contains({text}, '{word}')" for word in words)
+    return f"//div[@class='product-information']//p[{conditions}]"
+
 
 class SearchPage(BasePage):
     # Home page elements
@@ -48,6 +57,21 @@ class SearchPage(BasePage):
     ALL_PRODUCT_INFO_PARAGRAPHS = (By.XPATH, "//div[@class='product-information']//p")
     ALL_PRODUCT_INFO_SPANS = (By.XPATH, "//div[@class='product-information']//span")
 
+    # Case-insensitive scans of the product information paragraphs (last resort)
+    SCAN_PRODUCT_AVAILABILITY = (By.XPATH, _info_paragraph_containing('availability', 'in stock', 'out of stock'))
+    SCAN_PRODUCT_CONDITION = (By.XPATH, _info_paragraph_containing('condition', 'new', 'used'))
+    SCAN_PRODUCT_BRAND = (By.XPATH, _info_paragraph_containing('brand', 'polo', 'h&m', 'madame', 'biba', 'allen solly'))
+
+    # Alternatives tried together on every poll, the last match is tried first next time
+    NAME_LOCATORS = LocatorGroup("SearchPage.product_name", PRODUCT_NAME, ALT_PRODUCT_NAME)
+    CATEGORY_LOCATORS = LocatorGroup("SearchPage.product_category", PRODUCT_CATEGORY, ALT_PRODUCT_CATEGORY)
+    PRICE_LOCATORS = LocatorGroup("SearchPage.product_price", PRODUCT_PRICE, ALT_PRODUCT_PRICE)
+    AVAILABILITY_LOCATORS = LocatorGroup("SearchPage.product_availability", PRODUCT_AVAILABILITY,
+                                         ALT_PRODUCT_AVAILABILITY, SCAN_PRODUCT_AVAILABILITY)
+    CONDITION_LOCATORS = LocatorGroup("SearchPage.product_condition", PRODUCT_CONDITION,
+                                      ALT_PRODUCT_CONDITION, SCAN_PRODUCT_CONDITION)
+    BRAND_LOCATORS = LocatorGroup("SearchPage.product_brand", PRODUCT_BRAND, ALT_PRODUCT_BRAND, SCAN_PRODUCT_BRAND)
+
     # Navigation and utility methods
     def is_home_page_visible(self):
         # Verify that home page is visible
@@ -79,118 +103,61 @@ class SearchPage(BasePage):
     
     def is_product_detail_page_loaded(self):
         # Check if user is landed on product detail page
-        # Check if any of the product detail elements are visible
-        try:
-            return (self.is_present(self.PRODUCT_NAME) or 
-                   self.is_present(self.ALT_PRODUCT_NAME))
-        except:
-            return False
+        # A finished product page without a product name is reported right away
+        outcome, _ = self.wait_for_any({
+            'loaded': self.NAME_LOCATORS,
+            'missing': self.document_loaded("/product_details"),
+        }, condition="present")
+        return outcome == 'loaded'
     
     # Product detail verification methods
+    def _get_detail_text(self, group):
+        # Text of the first locator in the group that is visible, None if none is
+        try:
+            return self.get_text_any(group)
+        except TimeoutException:
+            return None
+
     def get_product_name(self):
         # Get product name from detail page
-        try:
-            return self.get_text(self.PRODUCT_NAME)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_NAME)
-            except:
-                return None
+        return self._get_detail_text(self.NAME_LOCATORS)
     
     def get_product_category(self):
         # Get product category from detail page
-        try:
-            return self.get_text(self.PRODUCT_CATEGORY)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_CATEGORY)
-            except:
-                return None
+        return self._get_detail_text(self.CATEGORY_LOCATORS)
     
     def get_product_price(self):
         # Get product price from detail page
-        try:
-            return self.get_text(self.PRODUCT_PRICE)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_PRICE)
-            except:
-                return None
+        return self._get_detail_text(self.PRICE_LOCATORS)
     
     def get_product_availability(self):
         # Get product availability from detail page
-        try:
-            return self.get_text(self.PRODUCT_AVAILABILITY)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_AVAILABILITY)
-            except:
-                # Try to find availability info in any paragraph
-                try:
-                    paragraphs = self.driver.find_elements(*self.ALL_PRODUCT_INFO_PARAGRAPHS)
-                    for p in paragraphs:
-                        text = p.text.lower()
-                        if 'availability' in text or 'in stock' in text or 'out of stock' in text:
-                            return p.text
-                except:
-                    pass
-                return None
+        return self._get_detail_text(self.AVAILABILITY_LOCATORS)
     
     def get_product_condition(self):
         # Get product condition from detail page
-        try:
-            return self.get_text(self.PRODUCT_CONDITION)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_CONDITION)
-            except:
-                # Try to find condition info in any paragraph
-                try:
-                    paragraphs = self.driver.find_elements(*self.ALL_PRODUCT_INFO_PARAGRAPHS)
-                    for p in paragraphs:
-                        text = p.text.lower()
-                        if 'condition' in text or 'new' in text or 'used' in text:
-                            return p.text
-                except:
-                    pass
-                return None
+        return self._get_detail_text(self.CONDITION_LOCATORS)
     
     def get_product_brand(self):
         # Get product brand from detail page
-        try:
-            return self.get_text(self.PRODUCT_BRAND)
-        except:
-            try:
-                return self.get_text(self.ALT_PRODUCT_BRAND)
-            except:
-                # Try to find brand info in any paragraph
-                try:
-                    paragraphs = self.driver.find_elements(*self.ALL_PRODUCT_INFO_PARAGRAPHS)
-                    for p in paragraphs:
-                        text = p.text.lower()
-                        if 'brand' in text or any(brand in text for brand in ['polo', 'h&m', 'madame', 'biba', 'allen solly']):
-                            return p.text
-                except:
-                    pass
-                return None
+        return self._get_detail_text(self.BRAND_LOCATORS)
     
     def verify_all_product_details_visible(self):
         # Verify all product details are visible and return results
-        details = {}
-        
-        # Check each detail and store result
-        details['name'] = self.get_product_name()
-        details['category'] = self.get_product_category()
-        details['price'] = self.get_product_price()
-        details['availability'] = self.get_product_availability()
-        details['condition'] = self.get_product_condition()
-        details['brand'] = self.get_product_brand()
-        
-        # Check which details are present
-        present_details = {key: value for key, value in details.items() if value is not None}
-        missing_details = [key for key, value in details.items() if value is None]
-        
-        return present_details, missing_details
+        # All six fields are resolved in the browser with one round trip,
+        # once the product details have rendered (a timeout shows up in the missing list)
+        try:
+            self.find_any(self.NAME_LOCATORS, "present")
+        except TimeoutException:
+            pass
+        return self.extract_texts({
+            'name': self.NAME_LOCATORS,
+            'category': self.CATEGORY_LOCATORS,
+            'price': self.PRICE_LOCATORS,
+            'availability': self.AVAILABILITY_LOCATORS,
+            'condition': self.CONDITION_LOCATORS,
+            'brand': self.BRAND_LOCATORS,
+        })
     
     # Search functionality methods
     def search_product(self, product_name):
@@ -0,0 +1,37 @@
+# tests/api/test_api_benchmark.py
+
+import unittest
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from utils.api_benchmark import APIBenchmark, benchmark_settings, find_regressions, load_baseline, write_json
+from utils.config import get_bool_setting
+
+@unittest.skipUnless(get_bool_setting("API_BENCHMARK"), "Benchmark mode is off (use --benchmark or API_BENCHMARK=1)")
+class APIBenchmarkTest(unittest.TestCase):
+    
+    def test_endpoint_latency_against_baseline(self):
+        """Benchmark every APIClient endpoint and compare with the stored baseline"""
+        settings = benchmark_settings()
+        benchmark = APIBenchmark(settings['iterations'], settings['warmup'], settings['concurrency'])
+        
+        results = benchmark.run()
+        write_json(results, settings['results_file'])
+        
+        # Every call should have returned the expected responseCode
+        for name, stats in results['endpoints'].items():
+            self.assertEqual(stats['errors'], 0, f"{name} returned {stats['errors']} unexpected responses")
+        
+        baseline = load_baseline(settings['baseline_file'])
+        if baseline is None:
+            print(f"No baseline at {settings['baseline_file']}, run 'python -m utils.api_benchmark --update-baseline'")
+            return
+        
+        regressions = find_regressions(results, baseline, settings['threshold'])
+        self.assertEqual(regressions, [], "Latency regressed against baseline:\n" + "\n".join(regressions))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# tests/api/test_api_cassette.py
+
+import shutil
+import tempfile
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import requests
+from requests.adapters import BaseAdapter
+from utils.api_cassette import Cassette, CassetteAdapter, CassetteMissError, _cassette_paths
+
+BASE_URL = "http://api.test/api"
+
+
+class OfflineAdapter(BaseAdapter):
+    """Inner transport that fails the test when a request reaches the network"""
+
+    def send(self, request, **kwargs):
+        raise AssertionError(f"Unexpected network call: {request.method} {request.url}")
+
+    def close(self):
+        pass
+
+
+def _recorded(body):
+    return {'status': 200, 'reason': "OK", 'headers': {'Content-Type': "application/json"},
+            'body': body, 'elapsed': 0.01}
+
+
+class CassetteTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def _session(self, cassette, strict):
+        session = requests.Session()
+        session.mount(f"{BASE_URL}/", CassetteAdapter(cassette, BASE_URL, "replay", inner=OfflineAdapter(),
+                                                      strict=strict))
+        return session
+
+    def _save(self, filename, key, body):
+        cassette = Cassette(os.path.join(self.directory, filename))
+        cassette.add(key, _recorded(body))
+        cassette.save()
+
+    def test_strict_replay_miss_raises(self):
+        """Test a strict replay fails a request that was never recorded"""
+        cassette = Cassette(os.path.join(self.directory, "api.json.gz"))
+        cassette.add("GET productsList", _recorded('{"responseCode": 200}'))
+
+        session = self._session(cassette, strict=True)
+        self.assertEqual(session.get(f"{BASE_URL}/productsList").json()['responseCode'], 200)
+        with self.assertRaises(CassetteMissError):
+            session.get(f"{BASE_URL}/brandsList")
+
+    def test_replay_merges_shard_files(self):
+        """Test replay reads the main cassette and every shard's recordings"""
+        self._save("api.json.gz", "GET productsList", '{"source": "main"}')
+        self._save("api-shard0.json.gz", "GET brandsList", '{"source": "shard0"}')
+        self._save("api-shard1.json.gz", "GET productsList", '{"source": "shard1"}')
+
+        settings = {'API_CASSETTE_DIR': self.directory, 'API_CASSETTE_NAME': "api",
+                    'SHARD_COUNT': "2", 'SHARD_INDEX': "1"}
+        with mock.patch.dict(os.environ, settings):
+            path, load_paths = _cassette_paths("replay")
+            record_path, record_load_paths = _cassette_paths("record")
+
+        self.assertEqual(path, os.path.join(self.directory, "api-shard1.json.gz"))
+        self.assertEqual(len(load_paths), 3)
+        self.assertEqual((record_path, record_load_paths), (path, []))
+
+        cassette = Cassette(path, load_paths)
+        session = self._session(cassette, strict=True)
+        self.assertEqual(session.get(f"{BASE_URL}/brandsList").json()['source'], "shard0")
+        # A request recorded by several files replays each recording once
+        sources = {session.get(f"{BASE_URL}/productsList").json()['source'] for _ in range(2)}
+        self.assertEqual(sources, {"main", "shard1"})
+        # Only this shard's own recordings are written back to its file
+        self.assertEqual(list(cassette.saved), ["GET productsList"])
+        self.assertEqual(len(cassette.saved["GET productsList"]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
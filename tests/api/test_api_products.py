@@ -8,6 +8,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from utils.api_client import APIClient
+from utils.async_api_client import AsyncAPIClient
 
 class ProductsAPITest(unittest.TestCase):
     
@@ -143,6 +144,44 @@ class ProductsAPITest(unittest.TestCase):
                         "Case insensitive search should return same number of results")
         
         print(f"Case insensitive test: '{products_lower[0]['name']}' found with both 'top' and 'TOP'")
+    
+    def test_search_matrix_concurrent(self):
+        """Test search terms in upper, lower and mixed case concurrently"""
+        terms = ["top", "dress", "tshirt", "jeans", "saree"]
+        variants = [term_case for term in terms for term_case in (term, term.upper(), term.title())]
+        
+        responses = AsyncAPIClient(concurrency=10).run_batch([("search_product", v) for v in variants])
+        
+        # Every variant of a term should return the same products
+        results = {}
+        for variant, response in zip(variants, responses):
+            self.assertEqual(response['status_code'], 200)
+            self.assertEqual(response['data']['responseCode'], 200)
+            names = sorted(p['name'] for p in response['data']['products'])
+            results.setdefault(variant.lower(), []).append(names)
+        
+        for term, name_lists in results.items():
+            for names in name_lists[1:]:
+                self.assertEqual(names, name_lists[0], f"Search for '{term}' should not depend on case")
+        
+        print(f"Search matrix: {len(variants)} searches checked concurrently")
+
+    def test_typed_catalog_records(self):
+        """Test Product and Brand records match the raw catalog data"""
+        products_response = self.api_client.get_products_list()
+        brands_response = self.api_client.get_brands_list()
+
+        products = products_response.products()
+        raw_products = products_response['data']['products']
+        self.assertEqual(len(products), len(raw_products))
+        self.assertEqual(products[0].name, raw_products[0]['name'])
+        self.assertEqual(products[0].category, raw_products[0]['category']['category'])
+
+        brands = brands_response.brands()
+        self.assertEqual([brand.brand for brand in brands],
+                         [brand['brand'] for brand in brands_response['data']['brands']])
+
+        print(f"Typed records: {len(products)} products, {len(brands)} brands")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+# tests/api/test_api_resilience.py
+
+import io
+import unittest
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import requests
+from requests.adapters import BaseAdapter
+from utils.resilience import CircuitOpenError, Resilience, ResilientAdapter
+
+PRODUCTS_URL = "http://api.test/api/productsList"
+
+
+class ScriptedAdapter(BaseAdapter):
+    """Inner transport answering with the next status code or raising the next exception"""
+
+    def __init__(self, outcomes):
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        response = requests.Response()
+        response.status_code = outcome
+        response.raw = io.BytesIO(b'{"responseCode": 200}')
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+class ResilienceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.resilience = Resilience(retries=3)
+        # No waiting between attempts
+        self.resilience.backoff = 0.0
+
+    def _session(self, inner):
+        session = requests.Session()
+        session.mount("http://", ResilientAdapter(inner, self.resilience))
+        return session
+
+    def test_get_recovers_after_transient_failures(self):
+        """Test a 503 and a dropped connection are retried until the 200"""
+        inner = ScriptedAdapter([503, requests.exceptions.ConnectionError("connection reset"), 200])
+
+        response = self._session(inner).get(PRODUCTS_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(inner.calls, 3)
+        counters = self.resilience.stats()['endpoints']["GET /api/productsList"]
+        self.assertEqual(counters['retries'], 2)
+        self.assertEqual(counters['recovered'], 1)
+
+    def test_post_is_not_retried(self):
+        """Test a non-idempotent request gets the transient failure back unchanged"""
+        inner = ScriptedAdapter([503, 200])
+
+        response = self._session(inner).post("http://api.test/api/createAccount", data={'name': "x"})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(self.resilience.stats()['endpoints']["POST /api/createAccount"]['retries'], 0)
+
+    def test_breaker_opens_then_short_circuits(self):
+        """Test repeated failures open the breaker and later calls are not sent"""
+        self.resilience.retries = 0
+        self.resilience.breaker_threshold = 2
+        inner = ScriptedAdapter([503, 503, 200])
+        session = self._session(inner)
+
+        self.assertEqual(session.get(PRODUCTS_URL).status_code, 503)
+        self.assertEqual(session.get(PRODUCTS_URL).status_code, 503)
+        with self.assertRaises(CircuitOpenError):
+            session.get(PRODUCTS_URL)
+
+        self.assertEqual(inner.calls, 2)
+        stats = self.resilience.stats()
+        self.assertEqual(stats['open_breakers'], ["GET /api/productsList"])
+        self.assertEqual(stats['endpoints']["GET /api/productsList"]['breaker_opened'], 1)
+        self.assertEqual(stats['endpoints']["GET /api/productsList"]['short_circuited'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests/api/test_api_response_cache.py
+
+import unittest
+import sys
+import os
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import requests
+from utils.response_cache import ResponseCache
+
+PRODUCTS_URL = "http://api.test/api/productsList"
+BRANDS_URL = "http://api.test/api/brandsList"
+
+
+class ScriptedSession:
+    """Stands in for requests.Session, answers GETs with the next status code"""
+
+    def __init__(self, statuses, headers=None):
+        self.statuses = list(statuses)
+        self.response_headers = headers or {}
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append((url, dict(headers or {})))
+        response = requests.Response()
+        response.status_code = self.statuses.pop(0)
+        response.headers.update(self.response_headers)
+        response._content = b'{"responseCode": 200}'
+        response.url = url
+        return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def test_fresh_entry_is_served_from_cache(self):
+        """Test a second GET within the TTL does not reach the server"""
+        cache = ResponseCache(max_entries=4, ttl=60)
+        session = ScriptedSession([200])
+
+        first = cache.fetch(session, PRODUCTS_URL)
+        second = cache.fetch(session, PRODUCTS_URL)
+
+        self.assertIs(second, first)
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['misses'], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the LRU drops the entry that was not used for the longest time"""
+        cache = ResponseCache(max_entries=2, ttl=60)
+        session = ScriptedSession([200, 200, 200, 200])
+
+        cache.fetch(session, PRODUCTS_URL)
+        cache.fetch(session, BRANDS_URL)
+        cache.fetch(session, PRODUCTS_URL)  # brandsList is now the oldest
+        cache.fetch(session, PRODUCTS_URL, params={'page': 2})
+
+        self.assertEqual(cache.stats['evictions'], 1)
+        cache.fetch(session, PRODUCTS_URL)
+        self.assertEqual(len(session.requests), 3)
+        cache.fetch(session, BRANDS_URL)
+        self.assertEqual(len(session.requests), 4)
+
+    def test_expired_entry_is_fetched_again(self):
+        """Test an entry older than the TTL goes back to the server"""
+        cache = ResponseCache(max_entries=4, ttl=0)
+        session = ScriptedSession([200, 200])
+
+        first = cache.fetch(session, PRODUCTS_URL)
+        second = cache.fetch(session, PRODUCTS_URL)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(len(session.requests), 2)
+        self.assertEqual(cache.stats['misses'], 2)
+        self.assertEqual(cache.stats['hits'], 0)
+
+    def test_not_modified_revalidates_entry(self):
+        """Test a 304 to the conditional request keeps serving the stored response"""
+        cache = ResponseCache(max_entries=4, ttl=0)
+        session = ScriptedSession([200, 304], headers={'ETag': '"v1"'})
+
+        first = cache.fetch(session, PRODUCTS_URL)
+        second = cache.fetch(session, PRODUCTS_URL)
+
+        self.assertIs(second, first)
+        self.assertEqual(session.requests[1][1].get('If-None-Match'), '"v1"')
+        self.assertEqual(cache.stats['revalidated'], 1)
+
+if __name__ == "__main__":
+    unittest.main()
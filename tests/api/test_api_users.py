@@ -9,6 +9,7 @@ import string
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from utils.api_client import APIClient
+from utils.user_pool import get_user_pool
 
 class UsersAPITest(unittest.TestCase):
     
@@ -136,38 +137,19 @@ class UsersAPITest(unittest.TestCase):
     
     def test_delete_account_valid_credentials(self):
         """Test API: DELETE To Delete User Account"""
-        # First create a test account
-        user_data = {
-            'name': 'Delete Test User',
-            'email': self.test_email,
-            'password': self.test_password,
-            'title': 'Mr',
-            'birth_date': '1',
-            'birth_month': '1',
-            'birth_year': '1990',
-            'firstname': 'Delete',
-            'lastname': 'Test',
-            'company': 'Test Company',
-            'address1': '123 Test Street',
-            'country': 'United States',
-            'zipcode': '12345',
-            'state': 'California',
-            'city': 'Los Angeles',
-            'mobile_number': '1234567890'
-        }
+        # Take an existing account from the user pool instead of creating one
+        pool = get_user_pool()
+        with pool.lease() as user:
+            delete_response = self.api_client.delete_account(user['email'], user['password'])
+            # The account is gone, the pool replaces it
+            pool.retire(user)
+        
+        self.assertEqual(delete_response['status_code'], 200)
+        response_data = delete_response['data']
+        self.assertIn('responseCode', response_data)
+        self.assertEqual(response_data['responseCode'], 200)
         
-        # Create account first
-        create_response = self.api_client.create_account(user_data)
-        if create_response['data']['responseCode'] == 201:
-            # Now delete the account
-            delete_response = self.api_client.delete_account(self.test_email, self.test_password)
-            
-            self.assertEqual(delete_response['status_code'], 200)
-            response_data = delete_response['data']
-            self.assertIn('responseCode', response_data)
-            self.assertEqual(response_data['responseCode'], 200)
-            
-            print(f"Account deleted successfully: {response_data['message']}")
+        print(f"Account deleted successfully: {response_data['message']}")
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
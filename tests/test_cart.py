@@ -1,21 +1,13 @@
 # tests/test_cart.py
 
 import unittest
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from pages.home_page import HomePage
 from pages.product_detail_page import ProductDetailPage
 from pages.cart_page import CartPage
+from utils.base_test import BaseUITest
 
-class CartTest(unittest.TestCase):
-    def setUp(self):
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service)
-        self.driver.get("https://automationexercise.com")
-        self.driver.maximize_window()
+class CartTest(BaseUITest):
 
     def test_add_to_cart(self):
         # add product to cart
@@ -46,8 +38,8 @@ class CartTest(unittest.TestCase):
         home.click_view_product_on_home_page()
         print("✅ Clicked 'View Product' on home page")
         
-        # Small wait for page load
-        time.sleep(2)
+        # Wait for product page to be ready
+        product_detail.wait_for_page_ready()
         
         # Verify product detail is opened
         self.assertTrue(product_detail.is_product_detail_opened(), 
@@ -62,22 +54,19 @@ class CartTest(unittest.TestCase):
         product_detail.increase_quantity_to(4)
         print("✅ Increased quantity to 4")
         
-        # Small wait to ensure quantity is set
-        time.sleep(1)
-        
         # Click 'Add to cart' button
         product_detail.click_add_to_cart()
         print("✅ Clicked 'Add to cart' button")
         
-        # Small wait for add to cart action
-        time.sleep(2)
+        # Wait for add to cart request to finish
+        product_detail.wait_for_page_ready()
         
         # Click 'View Cart' button
         product_detail.click_view_cart()
         print("✅ Clicked 'View Cart' button")
         
-        # Small wait for cart page to load
-        time.sleep(2)
+        # Wait for cart page to load
+        cart.wait_for_page_ready()
         
         # Verify that product is displayed in cart page with exact quantity
         self.assertTrue(cart.is_product_displayed_in_cart(), 
@@ -100,10 +89,6 @@ class CartTest(unittest.TestCase):
         print("🎉 SUCCESS: Product quantity verification completed!")
         print(f"   - Product: {cart_product_name}")
         print(f"   - Quantity: {cart_quantity}")
-    
-    def tearDown(self):
-        time.sleep(2)  # Brief pause to see results
-        self.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,22 +1,17 @@
 # tests/test_checkout.py
 
 import unittest
-from selenium import webdriver
 from selenium.webdriver.common.by import By  
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from pages.login_page import LoginPage
 from pages.home_page import HomePage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
+from utils.base_test import BaseUITest
+from utils.user_pool import get_user_pool
 
-class CheckoutTest(unittest.TestCase):
-    
-    def setUp(self):
-        # Launch browser
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service)
-        self.driver.maximize_window()
+class CheckoutTest(BaseUITest):
+    # The test opens the home page itself
+    start_path = None
     
     def test_place_order_login_before_checkout(self):
         # Place Order: Login before Checkout
@@ -25,18 +20,14 @@ class CheckoutTest(unittest.TestCase):
         cart_page = CartPage(self.driver)
         checkout_page = CheckoutPage(self.driver)
         
-        # Navigate to url 'http://automationexercise.com'
-        self.driver.get("http://automationexercise.com")
+        # Log in a pooled account over HTTP and open 'http://automationexercise.com' with the
+        # session cookies (the login form itself is covered by LoginTest)
+        user = get_user_pool().acquire()
+        self.addCleanup(get_user_pool().release, user)
+        self.assertTrue(self.login_via_api(user['email'], user['password']), "API login failed")
         
         # Verify that home page is visible successfully
-        self.assertTrue(login_page.is_visible(login_page.LOGIN_LINK), 
-                       "Home page is not visible - Login link not found")
-        
-        # Click 'Signup / Login' button
-        login_page.go_to_login_page()
-        
-        # Fill email, password and click 'Login' button
-        login_page.login("huilek@example.com", "correctpassword")  # Replace with valid creds
+        self.assertTrue(home_page.is_home_page_visible(), "Home page is not visible")
         
         # Verify 'Logged in as username' at top
         logged_in_text = login_page.get_logged_in_text()
@@ -79,8 +70,7 @@ class CheckoutTest(unittest.TestCase):
         
         # Verify success message 'Your order has been placed successfully!'
         # Check if order was placed successfully using URL and title
-        import time
-        time.sleep(2)  # Wait for page to load
+        checkout_page.wait_for_url_contains("payment_done")  # Wait for page to load
         
         # Method 1: Check URL and title for success
         self.assertTrue(checkout_page.is_order_placed_successfully(), 
@@ -99,9 +89,6 @@ class CheckoutTest(unittest.TestCase):
             print("Clicked Continue button successfully")
         except:
             print("Continue button not found or not clickable")
-    
-    def tearDown(self):
-        self.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
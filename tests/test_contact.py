@@ -2,21 +2,11 @@
 
 import unittest
 import os
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from pages.contact_page import ContactPage
+from utils.base_test import BaseUITest
 
 
-class TestContactUs(unittest.TestCase):
-
-    def setUp(self):
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service)
-        self.driver.maximize_window()
-        # Launch browser and navigate to URL
-        self.driver.get("http://automationexercise.com")
+class TestContactUs(BaseUITest):
 
     def test_contact_us_form(self):
         contact = ContactPage(self.driver)
@@ -50,8 +40,8 @@ class TestContactUs(unittest.TestCase):
         alert_handled = contact.handle_alert()
         self.assertTrue(alert_handled, "Alert was not found or handled")
 
-        # Small wait for page to process
-        time.sleep(2)
+        # Wait for form submission to finish
+        contact.wait_for_page_ready()
 
         # Verify success message is visible
         self.assertTrue(contact.is_success_message_visible(), 
@@ -80,9 +70,6 @@ class TestContactUs(unittest.TestCase):
         except Exception as e:
             print(f"Could not delete test file: {e}")
 
-    def tearDown(self):
-        self.driver.quit()
-
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -2,19 +2,11 @@
 
 import unittest
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from pages.register_page import RegisterPage
+from utils.base_test import BaseUITest
 
 
-class TestRegisterUser(unittest.TestCase):
-
-    def setUp(self):
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service)
-        self.driver.maximize_window()
-        self.driver.get("https://automationexercise.com/")
+class TestRegisterUser(BaseUITest):
 
     def test_register_user(self):
         register = RegisterPage(self.driver)
@@ -34,8 +26,8 @@ class TestRegisterUser(unittest.TestCase):
         register.enter_name_email("Test User", unique_email)
         register.click_signup_button()
 
-        # Add a small wait to let the page load
-        time.sleep(2)
+        # Wait for the account information page to load
+        register.wait_for_page_ready()
 
         # Verify 'ENTER ACCOUNT INFORMATION' is visible
         self.assertTrue(register.is_account_info_visible())
@@ -73,9 +65,6 @@ class TestRegisterUser(unittest.TestCase):
         # Click 'Continue' after delete
         register.click_continue_after_delete()
 
-    def tearDown(self):
-        self.driver.quit()
-
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,20 +1,9 @@
 # tests/test_search.py
 import unittest
-import time
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from pages.search_page import SearchPage
+from utils.base_test import BaseUITest
 
-class SearchTest(unittest.TestCase):
-    
-    def setUp(self):
-        # Launch browser
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service)
-        self.driver.maximize_window()
-        # Navigate to url 'http://automationexercise.com'
-        self.driver.get("http://automationexercise.com")
+class SearchTest(BaseUITest):
     
     def test_verify_all_products_and_product_detail_page(self):
         # Verify All Products and product detail page
@@ -43,8 +32,8 @@ class SearchTest(unittest.TestCase):
         # Click on 'View Product' of first product
         search_page.click_first_product_view()
         
-        # Small wait for page to load
-        time.sleep(2)
+        # Wait for page to load
+        search_page.wait_for_page_ready()
         
         # User is landed to product detail page
         self.assertTrue(search_page.is_product_detail_page_loaded(), 
@@ -109,9 +98,6 @@ class SearchTest(unittest.TestCase):
                           "No products related to search are visible")
         
         print(f"\nFound {product_count} products related to search term 'top'")
-    
-    def tearDown(self):
-        self.driver.quit()
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,193 @@
+# utils/action_profiler.py
+"""Opt-in timing of BasePage actions (ACTION_PROFILE=1 or --profile-actions).
+
+Every decorated BasePage action records its duration, the time spent waiting
+in WebDriverWait (split into WebDriver commands and sleeping between polls)
+and the number of WebDriver commands it issued. Results are written per test
+to reports/action_profile.json and as folded stacks to
+reports/action_profile.folded, which flamegraph.pl or speedscope render as a
+flame graph:
+
+    test;SearchPage.get_text(SearchPage.product_name);poll 120000
+"""
+import functools
+import json
+import os
+import threading
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from utils.config import get_bool_setting
+from utils.locator_cache import LocatorGroup
+
+MAX_LABEL_LENGTH = 60
+
+
+def is_enabled():
+    return get_bool_setting("ACTION_PROFILE", False)
+
+
+def _locator_label(args):
+    # Readable name of the locator an action was called with, if any
+    if not args:
+        return ""
+    first = args[0]
+    if isinstance(first, LocatorGroup):
+        return first.name
+    if isinstance(first, tuple) and len(first) == 2:
+        label = f"{first[0]}={first[1]}"
+        return label if len(label) <= MAX_LABEL_LENGTH else label[:MAX_LABEL_LENGTH - 3] + "..."
+    return ""
+
+
+class _Frame:
+    __slots__ = ("name", "start", "child_seconds", "wait_seconds", "wait_command_seconds",
+                 "command_seconds", "commands")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.child_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.wait_command_seconds = 0.0
+        self.command_seconds = 0.0
+        self.commands = 0
+
+
+class ActionProfiler:
+    def __init__(self):
+        self.current_test = None
+        self.actions = {}
+        self.folded = {}
+        self._stack = []
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def active(self):
+        return self.current_test is not None
+
+    def start_test(self, test_id):
+        self.current_test = test_id
+        self._stack = []
+
+    def finish_test(self):
+        self.current_test = None
+        self._stack = []
+
+    def instrument(self, driver):
+        # Count and time every WebDriver command sent through this driver
+        if getattr(driver, '_qa_profiled', False):
+            return
+        execute = driver.execute
+
+        @functools.wraps(execute)
+        def profiled_execute(driver_command, params=None):
+            if not self._stack:
+                return execute(driver_command, params)
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                frame = self._stack[-1]
+                frame.commands += 1
+                frame.command_seconds += elapsed
+                if self._waiting:
+                    frame.wait_command_seconds += elapsed
+
+        driver.execute = profiled_execute
+        driver._qa_profiled = True
+
+    def enter(self, name):
+        frame = _Frame(name)
+        self._stack.append(frame)
+        return frame
+
+    def exit(self, frame):
+        total = time.perf_counter() - frame.start
+        self._stack.pop()
+        if self._stack:
+            self._stack[-1].child_seconds += total
+
+        test = self.current_test.replace(" ", "_").replace(";", ",")
+        path = ";".join([test] + [parent.name for parent in self._stack] + [frame.name])
+        poll = max(0.0, frame.wait_seconds - frame.wait_command_seconds)
+        own = max(0.0, total - frame.child_seconds - frame.command_seconds - poll)
+        with self._lock:
+            self.actions.setdefault(self.current_test, []).append({
+                'action': frame.name,
+                'depth': len(self._stack),
+                'seconds': round(total, 6),
+                'wait_seconds': round(frame.wait_seconds, 6),
+                'poll_seconds': round(poll, 6),
+                'commands': frame.commands,
+                'command_seconds': round(frame.command_seconds, 6),
+            })
+            for suffix, seconds in (("", own), (";webdriver", frame.command_seconds), (";poll", poll)):
+                microseconds = int(seconds * 1_000_000)
+                if microseconds > 0:
+                    key = path + suffix
+                    self.folded[key] = self.folded.get(key, 0) + microseconds
+
+    def begin_wait(self):
+        self._waiting += 1
+        return time.perf_counter()
+
+    def end_wait(self, start):
+        self._waiting -= 1
+        if self._stack:
+            self._stack[-1].wait_seconds += time.perf_counter() - start
+
+    def top_actions(self, limit=10):
+        # Actions (page object method + locator) ranked by total time over the run
+        totals = {}
+        for actions in self.actions.values():
+            for action in actions:
+                if action['depth'] == 0:
+                    entry = totals.setdefault(action['action'], [0.0, 0, 0])
+                    entry[0] += action['seconds']
+                    entry[1] += 1
+                    entry[2] += action['commands']
+        return sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+
+    def write(self, json_path="reports/action_profile.json", folded_path="reports/action_profile.folded"):
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.actions, f, indent=2)
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, microseconds in sorted(self.folded.items()):
+                f.write(f"{stack} {microseconds}\n")
+        return json_path, folded_path
+
+
+# Shared by BasePage and conftest.py
+action_profiler = ActionProfiler()
+
+
+def profiled_action(method):
+    """Decorator for BasePage actions, a no-op unless a profiled test is running"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not action_profiler.active:
+            return method(self, *args, **kwargs)
+        label = _locator_label(args).replace(";", ",").replace(" ", "_")
+        name = f"{type(self).__name__}.{method.__name__}({label})"
+        frame = action_profiler.enter(name)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            action_profiler.exit(frame)
+    return wrapper
+
+
+class InstrumentedWait(WebDriverWait):
+    """WebDriverWait that reports its time to the action profiler"""
+
+    def until(self, method, message=""):
+        if not action_profiler.active:
+            return super().until(method, message)
+        start = action_profiler.begin_wait()
+        try:
+            return super().until(method, message)
+        finally:
+            action_profiler.end_wait(start)
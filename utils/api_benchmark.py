@@ -0,0 +1,268 @@
+# utils/api_benchmark.py
+"""Latency benchmark for the APIClient endpoints.
+
+Runs every endpoint N times (after warm-up calls) at a given concurrency and
+reports p50/p90/p99/max latency and throughput. Results are written to JSON
+and their p50/p90 compared against a stored baseline:
+
+    python -m utils.api_benchmark --iterations 200 --concurrency 8
+    python -m utils.api_benchmark --update-baseline
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from utils.api_client import APIClient
+from utils.config import get_base_url, get_int_setting, get_setting
+from utils.user_pool import new_user_data
+
+DEFAULT_RESULTS_FILE = "reports/benchmarks/api_benchmark.json"
+DEFAULT_BASELINE_FILE = "benchmarks/api_baseline.json"
+DEFAULT_THRESHOLD = 0.2
+
+# Latency metrics compared against the baseline. p99 is only reported: with
+# the default 50 iterations it is the slowest single call, too noisy to gate on
+COMPARED_METRICS = ("p50_ms", "p90_ms")
+
+# Existing account used for the login benchmark
+LOGIN_EMAIL = "huilek@example.com"
+LOGIN_PASSWORD = "correctpassword"
+
+
+class EndpointScenarios:
+    """One callable per endpoint, account endpoints share created users"""
+
+    def __init__(self):
+        self._created = []
+        self._lock = threading.Lock()
+
+    def products_list(self, client):
+        # Latency is measured against the server, never the response cache
+        return client.get_products_list(cache=False)
+
+    def brands_list(self, client):
+        return client.get_brands_list(cache=False)
+
+    def search_product(self, client):
+        return client.search_product("top")
+
+    def verify_login(self, client):
+        return client.verify_login(LOGIN_EMAIL, LOGIN_PASSWORD)
+
+    def create_account(self, client):
+        user = new_user_data("bench")
+        response = client.create_account(user)
+        with self._lock:
+            self._created.append(user)
+        return response
+
+    def delete_account(self, client):
+        # Deletes accounts made by create_account, so run that one first
+        with self._lock:
+            user = self._created.pop() if self._created else None
+        if user is None:
+            user = new_user_data("bench")
+            client.create_account(user)
+        return client.delete_account(user['email'], user['password'])
+
+    def cleanup(self, client):
+        # Remove accounts left over when deleteAccount was not benchmarked
+        while self._created:
+            user = self._created.pop()
+            client.delete_account(user['email'], user['password'])
+
+
+# Benchmark name -> (scenario method, expected responseCode)
+ENDPOINTS = {
+    'productsList': ("products_list", 200),
+    'brandsList': ("brands_list", 200),
+    'searchProduct': ("search_product", 200),
+    'verifyLogin': ("verify_login", 200),
+    'createAccount': ("create_account", 201),
+    'deleteAccount': ("delete_account", 200),
+}
+
+
+def percentile(sorted_values, percent):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies, errors, wall_seconds):
+    values = sorted(latencies)
+    count = len(values)
+    return {
+        'iterations': count,
+        'errors': errors,
+        'min_ms': round(values[0] * 1000, 3) if values else 0.0,
+        'mean_ms': round(sum(values) / count * 1000, 3) if values else 0.0,
+        'p50_ms': round(percentile(values, 50) * 1000, 3),
+        'p90_ms': round(percentile(values, 90) * 1000, 3),
+        'p99_ms': round(percentile(values, 99) * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3) if values else 0.0,
+        'throughput_rps': round(count / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+    }
+
+
+class APIBenchmark:
+    def __init__(self, iterations=50, warmup=5, concurrency=1, base_url=None):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.concurrency = max(1, concurrency)
+        self.base_url = base_url
+        self.scenarios = EndpointScenarios()
+        self._thread_local = threading.local()
+        self._clients = []
+        self._clients_lock = threading.Lock()
+
+    def _client(self):
+        # One APIClient (requests.Session) per worker thread
+        client = getattr(self._thread_local, 'client', None)
+        if client is None:
+            client = APIClient(self.base_url)
+            self._thread_local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def _timed_call(self, scenario, expected_code):
+        client = self._client()
+        start = time.perf_counter()
+        response = scenario(client)
+        elapsed = time.perf_counter() - start
+        data = response['data']
+        ok = (response['status_code'] == 200 and isinstance(data, dict)
+              and data.get('responseCode') == expected_code)
+        return elapsed, ok
+
+    def run_endpoint(self, name):
+        method_name, expected_code = ENDPOINTS[name]
+        scenario = getattr(self.scenarios, method_name)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            # Warm-up calls open connections and are not measured
+            list(executor.map(lambda _: self._timed_call(scenario, expected_code), range(self.warmup)))
+
+            start = time.perf_counter()
+            results = list(executor.map(lambda _: self._timed_call(scenario, expected_code), range(self.iterations)))
+            wall_seconds = time.perf_counter() - start
+
+        latencies = [elapsed for elapsed, _ in results]
+        errors = sum(1 for _, ok in results if not ok)
+        return summarize(latencies, errors, wall_seconds)
+
+    def run(self, endpoints=None):
+        endpoints = endpoints or list(ENDPOINTS)
+        results = {}
+        try:
+            for name in endpoints:
+                results[name] = self.run_endpoint(name)
+                stats = results[name]
+                print(f"{name:<15} p50 {stats['p50_ms']:>8.1f}ms  p90 {stats['p90_ms']:>8.1f}ms  "
+                      f"p99 {stats['p99_ms']:>8.1f}ms  max {stats['max_ms']:>8.1f}ms  "
+                      f"{stats['throughput_rps']:>7.1f} req/s  errors {stats['errors']}")
+        finally:
+            self.scenarios.cleanup(self._client())
+            for client in self._clients:
+                client.session.close()
+
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'base_url': self.base_url or get_base_url(),
+            'iterations': self.iterations,
+            'warmup': self.warmup,
+            'concurrency': self.concurrency,
+            'endpoints': results,
+        }
+
+
+def write_json(data, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def load_baseline(path=DEFAULT_BASELINE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """List latency metrics that got slower than baseline * (1 + threshold)"""
+    regressions = []
+    if not baseline:
+        return regressions
+    for name, stats in results['endpoints'].items():
+        base_stats = baseline.get('endpoints', {}).get(name)
+        if not base_stats:
+            continue
+        for metric in COMPARED_METRICS:
+            limit = base_stats[metric] * (1 + threshold)
+            if base_stats[metric] > 0 and stats[metric] > limit:
+                regressions.append(
+                    f"{name} {metric}: {stats[metric]:.1f}ms > {limit:.1f}ms "
+                    f"(baseline {base_stats[metric]:.1f}ms +{threshold:.0%})"
+                )
+    return regressions
+
+
+def benchmark_settings():
+    # Settings shared by the CLI defaults and tests/api/test_api_benchmark.py
+    return {
+        'iterations': get_int_setting("BENCHMARK_ITERATIONS", 50),
+        'warmup': get_int_setting("BENCHMARK_WARMUP", 5),
+        'concurrency': get_int_setting("BENCHMARK_CONCURRENCY", 1),
+        'threshold': float(get_setting("BENCHMARK_THRESHOLD", DEFAULT_THRESHOLD)),
+        'results_file': get_setting("BENCHMARK_RESULTS_FILE", DEFAULT_RESULTS_FILE),
+        'baseline_file': get_setting("BENCHMARK_BASELINE_FILE", DEFAULT_BASELINE_FILE),
+    }
+
+
+def main(argv=None):
+    settings = benchmark_settings()
+    parser = argparse.ArgumentParser(description="Benchmark APIClient endpoint latency")
+    parser.add_argument("--iterations", type=int, default=settings['iterations'])
+    parser.add_argument("--warmup", type=int, default=settings['warmup'])
+    parser.add_argument("--concurrency", type=int, default=settings['concurrency'])
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS),
+                        help="Comma separated endpoints to run")
+    parser.add_argument("--threshold", type=float, default=settings['threshold'],
+                        help="Allowed slowdown against the baseline, 0.2 = 20%%")
+    parser.add_argument("--results", default=settings['results_file'])
+    parser.add_argument("--baseline", default=settings['baseline_file'])
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"Unknown endpoints: {', '.join(unknown)}")
+
+    benchmark = APIBenchmark(args.iterations, args.warmup, args.concurrency)
+    results = benchmark.run(endpoints)
+    print(f"Results written to {write_json(results, args.results)}")
+
+    if args.update_baseline:
+        print(f"Baseline updated: {write_json(results, args.baseline)}")
+        return 0
+
+    regressions = find_regressions(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"❌ Regression: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# utils/api_cassette.py
+"""Record and replay APIClient traffic (API_CASSETTE=record or replay).
+
+CassetteAdapter is mounted on APIClient's session below the API base URL, so
+tests and helpers keep using APIClient unchanged:
+
+    API_CASSETTE=record pytest tests/api     # real calls, responses saved
+    API_CASSETTE=replay pytest tests/api     # served from the cassette
+
+Interactions are indexed by method, endpoint and normalized body (form
+fields sorted, API_CASSETTE_IGNORE_FIELDS masked, default "email" because
+tests generate random addresses). Repeated requests replay their recorded
+responses in order. A replay miss goes to the network and is added to the
+cassette, unless API_CASSETTE_STRICT=1, which fails the request instead and
+guarantees no network access. API_CASSETTE_LATENCY=1 sleeps for the recorded
+response time.
+
+Cassettes are gzipped JSON in API_CASSETTE_DIR (default tests/api/cassettes),
+named API_CASSETTE_NAME (default "api"); parallel shards record to their own
+file and replay reads all of them.
+"""
+import atexit
+import glob
+import gzip
+import json
+import os
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from utils.config import get_bool_setting, get_int_setting, get_setting
+
+MODES = ("off", "record", "replay")
+DEFAULT_CASSETTE_DIR = "tests/api/cassettes"
+
+# Not worth storing: they change on every call or describe the encoding on the wire
+VOLATILE_HEADERS = {"date", "set-cookie", "connection", "keep-alive", "transfer-encoding",
+                    "content-encoding", "content-length", "server", "vary"}
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """A strict replay got a request that is not in the cassette"""
+
+
+def cassette_mode():
+    mode = get_setting("API_CASSETTE", "off").lower()
+    if mode not in MODES:
+        raise ValueError(f"Unknown API_CASSETTE mode '{mode}', choose from {', '.join(MODES)}")
+    return mode
+
+
+def _normalize_body(body, content_type, ignore_fields):
+    # Same key for the same form regardless of field order or ignored values
+    if not body:
+        return ""
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    if "json" in (content_type or ""):
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return body
+        if isinstance(data, dict):
+            data = {key: "*" if key in ignore_fields else value for key, value in data.items()}
+        return json.dumps(data, sort_keys=True, separators=(",", ":"))
+    fields = parse_qsl(body, keep_blank_values=True)
+    return urlencode(sorted((key, "*" if key in ignore_fields else value) for key, value in fields))
+
+
+def request_key(request, base_url, ignore_fields=()):
+    """'METHOD endpoint?query body' for a prepared request below base_url"""
+    parts = urlsplit(request.url)
+    endpoint = parts.path[len(urlsplit(base_url).path):].lstrip("/")
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    body = _normalize_body(request.body, request.headers.get("Content-Type"), set(ignore_fields))
+    return f"{request.method} {endpoint}{'?' + query if query else ''} {body}".rstrip()
+
+
+class Cassette:
+    """Recorded responses per request key, loaded and saved as gzipped JSON"""
+
+    def __init__(self, path, load_paths=None):
+        self.path = path
+        self.interactions = {}
+        # What is written back to path: its own recordings, not those of other shards
+        self.saved = {}
+        self.dirty = False
+        self._positions = {}
+        self._lock = threading.Lock()
+        for load_path in load_paths or [path]:
+            self._load(load_path)
+
+    def _load(self, path):
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, responses in data.get('interactions', {}).items():
+            self.interactions.setdefault(key, []).extend(responses)
+            if path == self.path:
+                self.saved.setdefault(key, []).extend(responses)
+
+    def next_response(self, key):
+        # Recorded responses of a key in order, the last one repeats
+        with self._lock:
+            responses = self.interactions.get(key)
+            if not responses:
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return responses[min(position, len(responses) - 1)]
+
+    def add(self, key, recorded):
+        with self._lock:
+            self.interactions.setdefault(key, []).append(recorded)
+            self.saved.setdefault(key, []).append(recorded)
+            self._positions[key] = self._positions.get(key, 0) + 1
+            self.dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self.dirty:
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump({'version': 1, 'interactions': self.saved}, f, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+
+def _record(response):
+    return {
+        'status': response.status_code,
+        'reason': response.reason,
+        'headers': {name: value for name, value in response.headers.items()
+                    if name.lower() not in VOLATILE_HEADERS},
+        'body': response.content.decode('utf-8', errors='surrogateescape'),
+        'elapsed': round(response.elapsed.total_seconds(), 4),
+    }
+
+
+def _build_response(recorded, request):
+    response = requests.Response()
+    response.status_code = recorded['status']
+    response.reason = recorded['reason']
+    response.headers = CaseInsensitiveDict(recorded['headers'])
+    response._content = recorded['body'].encode('utf-8', errors='surrogateescape')
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.elapsed = timedelta(seconds=recorded['elapsed'])
+    return response
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that records or replays the responses of an inner adapter"""
+
+    def __init__(self, cassette, base_url, mode, inner=None, strict=False, replay_latency=False,
+                 ignore_fields=("email",)):
+        super().__init__()
+        self.cassette = cassette
+        self.base_url = base_url
+        self.mode = mode
+        self.inner = inner or HTTPAdapter()
+        self.strict = strict
+        self.replay_latency = replay_latency
+        self.ignore_fields = tuple(ignore_fields)
+
+    def send(self, request, **kwargs):
+        key = request_key(request, self.base_url, self.ignore_fields)
+        if self.mode == "replay":
+            recorded = self.cassette.next_response(key)
+            if recorded is not None:
+                if self.replay_latency:
+                    time.sleep(recorded['elapsed'])
+                return _build_response(recorded, request)
+            if self.strict:
+                raise CassetteMissError(f"No recorded response for '{key}' in {self.cassette.path}",
+                                        request=request)
+        response = self.inner.send(request, **kwargs)
+        self.cassette.add(key, _record(response))
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+_cassettes = {}
+_cassettes_lock = threading.Lock()
+
+
+def _cassette_paths(mode):
+    # (file written, files read); shards record to their own file
+    directory = get_setting("API_CASSETTE_DIR", DEFAULT_CASSETTE_DIR)
+    name = get_setting("API_CASSETTE_NAME", "api")
+    path = os.path.join(directory, f"{name}.json.gz")
+    if get_setting("SHARD_COUNT"):
+        path = os.path.join(directory, f"{name}-shard{get_int_setting('SHARD_INDEX', 0)}.json.gz")
+    if mode == "record":
+        return path, []
+    return path, sorted(set(glob.glob(os.path.join(directory, f"{name}.json.gz"))
+                            + glob.glob(os.path.join(directory, f"{name}-shard*.json.gz"))))
+
+
+def get_cassette(mode):
+    """Shared cassette for this process, saved at exit and by save_cassettes()"""
+    path, load_paths = _cassette_paths(mode)
+    with _cassettes_lock:
+        if path not in _cassettes:
+            if not _cassettes:
+                atexit.register(save_cassettes)
+            _cassettes[path] = Cassette(path, load_paths)
+        return _cassettes[path]
+
+
+def save_cassettes():
+    with _cassettes_lock:
+        cassettes = list(_cassettes.values())
+    for cassette in cassettes:
+        cassette.save()
+
+
+def mount_cassette(session, base_url, inner=None):
+    """Route session calls below base_url through a cassette when API_CASSETTE is set"""
+    mode = cassette_mode()
+    if mode == "off":
+        return None
+    ignore_fields = [field.strip() for field in get_setting("API_CASSETTE_IGNORE_FIELDS", "email").split(",")
+                     if field.strip()]
+    adapter = CassetteAdapter(
+        get_cassette(mode), base_url, mode, inner=inner,
+        strict=get_bool_setting("API_CASSETTE_STRICT", False),
+        replay_latency=get_bool_setting("API_CASSETTE_LATENCY", False),
+        ignore_fields=ignore_fields,
+    )
+    session.mount(f"{base_url}/", adapter)
+    return adapter
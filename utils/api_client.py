@@ -1,73 +1,78 @@
 # utils/api_client.py
 import requests
-import json
+from utils.api_cassette import mount_cassette
+from utils.api_response import APIResponse
+from utils.config import get_base_url
+from utils.http_transport import default_timeout, mount_transport
+from utils.resilience import wrap_transport
+from utils.response_cache import cacheable_endpoints, get_response_cache
 
 class APIClient:
-    def __init__(self):
-        self.base_url = "https://automationexercise.com/api"
+    def __init__(self, base_url=None):
+        # Defaults to BASE_URL so the suite can target the local stand-in server
+        self.base_url = f"{(base_url or get_base_url()).rstrip('/')}/api"
         self.session = requests.Session()
+        # Pooled keep-alive connections shared by every client in the process
+        transport = mount_transport(self.session)
+        # Retries and circuit breakers for API calls when API_RETRIES is set (see utils/resilience.py)
+        api_transport = wrap_transport(transport)
+        self.session.mount(f"{self.base_url}/", api_transport)
+        # Record/replay below the client when API_CASSETTE is set (see utils/api_cassette.py)
+        mount_cassette(self.session, self.base_url, inner=api_transport)
+        # (connect, read) seconds applied to every call that does not pass a timeout
+        self.timeout = default_timeout()
         # Don't set Content-Type globally as APIs expect form data, not JSON
     
-    def get(self, endpoint, params=None):
-        # Send GET request
+    def get(self, endpoint, params=None, timeout=None, cache=True):
+        # Send GET request, catalog endpoints go through the response cache when API_CACHE is on
         url = f"{self.base_url}/{endpoint}"
-        response = self.session.get(url, params=params)
+        response_cache = get_response_cache() if endpoint in cacheable_endpoints() else None
+        if response_cache is not None and cache:
+            response = response_cache.fetch(self.session, url, params, timeout or self.timeout)
+        else:
+            if response_cache is not None:
+                response_cache.bypass()
+            response = self.session.get(url, params=params, timeout=timeout or self.timeout)
         return self._handle_response(response)
     
-    def post(self, endpoint, data=None, json_data=None):
+    def post(self, endpoint, data=None, json_data=None, timeout=None):
         # Send POST request
         url = f"{self.base_url}/{endpoint}"
         if json_data:
-            response = self.session.post(url, json=json_data)
+            response = self.session.post(url, json=json_data, timeout=timeout or self.timeout)
         else:
-            response = self.session.post(url, data=data)
+            response = self.session.post(url, data=data, timeout=timeout or self.timeout)
         return self._handle_response(response)
     
-    def put(self, endpoint, data=None, json_data=None):
+    def put(self, endpoint, data=None, json_data=None, timeout=None):
         # Send PUT request
         url = f"{self.base_url}/{endpoint}"
         if json_data:
-            response = self.session.put(url, json=json_data)
+            response = self.session.put(url, json=json_data, timeout=timeout or self.timeout)
         else:
-            response = self.session.put(url, data=data)
+            response = self.session.put(url, data=data, timeout=timeout or self.timeout)
         return self._handle_response(response)
     
-    def delete(self, endpoint, data=None):
+    def delete(self, endpoint, data=None, timeout=None):
         # Send DELETE request
         url = f"{self.base_url}/{endpoint}"
         if data:
-            response = self.session.delete(url, data=data)
+            response = self.session.delete(url, data=data, timeout=timeout or self.timeout)
         else:
-            response = self.session.delete(url)
+            response = self.session.delete(url, timeout=timeout or self.timeout)
         return self._handle_response(response)
     
     def _handle_response(self, response):
-        # Handle API response
-        try:
-            # Try to parse JSON response
-            json_response = response.json()
-            return {
-                'status_code': response.status_code,
-                'data': json_response,
-                'headers': dict(response.headers),
-                'success': response.ok
-            }
-        except json.JSONDecodeError:
-            # If not JSON, return text response
-            return {
-                'status_code': response.status_code,
-                'data': response.text,
-                'headers': dict(response.headers),
-                'success': response.ok
-            }
+        # Body and headers are only parsed when accessed (see utils/api_response.py)
+        return APIResponse(response)
     
-    def get_products_list(self):
+    def get_products_list(self, cache=True):
         # Get all products list
-        return self.get("productsList")
+        return self.get("productsList", cache=cache)
     
-    def get_brands_list(self):
+    def get_brands_list(self, cache=True):
         # Get all brands list
-        return self.get("brandsList")
+        return self.get("brandsList", cache=cache)
     
     def search_product(self, search_product):
         # Search for a product
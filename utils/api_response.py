@@ -0,0 +1,123 @@
+# utils/api_response.py
+"""Response type returned by APIClient.
+
+APIResponse reads the status from the underlying requests.Response and only
+parses the body or copies the headers when a test asks for them, so checks
+on status_code alone cost no JSON decoding. It still behaves like the dict
+APIClient used to return ('status_code', 'data', 'headers', 'success'):
+
+    response['data']['products'][0]['name'] == response.products()[0].name
+"""
+import json
+from collections.abc import Mapping
+
+RESPONSE_KEYS = ('status_code', 'data', 'headers', 'success')
+
+
+class Product:
+    """One entry of productsList / searchProduct"""
+    __slots__ = ("id", "name", "price", "brand", "category", "usertype")
+
+    def __init__(self, id, name, price, brand, category, usertype):
+        self.id = id
+        self.name = name
+        self.price = price
+        self.brand = brand
+        self.category = category
+        self.usertype = usertype
+
+    @classmethod
+    def from_dict(cls, data):
+        # {"category": {"usertype": {"usertype": "Women"}, "category": "Tops"}}
+        category = data.get('category') or {}
+        usertype = category.get('usertype') or {}
+        return cls(data.get('id'), data.get('name'), data.get('price'), data.get('brand'),
+                   category.get('category'), usertype.get('usertype'))
+
+    def __repr__(self):
+        return f"Product({self.id!r}, {self.name!r}, {self.price!r})"
+
+
+class Brand:
+    """One entry of brandsList"""
+    __slots__ = ("id", "brand")
+
+    def __init__(self, id, brand):
+        self.id = id
+        self.brand = brand
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get('id'), data.get('brand'))
+
+    def __repr__(self):
+        return f"Brand({self.id!r}, {self.brand!r})"
+
+
+_UNSET = object()
+
+
+class APIResponse(Mapping):
+    __slots__ = ("_response", "_data", "_headers")
+
+    def __init__(self, response):
+        self._response = response
+        self._data = _UNSET
+        self._headers = None
+
+    @property
+    def status_code(self):
+        return self._response.status_code
+
+    @property
+    def success(self):
+        return self._response.ok
+
+    @property
+    def data(self):
+        # Parsed JSON, or the text when the body is not JSON
+        if self._data is _UNSET:
+            try:
+                self._data = self._response.json()
+            except json.JSONDecodeError:
+                self._data = self._response.text
+        return self._data
+
+    @property
+    def headers(self):
+        if self._headers is None:
+            self._headers = dict(self._response.headers)
+        return self._headers
+
+    @property
+    def response_code(self):
+        # The API's own responseCode, which can differ from the HTTP status
+        data = self.data
+        return data.get('responseCode') if isinstance(data, dict) else None
+
+    def products(self):
+        data = self.data
+        return [Product.from_dict(item) for item in data.get('products', [])] if isinstance(data, dict) else []
+
+    def brands(self):
+        data = self.data
+        return [Brand.from_dict(item) for item in data.get('brands', [])] if isinstance(data, dict) else []
+
+    # Mapping interface, compatible with the dict APIClient used to return
+    def __getitem__(self, key):
+        if key not in RESPONSE_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(RESPONSE_KEYS)
+
+    def __len__(self):
+        return len(RESPONSE_KEYS)
+
+    def __contains__(self, key):
+        # Without this, Mapping would call __getitem__ and parse the body
+        return key in RESPONSE_KEYS
+
+    def __repr__(self):
+        return f"APIResponse(status_code={self.status_code}, data={self.data!r})"
@@ -0,0 +1,154 @@
+# utils/artifact_store.py
+"""Content-addressed storage for screenshot artifacts.
+
+Every screenshot is stored once under blobs/<sha256>.<ext>; the familiar
+file name in reports/screenshots is a hard link to the blob (or, where links
+are not supported, only a manifest entry). manifest.jsonl maps each
+test/step to its blob. Re-encoding to WebP/JPEG and thumbnails need Pillow
+and are skipped with a warning when it is not installed.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+from datetime import datetime
+from utils.config import get_bool_setting, get_int_setting, get_setting
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+DEFAULT_ARTIFACT_DIR = "reports/screenshots"
+
+# SCREENSHOT_FORMAT -> (Pillow format, file extension)
+FORMATS = {
+    'png': ("PNG", ".png"),
+    'webp': ("WEBP", ".webp"),
+    'jpeg': ("JPEG", ".jpg"),
+}
+
+
+class ArtifactStore:
+    def __init__(self, root=DEFAULT_ARTIFACT_DIR, image_format="png", quality=80, thumbnail_width=0):
+        if image_format not in FORMATS:
+            raise ValueError(f"Unknown screenshot format: {image_format}")
+        if Image is None and (image_format != "png" or thumbnail_width):
+            print("⚠️ Pillow is not installed, screenshots are stored as PNG without thumbnails")
+            image_format, thumbnail_width = "png", 0
+        self.root = root
+        self.blob_dir = os.path.join(root, "blobs")
+        self.manifest_path = os.path.join(root, "manifest.jsonl")
+        self.image_format = image_format
+        self.quality = quality
+        self.thumbnail_width = thumbnail_width
+        self.stats = {'stored': 0, 'duplicates': 0, 'bytes_in': 0, 'bytes_stored': 0}
+        self._lock = threading.Lock()
+
+    def _encode(self, png_bytes, width=None):
+        # Re-encode (and optionally downscale) with Pillow
+        image = Image.open(io.BytesIO(png_bytes))
+        if width and image.width > width:
+            image = image.resize((width, round(image.height * width / image.width)))
+        pil_format = FORMATS[self.image_format][0]
+        if pil_format == "JPEG" and image.mode != "RGB":
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, pil_format, quality=self.quality)
+        return output.getvalue()
+
+    def _write_blob(self, blob_path, data):
+        # Written under a temporary name so a half-written blob is never linked
+        tmp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, blob_path)
+
+    def _link(self, blob_path, filepath):
+        try:
+            if os.path.exists(filepath):
+                os.remove(filepath)
+            os.link(blob_path, filepath)
+            return True
+        except OSError:
+            return False
+
+    def output_path(self, filepath):
+        # Where a screenshot requested as `filepath` is linked, with the stored format's extension
+        return os.path.splitext(filepath)[0] + FORMATS[self.image_format][1]
+
+    def store_screenshot(self, filepath, png_bytes, test=None, step=None):
+        """Store a PNG screenshot, returns the path the artifact is available at"""
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        extension = FORMATS[self.image_format][1]
+        os.makedirs(self.blob_dir, exist_ok=True)
+        blob_path = os.path.join(self.blob_dir, digest + extension)
+
+        # Duplicates are detected on the original bytes, before lossy encoding
+        duplicate = os.path.exists(blob_path)
+        if not duplicate:
+            data = png_bytes if self.image_format == "png" else self._encode(png_bytes)
+            self._write_blob(blob_path, data)
+            if self.thumbnail_width:
+                thumb_path = os.path.join(self.blob_dir, f"{digest}_thumb{extension}")
+                self._write_blob(thumb_path, self._encode(png_bytes, self.thumbnail_width))
+
+        filepath = self.output_path(filepath)
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        linked = self._link(blob_path, filepath)
+
+        with self._lock:
+            self.stats['bytes_in'] += len(png_bytes)
+            if duplicate:
+                self.stats['duplicates'] += 1
+            else:
+                self.stats['stored'] += 1
+                self.stats['bytes_stored'] += os.path.getsize(blob_path)
+            self._append_manifest({
+                'path': filepath if linked else None,
+                'blob': os.path.relpath(blob_path, self.root),
+                'sha256': digest,
+                'test': test,
+                'step': step,
+                'duplicate': duplicate,
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+            })
+        return filepath if linked else blob_path
+
+    def _append_manifest(self, entry):
+        # One JSON object per line, parallel workers only ever append
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + "\n")
+
+
+def load_manifest(path=os.path.join(DEFAULT_ARTIFACT_DIR, "manifest.jsonl")):
+    entries = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line))
+    except OSError:
+        pass
+    return entries
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store():
+    """Shared store, None when SCREENSHOT_DEDUP is disabled"""
+    global _store
+    if not get_bool_setting("SCREENSHOT_DEDUP", True):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = ArtifactStore(
+                DEFAULT_ARTIFACT_DIR,
+                get_setting("SCREENSHOT_FORMAT", "png").lower(),
+                get_int_setting("SCREENSHOT_QUALITY", 80),
+                get_int_setting("SCREENSHOT_THUMBNAIL_WIDTH", 0),
+            )
+    return _store
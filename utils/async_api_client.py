@@ -0,0 +1,123 @@
+# utils/async_api_client.py
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.api_client import APIClient
+from utils.config import get_int_setting
+
+DEFAULT_CONCURRENCY = 20
+
+
+class AsyncAPIClient:
+    """asyncio variant of APIClient for bulk seeding and search matrices.
+
+    Each call runs the synchronous APIClient on a worker thread (one
+    requests.Session per thread), and an asyncio.Semaphore caps how many
+    calls are in flight. Usage:
+
+        async with AsyncAPIClient(concurrency=50) as client:
+            responses = await client.gather(*(client.search_product(t) for t in terms))
+
+    or from synchronous code:
+
+        responses = AsyncAPIClient().run_batch([("search_product", "top"), ("get_brands_list",)])
+    """
+
+    def __init__(self, base_url=None, concurrency=None):
+        self.base_url = base_url
+        self.concurrency = max(1, concurrency or get_int_setting("API_CONCURRENCY", DEFAULT_CONCURRENCY))
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="api")
+        self._thread_local = threading.local()
+        self._clients = []
+        self._clients_lock = threading.Lock()
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        # Stop worker threads and close every HTTP session
+        self._executor.shutdown(wait=True)
+        with self._clients_lock:
+            for client in self._clients:
+                client.session.close()
+            self._clients.clear()
+
+    def _thread_client(self):
+        # requests.Session is not thread-safe, so every worker thread gets its own client
+        client = getattr(self._thread_local, 'client', None)
+        if client is None:
+            client = APIClient(self.base_url)
+            self._thread_local.client = client
+            with self._clients_lock:
+                self._clients.append(client)
+        return client
+
+    def _run_in_thread(self, method_name, args, kwargs):
+        return getattr(self._thread_client(), method_name)(*args, **kwargs)
+
+    async def _call(self, method_name, *args, **kwargs):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(self._run_in_thread, method_name, args, kwargs)
+            )
+
+    # Raw HTTP methods
+    async def get(self, endpoint, params=None):
+        return await self._call("get", endpoint, params=params)
+
+    async def post(self, endpoint, data=None, json_data=None):
+        return await self._call("post", endpoint, data=data, json_data=json_data)
+
+    async def put(self, endpoint, data=None, json_data=None):
+        return await self._call("put", endpoint, data=data, json_data=json_data)
+
+    async def delete(self, endpoint, data=None):
+        return await self._call("delete", endpoint, data=data)
+
+    # Same helpers as APIClient
+    async def get_products_list(self):
+        return await self._call("get_products_list")
+
+    async def get_brands_list(self):
+        return await self._call("get_brands_list")
+
+    async def search_product(self, search_product):
+        return await self._call("search_product", search_product)
+
+    async def create_account(self, user_data):
+        return await self._call("create_account", user_data)
+
+    async def verify_login(self, email, password):
+        return await self._call("verify_login", email, password)
+
+    async def delete_account(self, email, password):
+        return await self._call("delete_account", email, password)
+
+    # Batch API
+    async def gather(self, *calls, return_exceptions=False):
+        # Run coroutines from this client concurrently, results keep the input order
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def map(self, method_name, arguments, return_exceptions=False):
+        # Call one helper for every argument tuple, e.g. map("search_product", [("top",), ("dress",)])
+        calls = [getattr(self, method_name)(*args) for args in arguments]
+        return await self.gather(*calls, return_exceptions=return_exceptions)
+
+    def run_batch(self, calls, return_exceptions=False):
+        """Run [(method_name, *args), ...] from synchronous code and close the client"""
+        async def _batch():
+            coroutines = [getattr(self, call[0])(*call[1:]) for call in calls]
+            return await self.gather(*coroutines, return_exceptions=return_exceptions)
+
+        try:
+            return asyncio.run(_batch())
+        finally:
+            self.close()
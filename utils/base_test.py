@@ -0,0 +1,68 @@
+# utils/base_test.py
+import unittest
+import pytest
+from utils.action_profiler import action_profiler, is_enabled as profiling_enabled
+from utils.config import get_base_url
+from utils.driver_factory import create_driver
+from utils.page_timing import page_timings, is_enabled as page_timing_enabled
+from utils.screenshot_utils import discard_step_screenshots
+from utils.session_login import api_login, inject_cookies
+
+
+class BaseUITest(unittest.TestCase):
+    """Base class for UI test cases.
+
+    Under pytest the browser comes from the session driver pool (see the
+    `driver` fixture in conftest.py). When the file is run directly with
+    unittest a fresh browser is launched and quit for each test instead.
+    """
+
+    # Page opened before every test (relative to BASE_URL), None to start on a blank page
+    start_path = "/"
+
+    driver = None
+    _owns_driver = False
+
+    @pytest.fixture(autouse=True)
+    def _use_pooled_driver(self, driver):
+        # Runs before setUp when collected by pytest
+        self.driver = driver
+        yield
+        self.driver = None
+
+    def setUp(self):
+        self.base_url = get_base_url()
+        # Step screenshots buffered by an earlier test never belong to this one
+        discard_step_screenshots()
+        if page_timings.current_test is None and page_timing_enabled():
+            # Plain unittest run, pytest already started the test in conftest.py
+            page_timings.start_test(self.id())
+        if action_profiler.current_test is None and profiling_enabled():
+            action_profiler.start_test(self.id())
+        if self.driver is None:
+            self.driver = create_driver()
+            self._owns_driver = True
+        if self.start_path is not None:
+            self.driver.get(self.base_url + self.start_path)
+
+    def login_via_api(self, email, password, path="/"):
+        """Log the browser in with session cookies from an HTTP login, then open path.
+
+        For tests that need a logged-in user but do not test the login form.
+        Returns False when the HTTP login failed.
+        """
+        cookies = api_login(email, password, self.base_url)
+        if cookies is None:
+            return False
+        inject_cookies(self.driver, cookies, self.base_url)
+        if path is not None:
+            self.driver.get(self.base_url + path)
+        return True
+
+    def tearDown(self):
+        if self._owns_driver:
+            page_timings.finish_test()
+            action_profiler.finish_test()
+            self.driver.quit()
+            self.driver = None
+            self._owns_driver = False
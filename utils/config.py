@@ -0,0 +1,52 @@
+# utils/config.py
+import os
+
+DEFAULT_BASE_URL = "https://automationexercise.com"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "qa-ecommerce-test")
+
+
+def get_setting(name, default=None):
+    # Read a framework setting from the environment
+    # conftest.py copies command line options into the environment so that
+    # plain unittest runs and pytest runs see the same values
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    return value
+
+
+def get_int_setting(name, default):
+    # Read an integer setting, falling back to default on bad values
+    value = get_setting(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"Invalid integer for {name}: {value!r}, using {default}")
+        return default
+
+
+def get_bool_setting(name, default=False):
+    # Read a boolean setting ("1", "true", "yes", "on" are truthy)
+    value = get_setting(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def set_setting(name, value):
+    # Store a setting so that utils and subprocesses pick it up
+    if value is None:
+        return
+    os.environ[name] = str(value)
+
+
+def get_cache_dir():
+    # Directory for caches that persist between runs (drivers, locators, ...)
+    return get_setting("CACHE_DIR", DEFAULT_CACHE_DIR)
+
+
+def get_base_url():
+    # Site under test, e.g. a local stand-in server (see utils/local_server.py)
+    return get_setting("BASE_URL", DEFAULT_BASE_URL).rstrip("/")
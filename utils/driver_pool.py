@@ -0,0 +1,164 @@
+# utils/driver_pool.py
+import queue
+import threading
+from selenium.common.exceptions import WebDriverException
+from utils.driver_factory import create_driver
+
+
+class DriverPool:
+    """Keeps up to `size` warm browsers alive for the whole test session.
+
+    Browsers are created lazily on first use, handed out with acquire() and
+    returned with release(). Between tests a browser is reset (cookies,
+    localStorage, sessionStorage, extra windows, open alerts) and parked on
+    about:blank. A browser that cannot be reset is quit and replaced.
+    """
+
+    BLANK_PAGE = "about:blank"
+
+    def __init__(self, size=1, driver_factory=create_driver):
+        self.size = max(1, size)
+        self._driver_factory = driver_factory
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._drivers = []
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0}
+
+    def acquire(self, timeout=None):
+        # Get a ready-to-use browser from the pool
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+
+        driver = self._take_idle()
+        if driver is not None:
+            self.stats['reused'] += 1
+        else:
+            driver = self._create_if_room()
+        if driver is None:
+            # Pool is at capacity, wait for another test to release a browser
+            try:
+                driver = self._idle.get(timeout=timeout)
+                self.stats['reused'] += 1
+            except queue.Empty:
+                raise TimeoutError(f"No browser released within {timeout}s (pool size {self.size})")
+
+        if not self._is_alive(driver):
+            driver = self._recycle(driver)
+        return driver
+
+    def release(self, driver, broken=False):
+        # Return a browser to the pool, recycling it if it is not healthy
+        if driver is None:
+            return
+        if self._closed:
+            self._quit(driver)
+            return
+        if broken or not self.reset(driver):
+            self._discard(driver)
+            self.stats['recycled'] += 1
+            return
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        # Clear per-test browser state, returns False if the browser is broken
+        try:
+            self._dismiss_alert(driver)
+            self._close_extra_windows(driver)
+
+            # Storage is per-origin, so clear it while still on the test's page
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+            self._clear_cookies(driver)
+            driver.get(self.BLANK_PAGE)
+            return True
+        except WebDriverException as e:
+            print(f"Browser reset failed, recycling driver: {e.msg if hasattr(e, 'msg') else e}")
+            return False
+
+    def close(self):
+        # Quit every browser owned by the pool
+        self._closed = True
+        with self._lock:
+            drivers = list(self._drivers)
+            self._drivers.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _take_idle(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _create_if_room(self):
+        with self._lock:
+            if len(self._drivers) >= self.size:
+                return None
+            # Reserve the slot before launching so parallel callers respect the size
+            self._drivers.append(None)
+        try:
+            driver = self._driver_factory()
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+        self.stats['created'] += 1
+        return driver
+
+    def _recycle(self, driver):
+        # Replace a dead browser with a fresh one
+        self._discard(driver)
+        self.stats['recycled'] += 1
+        driver = self._create_if_room()
+        if driver is None:
+            raise RuntimeError("Could not create a replacement browser")
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        self._quit(driver)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _dismiss_alert(driver):
+        try:
+            driver.switch_to.alert.dismiss()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def _close_extra_windows(driver):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    @staticmethod
+    def _clear_cookies(driver):
+        # CDP clears cookies for every domain, WebDriver only for the current one
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
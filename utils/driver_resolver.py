@@ -0,0 +1,151 @@
+# utils/driver_resolver.py
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from utils.config import get_setting, get_cache_dir
+
+# Commands tried to read the installed Chrome version on macOS/Linux
+CHROME_VERSION_COMMANDS = [
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+]
+
+# Result of the resolution for this process (resolved once per session)
+_resolved = None
+
+
+class DriverResolution:
+    def __init__(self, path, source, chrome_version, seconds):
+        self.path = path                      # chromedriver path, None lets Selenium Manager decide
+        self.source = source                  # env, cache, download, stale-cache or selenium-manager
+        self.chrome_version = chrome_version
+        self.seconds = seconds
+
+    def __repr__(self):
+        return (f"DriverResolution(path={self.path!r}, source={self.source!r}, "
+                f"chrome_version={self.chrome_version!r}, seconds={self.seconds:.3f})")
+
+
+def get_chrome_version():
+    # Detect the installed Chrome version, e.g. "139.0.7258.66"
+    override = get_setting("CHROME_VERSION")
+    if override:
+        return override
+
+    if sys.platform.startswith("win"):
+        try:
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            return None
+
+    for command in CHROME_VERSION_COMMANDS:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _major(version):
+    return version.split(".")[0] if version else None
+
+
+class DriverCache:
+    """On-disk map of Chrome major version -> chromedriver path"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or get_setting("DRIVER_CACHE_DIR", get_cache_dir())
+        self.cache_file = os.path.join(self.cache_dir, "chromedriver.json")
+
+    def load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, chrome_version):
+        entry = self.load().get(_major(chrome_version) or "unknown")
+        if entry and os.path.isfile(entry['path']):
+            return entry['path']
+        return None
+
+    def newest(self):
+        # Most recently stored driver that still exists on disk
+        entries = [e for e in self.load().values() if os.path.isfile(e['path'])]
+        if not entries:
+            return None
+        return max(entries, key=lambda e: e.get('stored_at', 0))['path']
+
+    def put(self, chrome_version, path):
+        entries = self.load()
+        entries[_major(chrome_version) or "unknown"] = {
+            'path': path,
+            'chrome_version': chrome_version,
+            'stored_at': time.time(),
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+
+def _download_driver():
+    # webdriver-manager does the version lookup and download (needs network)
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver(force=False):
+    """Resolve the chromedriver binary once per session.
+
+    Order: CHROMEDRIVER_PATH, the on-disk cache for the installed Chrome
+    version, webdriver-manager (result is pinned in the cache), the newest
+    cached driver when Chrome's version is unknown, and finally Selenium
+    Manager (path None).
+    """
+    global _resolved
+    if _resolved is not None and not force:
+        return _resolved
+
+    start = time.perf_counter()
+    chrome_version = None
+    explicit_path = get_setting("CHROMEDRIVER_PATH")
+
+    if explicit_path:
+        path, source = explicit_path, "env"
+    else:
+        cache = DriverCache()
+        chrome_version = get_chrome_version()
+        path, source = cache.get(chrome_version), "cache"
+        if path is None:
+            try:
+                path, source = _download_driver(), "download"
+                cache.put(chrome_version, path)
+            except Exception as e:
+                # Offline or webdriver-manager failure
+                print(f"⚠️ chromedriver download failed: {e}")
+                # A driver for another Chrome major would not start, so only
+                # fall back to it when the Chrome version is unknown
+                path = cache.newest() if chrome_version is None else None
+                source = "stale-cache" if path else "selenium-manager"
+
+    _resolved = DriverResolution(path, source, chrome_version, time.perf_counter() - start)
+    return _resolved
+
+
+def get_last_resolution():
+    # Resolution done in this process, None if no browser was started
+    return _resolved
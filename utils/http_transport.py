@@ -0,0 +1,188 @@
+# utils/http_transport.py
+"""Process-wide HTTP transport shared by every APIClient session.
+
+Sessions stay per client (cookies do not leak between tests), but they all
+mount the same TunedHTTPAdapter, so connections opened by one test are
+reused by the next. The adapter keeps API_POOL_SIZE connections per host
+(default 20, the AsyncAPIClient concurrency), sets TCP_NODELAY and
+SO_KEEPALIVE on every socket and caches DNS answers for API_DNS_TTL seconds
+(default 300). transport_stats() reports how many requests reused a
+connection; conftest.py prints it in the terminal summary.
+"""
+import ipaddress
+import socket
+import threading
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from utils.config import get_int_setting, get_setting
+
+DEFAULT_POOL_SIZE = 20
+DEFAULT_DNS_TTL = 300
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 30.0
+
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+def default_timeout():
+    """(connect, read) seconds used by APIClient when a call does not pass its own"""
+    return (float(get_setting("API_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+            float(get_setting("API_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)))
+
+
+class TransportStats:
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.dns_lookups = 0
+        self.dns_hits = 0
+        self._lock = threading.Lock()
+
+    def add(self, name, count=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + count)
+
+    def as_dict(self):
+        return {
+            'requests': self.requests,
+            'connections': self.connections,
+            'reused': max(0, self.requests - self.connections),
+            'dns_lookups': self.dns_lookups,
+            'dns_hits': self.dns_hits,
+        }
+
+
+stats = TransportStats()
+
+
+class DNSCache:
+    """host -> address for ttl seconds, so every new connection skips getaddrinfo"""
+
+    def __init__(self, ttl=DEFAULT_DNS_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host, port):
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry and entry[1] > now:
+                stats.add('dns_hits')
+                return entry[0]
+        stats.add('dns_lookups')
+        try:
+            address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            # Let urllib3 report the resolution error itself
+            return host
+        with self._lock:
+            self._entries[(host, port)] = (address, now + self.ttl)
+        return address
+
+    def forget(self, host, port):
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+dns_cache = DNSCache(get_int_setting("API_DNS_TTL", DEFAULT_DNS_TTL))
+
+
+class _TunedConnectionMixin:
+    # Connects to the cached address; TLS still verifies and sends SNI for self.host
+    def _new_conn(self):
+        host = self._dns_host
+        self._dns_host = dns_cache.resolve(host, self.port)
+        try:
+            sock = super()._new_conn()
+        except Exception:
+            dns_cache.forget(host, self.port)
+            raise
+        finally:
+            self._dns_host = host
+        stats.add('connections')
+        return sock
+
+
+class TunedHTTPConnection(_TunedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TunedHTTPSConnection(_TunedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TunedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TunedHTTPConnection
+
+
+class TunedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TunedHTTPSConnection
+
+
+class TunedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter with sized keep-alive pools, socket options, DNS cache and stats"""
+
+    def __init__(self, pool_size=None, **kwargs):
+        pool_size = pool_size or get_int_setting("API_POOL_SIZE", DEFAULT_POOL_SIZE)
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, socket_options=SOCKET_OPTIONS, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TunedHTTPConnectionPool,
+            'https': TunedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        stats.add('requests')
+        return super().send(request, **kwargs)
+
+    def close(self):
+        # Shared by every session: Session.close() must not drop the pooled connections
+        pass
+
+    def shutdown(self):
+        super().close()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """The shared adapter, created on first use"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = TunedHTTPAdapter()
+        return _transport
+
+
+def mount_transport(session):
+    transport = get_transport()
+    session.mount("http://", transport)
+    session.mount("https://", transport)
+    return transport
+
+
+def close_transport():
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.shutdown()
+            _transport = None
+
+
+def transport_stats():
+    return stats.as_dict()
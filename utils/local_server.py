@@ -0,0 +1,704 @@
+# utils/local_server.py
+"""Local stand-in for automationexercise.com.
+
+Implements the API endpoints used by APIClient and the HTML pages targeted by
+the page objects, so the UI and API suites can run against loopback without
+the network. Start it with the --local-server pytest option, or standalone:
+
+    python -m utils.local_server --port 8000
+"""
+import argparse
+import copy
+import html
+import json
+import re
+import secrets
+import socket
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+PRODUCTS = [
+    {'id': 1, 'name': "Blue Top", 'price': "Rs. 500", 'brand': "Polo", 'usertype': "Women", 'category': "Tops"},
+    {'id': 2, 'name': "Men Tshirt", 'price': "Rs. 400", 'brand': "H&M", 'usertype': "Men", 'category': "Tshirts"},
+    {'id': 3, 'name': "Sleeveless Dress", 'price': "Rs. 1000", 'brand': "Madame", 'usertype': "Women", 'category': "Dress"},
+    {'id': 4, 'name': "Stylish Dress", 'price': "Rs. 1500", 'brand': "Madame", 'usertype': "Women", 'category': "Dress"},
+    {'id': 5, 'name': "Winter Top", 'price': "Rs. 600", 'brand': "Mast & Harbour", 'usertype': "Women", 'category': "Tops"},
+    {'id': 6, 'name': "Summer White Top", 'price': "Rs. 400", 'brand': "H&M", 'usertype': "Women", 'category': "Tops"},
+    {'id': 7, 'name': "Madame Top For Women", 'price': "Rs. 1000", 'brand': "Madame", 'usertype': "Women", 'category': "Tops"},
+    {'id': 8, 'name': "Fancy Green Top", 'price': "Rs. 700", 'brand': "Polo", 'usertype': "Women", 'category': "Tops"},
+    {'id': 11, 'name': "Blue Cotton Indie Mickey Dress", 'price': "Rs. 1530", 'brand': "Madame", 'usertype': "Women", 'category': "Dress"},
+    {'id': 12, 'name': "Long Maxi Tulle Fancy Dress Up Outfits -Pink", 'price': "Rs. 1400", 'brand': "Babyhug", 'usertype': "Kids", 'category': "Dress"},
+    {'id': 13, 'name': "Sleeveless Unicorn Patch Gown - Pink", 'price': "Rs. 1050", 'brand': "Babyhug", 'usertype': "Kids", 'category': "Dress"},
+    {'id': 28, 'name': "Pure Cotton V-Neck T-Shirt", 'price': "Rs. 1299", 'brand': "Allen Solly Junior", 'usertype': "Kids", 'category': "Tops & Shirts"},
+    {'id': 30, 'name': "Premium Polo T-Shirts", 'price': "Rs. 1500", 'brand': "Polo", 'usertype': "Men", 'category': "Tshirts"},
+    {'id': 43, 'name': "GRAPHIC DESIGN MEN T SHIRT - BLUE", 'price': "Rs. 1389", 'brand': "Biba", 'usertype': "Men", 'category': "Tshirts"},
+]
+
+BRANDS = ["Polo", "H&M", "Madame", "Mast & Harbour", "Babyhug", "Allen Solly Junior", "Kookie Kids", "Biba"]
+
+COUNTRIES = ["India", "United States", "Canada", "Australia", "Israel", "New Zealand", "Singapore"]
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+# Account that the suites log in with
+DEFAULT_USERS = {
+    "huilek@example.com": {'name': "huilek", 'email': "huilek@example.com", 'password': "correctpassword"},
+}
+
+# API error messages, same wording as the real site
+METHOD_NOT_SUPPORTED = "This request method is not supported."
+
+API_RESPONSE_HEADERS = {'Content-Type': "application/json"}
+
+
+def product_json(product):
+    return {
+        'id': product['id'],
+        'name': product['name'],
+        'price': product['price'],
+        'brand': product['brand'],
+        'category': {'usertype': {'usertype': product['usertype']}, 'category': product['category']},
+    }
+
+
+class SiteState:
+    """In-memory users, sessions and carts of one server instance"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = copy.deepcopy(DEFAULT_USERS)
+        self.sessions = {}
+
+    def new_session(self):
+        session_id = secrets.token_hex(16)
+        self.sessions[session_id] = {'user': None, 'cart': {}, 'csrf': secrets.token_hex(16)}
+        return session_id
+
+
+def search_products(term):
+    # Case-insensitive match on name, category and user type like the real site
+    term = term.lower()
+    return [p for p in PRODUCTS
+            if term in p['name'].lower() or term in p['category'].lower() or term in p['usertype'].lower()]
+
+
+# ---------------------------------------------------------------- HTML pages
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: Arial, sans-serif; margin: 0; }}
+header, section, footer {{ padding: 10px 20px; }}
+.nav li {{ display: inline-block; margin-right: 15px; }}
+.product-image-wrapper {{ display: inline-block; width: 220px; margin: 10px; vertical-align: top; }}
+.modal {{ display: none; position: fixed; top: 30%; left: 35%; background: #fff; border: 1px solid #ccc; padding: 20px; }}
+.modal.show {{ display: block; }}
+</style>
+</head>
+<body>
+<header id="header">
+  <ul class="nav navbar-nav">
+    <li><a href="/"><i class="fa fa-home"></i> Home</a></li>
+    <li><a href="/products"><i class="material-icons card_travel"></i> Products</a></li>
+    <li><a href="/view_cart"><i class="fa fa-shopping-cart"></i> Cart</a></li>
+    {account_links}
+    <li><a href="/contact_us"><i class="fa fa-envelope"></i> Contact us</a></li>
+  </ul>
+</header>
+{body}
+<div class="modal" id="cartModal">
+  <h4 class="modal-title w-100">Added!</h4>
+  <p class="text-center">Your product has been added to cart.</p>
+  <p class="text-center"><a href="/view_cart"><u>View Cart</u></a></p>
+  <button class="btn btn-success close-modal btn-block" data-dismiss="modal"
+          onclick="document.getElementById('cartModal').classList.remove('show')">Continue Shopping</button>
+</div>
+<script>
+function addToCart(productId, quantity) {{
+  fetch('/add_to_cart/' + productId + '?quantity=' + (quantity || 1), {{credentials: 'same-origin'}})
+    .then(function () {{ document.getElementById('cartModal').classList.add('show'); }});
+}}
+</script>
+<footer id="footer"><p>Local stand-in for automationexercise.com</p></footer>
+</body>
+</html>
+"""
+
+LOGGED_OUT_LINKS = '<li><a href="/login"><i class="fa fa-lock"></i> Signup / Login</a></li>'
+
+LOGGED_IN_LINKS = """<li><a href="/logout"><i class="fa fa-lock"></i> Logout</a></li>
+    <li><a href="/delete_account"><i class="fa fa-trash-o"></i> Delete Account</a></li>
+    <li><a><i class="fa fa-user"></i> Logged in as <b>{name}</b></a></li>"""
+
+
+def product_card(product):
+    return f"""<div class="col-sm-4">
+  <div class="product-image-wrapper">
+    <div class="single-products">
+      <div class="productinfo text-center">
+        <h2>{html.escape(product['price'])}</h2>
+        <p>{html.escape(product['name'])}</p>
+        <a href="#" data-product-id="{product['id']}" class="btn btn-default add-to-cart"
+           onclick="addToCart({product['id']}); return false;"><i class="fa fa-shopping-cart"></i>Add to cart</a>
+      </div>
+    </div>
+    <div class="choose">
+      <ul class="nav nav-pills nav-justified">
+        <li><a href="/product_details/{product['id']}"><i class="fa fa-plus-square"></i>View Product</a></li>
+      </ul>
+    </div>
+  </div>
+</div>"""
+
+
+def products_section(title, products):
+    cards = "\n".join(product_card(p) for p in products)
+    return f"""<section>
+  <div class="features_items">
+    <h2 class="title text-center">{title}</h2>
+    {cards}
+  </div>
+</section>"""
+
+
+def home_body():
+    return f"""<section id="slider">
+  <div id="slider-carousel" class="carousel slide">
+    <h1><span>Automation</span>Exercise</h1>
+    <h2>Full-Fledged practice website for Automation Engineers</h2>
+  </div>
+</section>
+{products_section("Features Items", PRODUCTS)}"""
+
+
+def products_body(search=None):
+    if search is None:
+        title, products = "All Products", PRODUCTS
+    else:
+        title, products = "Searched Products", search_products(search)
+    return f"""<section id="advertisement"><h2>Products</h2></section>
+<section>
+  <input type="text" id="search_product" name="search" placeholder="Search Product">
+  <button type="button" class="btn btn-default btn-lg" id="submit_search"
+          onclick="window.location = '/products?search=' + encodeURIComponent(document.getElementById('search_product').value)"><i class="fa fa-search"></i>Search</button>
+</section>
+{products_section(title, products)}"""
+
+
+def product_detail_body(product):
+    return f"""<section>
+  <div class="product-details">
+    <div class="col-sm-7">
+      <div class="product-information">
+        <h2>{html.escape(product['name'])}</h2>
+        <p>Category: {html.escape(product['usertype'])} &gt; {html.escape(product['category'])}</p>
+        <span>
+          <span>{html.escape(product['price'])}</span>
+          <label>Quantity:</label>
+          <input type="number" id="quantity" name="quantity" value="1">
+          <button type="button" class="btn btn-default cart"
+                  onclick="addToCart({product['id']}, document.getElementById('quantity').value)"><i class="fa fa-shopping-cart"></i>Add to cart</button>
+        </span>
+        <p><b>Availability:</b> In Stock</p>
+        <p><b>Condition:</b> New</p>
+        <p><b>Brand:</b> {html.escape(product['brand'])}</p>
+      </div>
+    </div>
+  </div>
+</section>"""
+
+
+def cart_rows(cart):
+    rows = []
+    for product_id, quantity in cart.items():
+        product = find_product(product_id)
+        price = int(product['price'].split()[-1])
+        rows.append(f"""<tr id="product-{product['id']}">
+  <td class="cart_description"><h4><a href="/product_details/{product['id']}">{html.escape(product['name'])}</a></h4>
+    <p>{html.escape(product['usertype'])} &gt; {html.escape(product['category'])}</p></td>
+  <td class="cart_price"><p>{html.escape(product['price'])}</p></td>
+  <td class="cart_quantity"><button class="disabled">{quantity}</button></td>
+  <td class="cart_total"><p class="cart_total_price">Rs. {price * quantity}</p></td>
+</tr>""")
+    return "\n".join(rows)
+
+
+def cart_body(cart):
+    if not cart:
+        rows = '<tr><td colspan="4"><span id="empty_cart"><b>Cart is empty!</b></span></td></tr>'
+    else:
+        rows = cart_rows(cart)
+    return f"""<section id="cart_items">
+  <table class="table table-condensed" id="cart_info_table">
+    <thead><tr class="cart_menu"><td>Description</td><td>Price</td><td>Quantity</td><td>Total</td></tr></thead>
+    <tbody>{rows}</tbody>
+  </table>
+  <a href="/checkout" class="btn btn-default check_out">Proceed To Checkout</a>
+</section>"""
+
+
+def login_body(csrf, login_error="", signup_error=""):
+    return f"""<section id="form">
+  <div class="login-form">
+    <h2>Login to your account</h2>
+    <form action="/login" method="POST">
+      <input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+      <input type="email" data-qa="login-email" placeholder="Email Address" name="email" required>
+      <input type="password" data-qa="login-password" placeholder="Password" name="password" required>
+      {login_error}
+      <button type="submit" class="btn btn-default" data-qa="login-button">Login</button>
+    </form>
+  </div>
+  <h2 class="or">OR</h2>
+  <div class="signup-form">
+    <h2>New User Signup!</h2>
+    <form action="/signup" method="POST">
+      <input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+      <input type="text" data-qa="signup-name" placeholder="Name" name="name" required>
+      <input type="email" data-qa="signup-email" placeholder="Email Address" name="email" required>
+      {signup_error}
+      <button type="submit" class="btn btn-default" data-qa="signup-button">Signup</button>
+    </form>
+  </div>
+</section>"""
+
+
+def options_html(values):
+    return "".join(f'<option value="{html.escape(str(v))}">{html.escape(str(v))}</option>' for v in values)
+
+
+def signup_body(csrf, name, email):
+    days = options_html(range(1, 32))
+    months = "".join(f'<option value="{i}">{m}</option>' for i, m in enumerate(MONTHS, start=1))
+    years = options_html(range(2021, 1899, -1))
+    countries = options_html(COUNTRIES)
+    return f"""<section id="form">
+  <div class="login-form">
+    <h2 class="title text-center"><b>Enter Account Information</b></h2>
+    <form action="/signup" method="POST">
+      <input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+      <input type="hidden" name="form_type" value="create_account">
+      <input type="hidden" name="email" value="{html.escape(email)}">
+      <label><input type="radio" name="title" id="id_gender1" value="Mr"> Mr.</label>
+      <label><input type="radio" name="title" id="id_gender2" value="Mrs"> Mrs.</label>
+      <input data-qa="name" type="text" id="name" name="name" value="{html.escape(name)}">
+      <input data-qa="email" type="email" id="email" value="{html.escape(email)}" disabled>
+      <input data-qa="password" type="password" id="password" name="password">
+      <select data-qa="days" id="days" name="days">{days}</select>
+      <select data-qa="months" id="months" name="months">{months}</select>
+      <select data-qa="years" id="years" name="years">{years}</select>
+      <label><input type="checkbox" name="newsletter" id="newsletter" value="1"> Sign up for our newsletter!</label>
+      <label><input type="checkbox" name="optin" id="optin" value="1"> Receive special offers from our partners!</label>
+      <h2 class="title text-center"><b>Address Information</b></h2>
+      <input data-qa="first_name" type="text" id="first_name" name="first_name">
+      <input data-qa="last_name" type="text" id="last_name" name="last_name">
+      <input data-qa="company" type="text" id="company" name="company">
+      <input data-qa="address" type="text" id="address1" name="address1">
+      <input data-qa="address2" type="text" id="address2" name="address2">
+      <select data-qa="country" id="country" name="country">{countries}</select>
+      <input data-qa="state" type="text" id="state" name="state">
+      <input data-qa="city" type="text" id="city" name="city">
+      <input data-qa="zipcode" type="text" id="zipcode" name="zipcode">
+      <input data-qa="mobile_number" type="text" id="mobile_number" name="mobile_number">
+      <button type="submit" data-qa="create-account" class="btn btn-default">Create Account</button>
+    </form>
+  </div>
+</section>"""
+
+
+def message_body(qa_name, title, text):
+    return f"""<section id="form">
+  <h2 class="title text-center" data-qa="{qa_name}"><b>{title}</b></h2>
+  <p>{text}</p>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+
+
+def checkout_body(user, cart):
+    return f"""<section id="cart_items">
+  <div class="step-one"><h2 class="heading">Address Details</h2></div>
+  <ul id="address_delivery"><li class="address_firstname address_lastname">{html.escape(user['name'])}</li></ul>
+  <div class="step-one"><h2 class="heading">Review Your Order</h2></div>
+  <table class="table table-condensed" id="cart_info_table"><tbody>{cart_rows(cart)}</tbody></table>
+  <div id="ordermsg"><label>If you would like to add a comment about your order, please write it in the field below.</label>
+    <textarea name="message" class="form-control" rows="6"></textarea></div>
+  <a href="/payment" class="btn btn-default check_out">Place Order</a>
+</section>"""
+
+
+def payment_body(csrf):
+    return f"""<section id="cart_items">
+  <h2 class="heading">Payment</h2>
+  <form id="payment-form" action="/payment" method="POST">
+    <input type="hidden" name="csrfmiddlewaretoken" value="{csrf}">
+    <input type="text" name="name_on_card" data-qa="name-on-card">
+    <input type="text" name="card_number" data-qa="card-number">
+    <input type="text" name="cvc" data-qa="cvc" placeholder="ex. 311">
+    <input type="text" name="expiry_month" data-qa="expiry-month" placeholder="MM">
+    <input type="text" name="expiry_year" data-qa="expiry-year" placeholder="YYYY">
+    <button id="submit" data-qa="pay-button" type="submit" class="form-control btn btn-primary submit-button">Pay and Confirm Order</button>
+  </form>
+</section>"""
+
+
+def payment_done_body():
+    return """<section id="form">
+  <h2 class="title text-center" data-qa="order-placed"><b>Order Placed!</b></h2>
+  <p style="font-size: 20px;">Congratulations! Your order has been confirmed!</p>
+  <a href="/download_invoice" class="btn btn-default check_out">Download Invoice</a>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+
+
+def contact_body(submitted):
+    if submitted:
+        return """<div class="contact-form">
+  <h2 class="title text-center">Get In Touch</h2>
+  <div class="status alert alert-success">Success! Your details have been submitted successfully.</div>
+  <a href="/" class="btn btn-success"><span><i class="fa fa-angle-double-left"></i> Home</span></a>
+</div>"""
+    return """<div class="contact-form">
+  <h2 class="title text-center">Get In Touch</h2>
+  <form id="contact-us-form" action="/contact_us" method="post" enctype="multipart/form-data"
+        onsubmit="return confirm('Press OK to proceed!');">
+    <input type="text" data-qa="name" name="name" placeholder="Name">
+    <input type="email" data-qa="email" name="email" placeholder="Email" required>
+    <input type="text" data-qa="subject" name="subject" placeholder="Subject">
+    <textarea data-qa="message" name="message" id="message" rows="8" placeholder="Your Message Here"></textarea>
+    <input type="file" name="upload_file">
+    <input type="submit" data-qa="submit-button" name="submit" class="btn btn-primary submit_form" value="Submit">
+  </form>
+</div>"""
+
+
+def find_product(product_id):
+    for product in PRODUCTS:
+        if str(product['id']) == str(product_id):
+            return product
+    return None
+
+
+# ------------------------------------------------------------ request handler
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    server_version = "LocalAutomationExercise/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # Set per server class in LocalSiteServer
+    state = None
+
+    def setup(self):
+        super().setup()
+        # Headers and body are separate writes, without this Nagle adds ~40ms per response
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        # Keep test output clean
+        pass
+
+    # HTTP verbs
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        self.query = parse_qs(url.query, keep_blank_values=True)
+        self.form = self._read_form()
+        self.new_cookies = {}
+        self._load_session()
+
+        path = url.path.rstrip("/") or "/"
+        try:
+            if path.startswith("/api/"):
+                self._handle_api(method, path[len("/api/"):])
+            else:
+                self._handle_page(method, path)
+        except Exception as e:
+            self._send(500, f"Internal error: {e}", "text/plain")
+
+    # Request helpers
+    def _read_form(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b""
+        content_type = self.headers.get('Content-Type', "")
+        if not body:
+            return {}
+        if content_type.startswith("application/json"):
+            try:
+                return {k: str(v) for k, v in json.loads(body).items()}
+            except (ValueError, AttributeError):
+                return {}
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            return {k: v[-1] for k, v in parse_qs(body.decode("utf-8"), keep_blank_values=True).items()}
+        # Multipart uploads (contact form) are accepted but not parsed
+        return {}
+
+    def _load_session(self):
+        cookies = SimpleCookie(self.headers.get('Cookie', ""))
+        session_id = cookies['sessionid'].value if 'sessionid' in cookies else None
+        with self.state.lock:
+            if session_id not in self.state.sessions:
+                session_id = self.state.new_session()
+                self.new_cookies['sessionid'] = session_id
+            self.session = self.state.sessions[session_id]
+        if 'csrftoken' not in cookies:
+            self.new_cookies['csrftoken'] = self.session['csrf']
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for name, value in self.new_cookies.items():
+            self.send_header('Set-Cookie', f"{name}={value}; Path=/; SameSite=Lax")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    def _send_json(self, data):
+        # The real API always answers HTTP 200 and puts the status in responseCode
+        self._send(200, json.dumps(data), API_RESPONSE_HEADERS['Content-Type'])
+
+    def _redirect(self, location):
+        self._send(302, "", headers={'Location': location})
+
+    def _render(self, title, body, status=200):
+        user = self.session['user']
+        account_links = LOGGED_IN_LINKS.format(name=html.escape(user['name'])) if user else LOGGED_OUT_LINKS
+        self._send(status, PAGE_TEMPLATE.format(title=title, account_links=account_links, body=body))
+
+    # API endpoints
+    def _handle_api(self, method, endpoint):
+        handler = {
+            'productsList': self._api_products_list,
+            'brandsList': self._api_brands_list,
+            'searchProduct': self._api_search_product,
+            'createAccount': self._api_create_account,
+            'verifyLogin': self._api_verify_login,
+            'deleteAccount': self._api_delete_account,
+        }.get(endpoint)
+        if handler is None:
+            self._send(404, "<h1>Not Found</h1><p>The requested resource was not found on this server.</p>")
+            return
+        handler(method)
+
+    def _api_products_list(self, method):
+        if method != "GET":
+            return self._send_json({'responseCode': 405, 'message': METHOD_NOT_SUPPORTED})
+        self._send_json({'responseCode': 200, 'products': [product_json(p) for p in PRODUCTS]})
+
+    def _api_brands_list(self, method):
+        if method != "GET":
+            return self._send_json({'responseCode': 405, 'message': METHOD_NOT_SUPPORTED})
+        brands = [{'id': i, 'brand': name} for i, name in enumerate(BRANDS, start=1)]
+        self._send_json({'responseCode': 200, 'brands': brands})
+
+    def _api_search_product(self, method):
+        if method != "POST":
+            return self._send_json({'responseCode': 405, 'message': METHOD_NOT_SUPPORTED})
+        if 'search_product' not in self.form:
+            return self._send_json({'responseCode': 400,
+                                    'message': "Bad request, search_product parameter is missing in POST request."})
+        products = search_products(self.form['search_product'])
+        self._send_json({'responseCode': 200, 'products': [product_json(p) for p in products]})
+
+    def _api_create_account(self, method):
+        if method != "POST":
+            return self._send_json({'responseCode': 405, 'message': METHOD_NOT_SUPPORTED})
+        for field in ('name', 'email', 'password'):
+            if not self.form.get(field):
+                return self._send_json({'responseCode': 400,
+                                        'message': f"Bad request, {field} parameter is missing in POST request."})
+        with self.state.lock:
+            if self.form['email'] in self.state.users:
+                return self._send_json({'responseCode': 400, 'message': "Email already exists!"})
+            self.state.users[self.form['email']] = dict(self.form)
+        self._send_json({'responseCode': 201, 'message': "User created!"})
+
+    def _api_verify_login(self, method):
+        if method != "POST":
+            return self._send_json({'responseCode': 405, 'message': METHOD_NOT_SUPPORTED})
+        if not self.form.get('email') or not self.form.get('password'):
+            return self._send_json({'responseCode': 400,
+                                    'message': "Bad request, email or password parameter is missing in POST request."})
+        user = self.state.users.get(self.form['email'])
+        if user and user['password'] == self.form['password']:
+            return self._send_json({'responseCode': 200, 'message': "User exists!"})
+        self._send_json({'responseCode': 404, 'message': "User not found!"})
+
+    def _api_delete_account(self, method):
+        if method != "DELETE":
+            return self._send_json({'responseCode': 405, 'message': METHOD_NOT_SUPPORTED})
+        with self.state.lock:
+            user = self.state.users.get(self.form.get('email'))
+            if user and user['password'] == self.form.get('password'):
+                del self.state.users[user['email']]
+                return self._send_json({'responseCode': 200, 'message': "Account deleted!"})
+        self._send_json({'responseCode': 404, 'message': "Account not found!"})
+
+    # HTML pages
+    def _handle_page(self, method, path):
+        user = self.session['user']
+        csrf = self.session['csrf']
+
+        if path == "/":
+            return self._render("Automation Exercise", home_body())
+        if path == "/products":
+            search = self.query.get('search', [None])[0]
+            return self._render("Automation Exercise - All Products", products_body(search))
+
+        match = re.fullmatch(r"/product_details/(\d+)", path)
+        if match:
+            product = find_product(match.group(1))
+            if product is None:
+                return self._render("Automation Exercise", "<h2>Product not found</h2>", status=404)
+            return self._render("Automation Exercise - Product Details", product_detail_body(product))
+
+        match = re.fullmatch(r"/add_to_cart/(\d+)", path)
+        if match and find_product(match.group(1)):
+            quantity = self.query.get('quantity', ["1"])[0] or "1"
+            if not quantity.isdecimal() or int(quantity) < 1:
+                return self._send(400, "Bad Request", "text/plain")
+            quantity = int(quantity)
+            cart = self.session['cart']
+            cart[match.group(1)] = cart.get(match.group(1), 0) + quantity
+            return self._send(200, "Added To Cart", "text/plain")
+
+        if path == "/view_cart":
+            return self._render("Automation Exercise - Checkout", cart_body(self.session['cart']))
+
+        if path == "/login":
+            if method == "POST":
+                account = self.state.users.get(self.form.get('email'))
+                if account and account['password'] == self.form.get('password'):
+                    self.session['user'] = account
+                    return self._redirect("/")
+                error = '<p style="color: red;">Your email or password is incorrect!</p>'
+                return self._render("Automation Exercise - Signup / Login", login_body(csrf, login_error=error))
+            return self._render("Automation Exercise - Signup / Login", login_body(csrf))
+
+        if path == "/signup" and method == "POST":
+            return self._signup()
+
+        if path == "/logout":
+            self.session['user'] = None
+            return self._redirect("/login")
+
+        if path == "/delete_account":
+            if user is None:
+                return self._redirect("/login")
+            with self.state.lock:
+                self.state.users.pop(user['email'], None)
+            self.session['user'] = None
+            return self._render("Automation Exercise - Account Deleted",
+                                message_body("account-deleted", "Account Deleted!",
+                                             "Your account has been permanently deleted!"))
+
+        if path == "/checkout":
+            if user is None:
+                return self._redirect("/login")
+            return self._render("Automation Exercise - Checkout", checkout_body(user, self.session['cart']))
+
+        if path == "/payment":
+            if user is None:
+                return self._redirect("/login")
+            if method == "POST":
+                self.session['cart'] = {}
+                return self._redirect("/payment_done/500")
+            return self._render("Automation Exercise - Payment", payment_body(csrf))
+
+        if path.startswith("/payment_done"):
+            return self._render("Automation Exercise - Order Placed", payment_done_body())
+
+        if path == "/contact_us":
+            return self._render("Automation Exercise - Contact Us", contact_body(submitted=method == "POST"))
+
+        self._render("Automation Exercise", "<h2>Page not found</h2>", status=404)
+
+    def _signup(self):
+        csrf = self.session['csrf']
+        email = self.form.get('email', "")
+
+        if self.form.get('form_type') != "create_account":
+            # First step: name and email from the login page
+            if email in self.state.users:
+                error = '<p style="color: red;">Email Address already exist!</p>'
+                return self._render("Automation Exercise - Signup / Login", login_body(csrf, signup_error=error))
+            return self._render("Automation Exercise - Signup", signup_body(csrf, self.form.get('name', ""), email))
+
+        account = dict(self.form)
+        with self.state.lock:
+            # Same answer as the first step when the email was registered in the meantime
+            duplicate = email in self.state.users
+            if not duplicate:
+                self.state.users[email] = account
+        if duplicate:
+            error = '<p style="color: red;">Email Address already exist!</p>'
+            return self._render("Automation Exercise - Signup / Login", login_body(csrf, signup_error=error))
+        self.session['user'] = account
+        self._render("Automation Exercise - Account Created",
+                     message_body("account-created", "Account Created!",
+                                  "Congratulations! Your new account has been successfully created!"))
+
+
+class LocalSiteServer:
+    """Runs the stand-in site on a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        handler = type("BoundSiteRequestHandler", (SiteRequestHandler,), {'state': SiteState()})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="local-site-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for automationexercise.com")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    cli_args = parser.parse_args()
+
+    server = LocalSiteServer(cli_args.host, cli_args.port)
+    print(f"Serving local automationexercise.com stand-in on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.httpd.server_close()
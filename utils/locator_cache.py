@@ -0,0 +1,81 @@
+# utils/locator_cache.py
+import json
+import os
+import threading
+from utils.config import get_setting, get_cache_dir
+
+
+class LocatorGroup:
+    """Named list of alternative locators for the same element.
+
+    The name is the key in the locator cache, so keep it unique per element,
+    e.g. LocatorGroup("CartPage.quantity", PRIMARY, ALT_1, ALT_2).
+    """
+
+    def __init__(self, name, *locators):
+        self.name = name
+        self.locators = list(locators)
+
+    def __iter__(self):
+        return iter(self.locators)
+
+    def __repr__(self):
+        return f"LocatorGroup({self.name!r}, {len(self.locators)} locators)"
+
+
+class LocatorCache:
+    """Persistent map of locator group name -> locator that matched last time"""
+
+    def __init__(self, path=None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._winners = None
+
+    @property
+    def path(self):
+        # Resolved lazily so settings made by conftest.py are picked up
+        if self._path is None:
+            self._path = get_setting("LOCATOR_CACHE_FILE", os.path.join(get_cache_dir(), "locator_cache.json"))
+        return self._path
+
+    def _load(self):
+        if self._winners is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._winners = json.load(f)
+            except (OSError, ValueError):
+                self._winners = {}
+        return self._winners
+
+    def ordered(self, group):
+        # Alternatives with the last winner first
+        with self._lock:
+            winner = self._load().get(group.name)
+        if winner is None:
+            return list(group.locators)
+        winner = tuple(winner)
+        return sorted(group.locators, key=lambda locator: tuple(locator) != winner)
+
+    def record(self, group, locator):
+        # Remember the winning locator, written to disk only when it changes
+        with self._lock:
+            winners = self._load()
+            if winners.get(group.name) == list(locator):
+                return
+            winners[group.name] = list(locator)
+            snapshot = dict(winners)
+        self._save(snapshot)
+
+    def _save(self, winners):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(winners, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not save locator cache: {e}")
+
+
+# Shared by all page objects in this process
+locator_cache = LocatorCache()
@@ -0,0 +1,122 @@
+# utils/page_timing.py
+"""Navigation and Resource Timing per test and step.
+
+BasePage records the timing of every new document once it is ready. Entries
+are grouped by test and written to reports/page_timings.json; conftest.py
+adds a summary to the pytest-html report. Optional budgets (milliseconds)
+fail the test when a page is slower:
+
+    PERF_BUDGET_TTFB_MS=800 PERF_BUDGET_DCL_MS=2000 PERF_BUDGET_LOAD_MS=4000
+"""
+import html
+import json
+import os
+import threading
+from utils.config import get_bool_setting, get_int_setting
+
+# Timing of the current document, None before the navigation entry exists
+PAGE_TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav || !nav.loadEventEnd || nav.name.indexOf('about:') === 0) { return null; }
+var resources = performance.getEntriesByType('resource').map(function (r) {
+  return {name: r.name, type: r.initiatorType, duration: Math.round(r.duration),
+          transferSize: r.transferSize || 0, bodySize: r.encodedBodySize || 0};
+});
+resources.sort(function (a, b) { return (b.transferSize || b.bodySize) - (a.transferSize || a.bodySize); });
+return {
+  document: performance.timeOrigin + '|' + nav.name,
+  url: nav.name,
+  type: nav.type,
+  ttfb_ms: Math.round(nav.responseStart - nav.startTime),
+  dom_content_loaded_ms: Math.round(nav.domContentLoadedEventEnd - nav.startTime),
+  load_ms: Math.round(nav.loadEventEnd - nav.startTime),
+  transfer_size: nav.transferSize || 0,
+  resource_count: resources.length,
+  resource_bytes: resources.reduce(function (sum, r) { return sum + r.transferSize; }, 0),
+  largest_resources: resources.slice(0, arguments[0])
+};
+"""
+
+# Timing field -> budget setting
+BUDGETS = {
+    'ttfb_ms': "PERF_BUDGET_TTFB_MS",
+    'dom_content_loaded_ms': "PERF_BUDGET_DCL_MS",
+    'load_ms': "PERF_BUDGET_LOAD_MS",
+}
+
+DEFAULT_REPORT_FILE = "reports/page_timings.json"
+
+
+def page_budgets():
+    # Only budgets that are set (> 0) are checked
+    budgets = {field: get_int_setting(setting, 0) for field, setting in BUDGETS.items()}
+    return {field: limit for field, limit in budgets.items() if limit > 0}
+
+
+def is_enabled():
+    return get_bool_setting("PAGE_TIMING", True)
+
+
+class PageTimingRecorder:
+    """Collects page timings for the running test"""
+
+    def __init__(self):
+        self.current_test = None
+        self.results = {}
+        self._last_document = None
+        self._lock = threading.Lock()
+
+    def start_test(self, test_id):
+        with self._lock:
+            self.current_test = test_id
+            self._last_document = None
+
+    def finish_test(self):
+        with self._lock:
+            self.current_test = None
+
+    def capture(self, driver, step=None):
+        """Record the current document once, returns the timing or None"""
+        if self.current_test is None:
+            return None
+        timing = driver.execute_script(PAGE_TIMING_JS, get_int_setting("PERF_LARGEST_RESOURCES", 5))
+        if not timing or timing['document'] == self._last_document:
+            return None
+        self._last_document = timing.pop('document')
+        timing['step'] = step or timing['url']
+        timing['budget_violations'] = [
+            f"{field} {timing[field]}ms > {limit}ms"
+            for field, limit in page_budgets().items() if timing[field] > limit
+        ]
+        with self._lock:
+            self.results.setdefault(self.current_test, []).append(timing)
+        return timing
+
+    def timings(self, test_id):
+        return self.results.get(test_id, [])
+
+    def budget_violations(self, test_id):
+        return [f"{timing['step']}: {violation}"
+                for timing in self.timings(test_id) for violation in timing['budget_violations']]
+
+    def write(self, path=DEFAULT_REPORT_FILE):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'budgets': page_budgets(), 'tests': self.results}, f, indent=2)
+        return path
+
+
+def timing_summary_html(timings):
+    # Small table for the pytest-html report
+    rows = "".join(
+        f"<tr><td>{html.escape(timing['step'])}</td><td>{timing['ttfb_ms']}</td><td>{timing['dom_content_loaded_ms']}</td>"
+        f"<td>{timing['load_ms']}</td><td>{timing['resource_count']}</td>"
+        f"<td>{timing['resource_bytes'] // 1024}</td><td>{', '.join(timing['budget_violations'])}</td></tr>"
+        for timing in timings
+    )
+    return ("<table><tr><th>Step</th><th>TTFB ms</th><th>DOMContentLoaded ms</th><th>Load ms</th>"
+            f"<th>Resources</th><th>KiB</th><th>Budget</th></tr>{rows}</table>")
+
+
+# Shared by BasePage and conftest.py
+page_timings = PageTimingRecorder()
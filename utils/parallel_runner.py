@@ -0,0 +1,186 @@
+# utils/parallel_runner.py
+import html
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from utils.sharding import DEFAULT_DURATIONS_FILE, load_durations, save_durations
+
+SHARD_DIR = "reports/shards"
+
+# pytest-html result label -> summary label
+HTML_RESULT_LABELS = {
+    'failed': "Failed",
+    'passed': "Passed",
+    'skipped': "Skipped",
+    'xfailed': "Expected failures",
+    'xpassed': "Unexpected passes",
+    'error': "Errors",
+    'rerun': "Reruns",
+}
+
+
+def shard_file(kind, index, extension):
+    return os.path.join(SHARD_DIR, f"{kind}_{index}.{extension}")
+
+
+def run_shards(args, workers, html_path=None, junit_path=None, durations_file=DEFAULT_DURATIONS_FILE):
+    """Run the suite in `workers` pytest subprocesses and merge their results.
+
+    Every worker collects the whole suite and keeps only its own shard (see
+    pytest_collection_modifyitems in conftest.py), so no test list has to be
+    passed around. Returns the combined pytest exit code.
+    """
+    # A worker that fails early must not leave the previous run's files to be merged
+    shutil.rmtree(SHARD_DIR, ignore_errors=True)
+    os.makedirs(SHARD_DIR, exist_ok=True)
+    start = time.perf_counter()
+    processes = []
+
+    for index in range(workers):
+        worker_args = [sys.executable, "-m", "pytest", *args]
+        # Later options override the user's ones, each shard gets its own files
+        if html_path:
+            worker_args += [f"--html={shard_file('report', index, 'html')}", "--self-contained-html"]
+        if junit_path:
+            worker_args += [f"--junitxml={shard_file('junit', index, 'xml')}"]
+
+        env = dict(os.environ, SHARD_INDEX=str(index), SHARD_COUNT=str(workers), SHARD_COORDINATED="1")
+        log = open(shard_file('shard', index, 'log'), 'w', encoding='utf-8')
+        process = subprocess.Popen(worker_args, stdout=log, stderr=subprocess.STDOUT, env=env)
+        processes.append((index, process, log))
+
+    print(f"🚀 Started {workers} workers, logs in {SHARD_DIR}/")
+
+    exit_codes = []
+    for index, process, log in processes:
+        exit_codes.append(process.wait())
+        log.close()
+        print(f"   shard {index}: exit code {exit_codes[-1]} ({_last_line(shard_file('shard', index, 'log'))})")
+
+    elapsed = time.perf_counter() - start
+    merge_durations(workers, durations_file)
+    if html_path:
+        merge_html_reports([shard_file('report', i, 'html') for i in range(workers)], html_path, elapsed)
+        print(f"📊 Merged HTML report: {html_path}")
+    if junit_path:
+        merge_junit_reports([shard_file('junit', i, 'xml') for i in range(workers)], junit_path)
+        print(f"📄 Merged JUnit report: {junit_path}")
+    print(f"⏱️ Parallel run finished in {elapsed:.1f}s")
+
+    return combine_exit_codes(exit_codes)
+
+
+def combine_exit_codes(exit_codes):
+    # 5 (no tests collected) only counts when every shard was empty
+    relevant = [code for code in exit_codes if code != 5]
+    if not relevant:
+        return 5
+    return max(relevant)
+
+
+def merge_durations(workers, durations_file=DEFAULT_DURATIONS_FILE):
+    # Fold the per-shard durations into the shared durations file
+    merged = {}
+    for index in range(workers):
+        merged.update(load_durations(shard_file('durations', index, 'json')))
+    if merged:
+        save_durations(merged, durations_file)
+    return merged
+
+
+def _last_line(path):
+    try:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            lines = [line.strip() for line in f if line.strip()]
+        return lines[-1] if lines else "no output"
+    except OSError:
+        return "no log"
+
+
+def _read_jsonblob(report_html):
+    match = re.search(r'data-jsonblob="([^"]*)"', report_html)
+    if not match:
+        return None
+    return json.loads(html.unescape(match.group(1)))
+
+
+def merge_html_reports(paths, output_path, elapsed):
+    """Merge self-contained pytest-html 4 reports into one report.
+
+    The first shard report is used as the template; its embedded test data
+    and the summary counts are replaced with the combined values.
+    """
+    template = None
+    merged = None
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            report_html = f.read()
+        data = _read_jsonblob(report_html)
+        if data is None:
+            continue
+        if merged is None:
+            template, merged = report_html, data
+        else:
+            merged['tests'].update(data['tests'])
+
+    if merged is None:
+        print("⚠️ No shard HTML reports to merge")
+        return None
+
+    counts = {result: 0 for result in HTML_RESULT_LABELS}
+    for results in merged['tests'].values():
+        for result in results:
+            key = result['result'].lower()
+            if key in counts:
+                counts[key] += 1
+
+    blob = html.escape(json.dumps(merged), quote=True)
+    report_html = re.sub(r'data-jsonblob="[^"]*"', lambda m: f'data-jsonblob="{blob}"', template, count=1)
+
+    test_count = len(merged['tests'])
+    hours, remainder = divmod(int(elapsed), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    report_html = re.sub(
+        r'<p class="run-count">.*?</p>',
+        f'<p class="run-count">{test_count} tests took {hours:02d}:{minutes:02d}:{seconds:02d} '
+        f'({len(paths)} parallel workers).</p>',
+        report_html, count=1,
+    )
+    for result in HTML_RESULT_LABELS:
+        report_html = re.sub(
+            rf'(<span class="{result}">)\d+ ',
+            lambda m: f"{m.group(1)}{counts[result]} ",
+            report_html, count=1,
+        )
+        disabled = " disabled" if counts[result] == 0 else " "
+        report_html = re.sub(
+            rf'(data-test-result="{result}")\s*(disabled)?\s*/>',
+            lambda m: f"{m.group(1)}{disabled}/>",
+            report_html, count=1,
+        )
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(report_html)
+    return output_path
+
+
+def merge_junit_reports(paths, output_path):
+    # Put every shard's <testsuite> under one <testsuites> root
+    root = ET.Element("testsuites")
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        shard_root = ET.parse(path).getroot()
+        suites = [shard_root] if shard_root.tag == "testsuite" else list(shard_root)
+        root.extend(suites)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    ET.ElementTree(root).write(output_path, encoding="utf-8", xml_declaration=True)
+    return output_path
@@ -0,0 +1,217 @@
+# utils/request_blocking.py
+"""Drop ads, analytics, web fonts and (optionally) images in Chrome.
+
+Blocking uses CDP Network.setBlockedURLs, set once per browser by
+create_driver(). Selenium's execute_cdp_cmd cannot receive Fetch.requestPaused
+events, so the allow list is applied to the patterns instead: a deny pattern
+containing an ALLOW_URLS entry is not sent to Chrome.
+
+Blocked requests are read from Chrome's performance log after every test.
+Bytes saved are estimated from the sizes those URLs had when they last loaded
+(learned in runs with BLOCK_REQUESTS=none, or for categories not blocked),
+kept in CACHE_DIR/resource_sizes.json.
+"""
+import json
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+from utils.config import get_cache_dir, get_setting
+
+# Category -> Network.setBlockedURLs patterns ('*' is the only wildcard)
+BLOCK_CATEGORIES = {
+    'ads': [
+        "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+        "*adservice.google.*", "*amazon-adsystem.com*", "*adnxs.com*", "*criteo.*",
+        "*taboola.com*", "*outbrain.com*", "*pubmatic.com*", "*rubiconproject.com*",
+        "*fundingchoicesmessages.google.com*",
+    ],
+    'analytics': [
+        "*google-analytics.com*", "*googletagmanager.com*", "*analytics.google.com*",
+        "*facebook.net*", "*connect.facebook.*", "*hotjar.com*", "*clarity.ms*",
+        "*scorecardresearch.com*",
+    ],
+    'fonts': [
+        "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*use.typekit.net*",
+        "*.woff", "*.woff2", "*.woff?*", "*.woff2?*", "*.ttf", "*.otf", "*.eot",
+    ],
+    'images': [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.png?*", "*.jpg?*", "*.jpeg?*", "*.gif?*", "*.webp?*",
+    ],
+}
+
+DEFAULT_BLOCK_CATEGORIES = "ads,analytics,fonts"
+
+
+def _split(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def blocking_settings():
+    """(categories, extra deny patterns, allow entries) from BLOCK_REQUESTS, BLOCK_URLS, ALLOW_URLS"""
+    categories = _split(get_setting("BLOCK_REQUESTS", ""))
+    if categories == ["default"]:
+        categories = _split(DEFAULT_BLOCK_CATEGORIES)
+    unknown = [name for name in categories if name not in BLOCK_CATEGORIES and name != "none"]
+    if unknown:
+        raise ValueError(f"Unknown BLOCK_REQUESTS categories: {', '.join(unknown)}")
+    return ([name for name in categories if name != "none"],
+            _split(get_setting("BLOCK_URLS", "")), _split(get_setting("ALLOW_URLS", "")))
+
+
+def is_enabled():
+    # Blocking or just monitoring (BLOCK_REQUESTS=none) needs the performance log
+    return bool(get_setting("BLOCK_REQUESTS") or get_setting("BLOCK_URLS"))
+
+
+def blocked_patterns(categories, extra=(), allow=()):
+    patterns = [pattern for name in categories for pattern in BLOCK_CATEGORIES[name]] + list(extra)
+    return [pattern for pattern in patterns if not any(entry in pattern for entry in allow)]
+
+
+def _pattern_regex(pattern):
+    # Same matching as Chrome's blocked URL patterns: '*' matches anything, the rest is literal
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")) + r"\Z")
+
+
+CATEGORY_REGEXES = {name: [_pattern_regex(pattern) for pattern in patterns]
+                    for name, patterns in BLOCK_CATEGORIES.items()}
+
+
+def categorize(url):
+    # First category whose patterns match url, None for other resources
+    for name, regexes in CATEGORY_REGEXES.items():
+        if any(regex.match(url) for regex in regexes):
+            return name
+    return None
+
+
+def apply_blocking(driver):
+    """Send the configured blocklist to a new browser, returns the patterns"""
+    categories, extra, allow = blocking_settings()
+    patterns = blocked_patterns(categories, extra, allow)
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        if patterns:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {'urls': patterns})
+    except (AttributeError, WebDriverException) as e:
+        print(f"⚠️ Request blocking not available: {e}")
+        return []
+    return patterns
+
+
+def _size_key(url):
+    # Sizes are remembered per URL without query string
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+class ResourceSizes:
+    """Last seen transfer size per resource URL, used to estimate bytes saved"""
+
+    def __init__(self, path=None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._sizes = None
+        self._dirty = False
+
+    @property
+    def path(self):
+        # Resolved lazily so settings made by conftest.py are picked up
+        if self._path is None:
+            self._path = get_setting("RESOURCE_SIZES_FILE", os.path.join(get_cache_dir(), "resource_sizes.json"))
+        return self._path
+
+    def _load(self):
+        if self._sizes is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._sizes = json.load(f)
+            except (OSError, ValueError):
+                self._sizes = {}
+        return self._sizes
+
+    def get(self, url):
+        with self._lock:
+            return self._load().get(_size_key(url))
+
+    def learn(self, url, size):
+        with self._lock:
+            sizes = self._load()
+            key = _size_key(url)
+            if size and sizes.get(key) != size:
+                sizes[key] = size
+                self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._sizes, f, indent=1, sort_keys=True)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Could not save resource sizes: {e}")
+
+
+resource_sizes = ResourceSizes()
+
+
+def collect_network_stats(driver):
+    """Drain the performance log and summarize blocked and loaded requests"""
+    stats = {'blocked_requests': 0, 'blocked_by_category': {}, 'bytes_saved': 0,
+             'blocked_unknown_size': 0, 'loaded_requests': 0, 'bytes_loaded': 0}
+    try:
+        entries = driver.get_log("performance")
+    except (AttributeError, WebDriverException):
+        return stats
+
+    # Chrome also blocks requests for its own reasons (CSP, mixed content), only ours count
+    blocked_regexes = [_pattern_regex(pattern) for pattern in blocked_patterns(*blocking_settings())]
+
+    urls = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError):
+            continue
+        method, params = message.get('method'), message.get('params', {})
+        if method == "Network.requestWillBeSent":
+            urls[params['requestId']] = params['request']['url']
+        elif method == "Network.loadingFinished":
+            url = urls.get(params['requestId'])
+            size = int(params.get('encodedDataLength', 0))
+            stats['loaded_requests'] += 1
+            stats['bytes_loaded'] += size
+            if url and categorize(url):
+                resource_sizes.learn(url, size)
+        elif method == "Network.loadingFailed" and params.get('blockedReason'):
+            url = urls.get(params['requestId'], "")
+            if not any(regex.match(url) for regex in blocked_regexes):
+                continue
+            category = categorize(url) or "custom"
+            stats['blocked_requests'] += 1
+            stats['blocked_by_category'][category] = stats['blocked_by_category'].get(category, 0) + 1
+            size = resource_sizes.get(url) if url else None
+            if size is None:
+                stats['blocked_unknown_size'] += 1
+            else:
+                stats['bytes_saved'] += size
+    return stats
+
+
+def write_blocking_report(results, path):
+    # {nodeid: stats} for this run, plus totals
+    totals = {key: sum(stats[key] for stats in results.values())
+              for key in ('blocked_requests', 'bytes_saved', 'blocked_unknown_size', 'bytes_loaded')}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'totals': totals, 'tests': results}, f, indent=2)
+    resource_sizes.save()
+    return totals
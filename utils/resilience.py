@@ -0,0 +1,273 @@
+# utils/resilience.py
+"""Opt-in retries and circuit breaking for APIClient (API_RETRIES=N).
+
+ResilientAdapter sits between APIClient (and its cassette) and the shared
+transport. Only idempotent methods (API_RETRY_METHODS, default GET, HEAD,
+OPTIONS) are retried, and only after a dropped connection, a timeout or a
+transient status (API_RETRY_STATUSES, default 429, 502, 503, 504). Other
+errors, including plain 500s, reach the test unchanged so real regressions
+still fail.
+
+- Backoff: full jitter, random(0, min(API_RETRY_BACKOFF_MAX, API_RETRY_BACKOFF * 2**attempt)),
+  or the server's Retry-After (capped at the same maximum).
+- Budget: every request adds API_RETRY_BUDGET (default 0.2) retry tokens to
+  a bucket that starts with and holds at most API_RETRY_RESERVE (default 10).
+  When it is empty, failures are returned without retrying, so an outage
+  cannot multiply the load.
+- Circuit breaker per endpoint: API_BREAKER_THRESHOLD consecutive transient
+  failures (default 5, 0 disables) open it. Calls then fail at once with
+  CircuitOpenError for API_BREAKER_RESET seconds (default 30), after which
+  one trial call decides whether it closes again.
+
+resilience_stats() returns the counters; conftest.py prints them in the
+terminal summary.
+"""
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import BaseAdapter
+from utils.config import get_int_setting, get_setting
+
+DEFAULT_RETRY_METHODS = "GET,HEAD,OPTIONS"
+DEFAULT_RETRY_STATUSES = "429,502,503,504"
+
+# Network failures worth another attempt on an idempotent request
+TRANSIENT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """The endpoint failed too often recently, the call was not sent"""
+
+
+def is_enabled():
+    return get_int_setting("API_RETRIES", 0) > 0
+
+
+def _float_setting(name, default):
+    try:
+        return float(get_setting(name, default))
+    except ValueError:
+        print(f"Invalid number for {name}: {get_setting(name)!r}, using {default}")
+        return default
+
+
+class RetryBudget:
+    """Token bucket that caps retries to a share of all requests"""
+
+    def __init__(self, ratio=0.2, reserve=10):
+        self.ratio = ratio
+        self.reserve = float(reserve)
+        self.tokens = self.reserve
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """closed -> open after `threshold` consecutive failures -> half-open after `reset_seconds`"""
+
+    def __init__(self, threshold=5, reset_seconds=30.0):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = "half-open"
+            if self.state == "half-open" and not self._trial_running:
+                # One trial call at a time decides whether the endpoint recovered
+                self._trial_running = True
+                return True
+            return False
+
+    def release(self):
+        # The call ended without a verdict (unexpected error), let the next one try
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        # Returns True when this failure opened the breaker
+        with self._lock:
+            self._trial_running = False
+            self.failures += 1
+            if self.state == "half-open" or (self.state == "closed" and self.failures >= self.threshold):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class Resilience:
+    """Retry policy, budget, breakers and metrics shared by every APIClient in the process"""
+
+    def __init__(self, retries=None):
+        self.retries = get_int_setting("API_RETRIES", 0) if retries is None else retries
+        self.methods = {method.strip().upper() for method in
+                        get_setting("API_RETRY_METHODS", DEFAULT_RETRY_METHODS).split(",") if method.strip()}
+        self.statuses = {int(status) for status in
+                         get_setting("API_RETRY_STATUSES", DEFAULT_RETRY_STATUSES).split(",") if status.strip()}
+        self.backoff = _float_setting("API_RETRY_BACKOFF", 0.2)
+        self.backoff_max = _float_setting("API_RETRY_BACKOFF_MAX", 5.0)
+        self.budget = RetryBudget(_float_setting("API_RETRY_BUDGET", 0.2), get_int_setting("API_RETRY_RESERVE", 10))
+        self.breaker_threshold = get_int_setting("API_BREAKER_THRESHOLD", 5)
+        self.breaker_reset = _float_setting("API_BREAKER_RESET", 30.0)
+        self.breakers = {}
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint):
+        if self.breaker_threshold <= 0:
+            return None
+        with self._lock:
+            if endpoint not in self.breakers:
+                self.breakers[endpoint] = CircuitBreaker(self.breaker_threshold, self.breaker_reset)
+            return self.breakers[endpoint]
+
+    def count(self, endpoint, name):
+        with self._lock:
+            counters = self.metrics.setdefault(endpoint, {
+                'requests': 0, 'retries': 0, 'recovered': 0, 'gave_up': 0,
+                'budget_exhausted': 0, 'breaker_opened': 0, 'short_circuited': 0,
+            })
+            counters[name] += 1
+
+    def delay(self, attempt, response=None):
+        # Full jitter; Retry-After wins when the server sends a usable one
+        cap = min(self.backoff_max, self.backoff * (2 ** attempt))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(self.backoff_max, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return random.uniform(0, cap)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'endpoints': {endpoint: dict(counters) for endpoint, counters in self.metrics.items()},
+                'open_breakers': sorted(endpoint for endpoint, breaker in self.breakers.items()
+                                        if breaker.state != "closed"),
+                'budget_tokens': round(self.budget.tokens, 2),
+            }
+
+
+class ResilientAdapter(BaseAdapter):
+    """Retries transient failures of idempotent requests sent through `inner`"""
+
+    def __init__(self, inner, resilience):
+        super().__init__()
+        self.inner = inner
+        self.resilience = resilience
+
+    def _may_retry(self, endpoint, attempt, breaker):
+        if breaker is not None and breaker.state == "open":
+            # This failure opened the breaker, the caller gets it instead of CircuitOpenError
+            return False
+        if attempt >= self.resilience.retries:
+            self.resilience.count(endpoint, 'gave_up')
+            return False
+        if not self.resilience.budget.withdraw():
+            self.resilience.count(endpoint, 'budget_exhausted')
+            return False
+        return True
+
+    def send(self, request, **kwargs):
+        resilience = self.resilience
+        endpoint = f"{request.method} {urlsplit(request.url).path}"
+        breaker = resilience.breaker(endpoint)
+        retryable = request.method in resilience.methods
+        resilience.count(endpoint, 'requests')
+        resilience.budget.deposit()
+
+        attempt = 0
+        while True:
+            if breaker is not None and not breaker.allow():
+                resilience.count(endpoint, 'short_circuited')
+                raise CircuitOpenError(f"Circuit open for {endpoint} after repeated failures", request=request)
+            response, error = None, None
+            try:
+                response = self.inner.send(request, **kwargs)
+            except TRANSIENT_ERRORS as e:
+                error = e
+            except Exception:
+                if breaker is not None:
+                    breaker.release()
+                raise
+
+            # Only transient failures count against the breaker, a 500 or 404 is a real answer
+            failed = error is not None or response.status_code in resilience.statuses
+            if breaker is not None:
+                if not failed:
+                    breaker.record_success()
+                elif breaker.record_failure():
+                    resilience.count(endpoint, 'breaker_opened')
+            if not failed:
+                if attempt:
+                    resilience.count(endpoint, 'recovered')
+                return response
+
+            if retryable and self._may_retry(endpoint, attempt, breaker):
+                delay = resilience.delay(attempt, response)
+                attempt += 1
+                resilience.count(endpoint, 'retries')
+                if response is not None:
+                    # Read the rest of the body so the connection goes back to the pool
+                    # for the retry; close() alone would drop the socket
+                    response.content
+                    response.close()
+                time.sleep(delay)
+                continue
+            if error is not None:
+                raise error
+            return response
+
+    def close(self):
+        self.inner.close()
+
+
+_resilience = None
+_resilience_lock = threading.Lock()
+
+
+def get_resilience():
+    global _resilience
+    with _resilience_lock:
+        if _resilience is None:
+            _resilience = Resilience()
+        return _resilience
+
+
+def wrap_transport(transport):
+    """The transport, behind retries and breakers when API_RETRIES is set"""
+    if not is_enabled():
+        return transport
+    return ResilientAdapter(transport, get_resilience())
+
+
+def resilience_stats():
+    return _resilience.stats() if _resilience is not None else None
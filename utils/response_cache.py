@@ -0,0 +1,124 @@
+# utils/response_cache.py
+"""Optional client-side cache for catalog GETs (API_CACHE=1).
+
+Many tests fetch productsList and brandsList, which do not change during a
+run. With API_CACHE on, APIClient.get() keeps the responses of the endpoints
+in API_CACHE_ENDPOINTS (default productsList,brandsList) in a process-wide
+LRU of API_CACHE_SIZE entries (default 64) for API_CACHE_TTL seconds
+(default 60). An expired entry that came with an ETag or Last-Modified is
+revalidated with If-None-Match / If-Modified-Since, and a 304 keeps it for
+another TTL. Pass cache=False to get() or the catalog helpers to always hit
+the server, e.g. when measuring latency.
+"""
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+from utils.config import get_bool_setting, get_int_setting, get_setting
+
+DEFAULT_ENDPOINTS = "productsList,brandsList"
+DEFAULT_SIZE = 64
+DEFAULT_TTL = 60
+
+
+def is_enabled():
+    return get_bool_setting("API_CACHE", False)
+
+
+def cacheable_endpoints():
+    return {endpoint.strip() for endpoint in get_setting("API_CACHE_ENDPOINTS", DEFAULT_ENDPOINTS).split(",")
+            if endpoint.strip()}
+
+
+class _Entry:
+    __slots__ = ("response", "stored_at")
+
+    def __init__(self, response):
+        self.response = response
+        self.stored_at = time.monotonic()
+
+
+class ResponseCache:
+    """LRU + TTL cache of requests.Response objects for GET requests"""
+
+    def __init__(self, max_entries=DEFAULT_SIZE, ttl=DEFAULT_TTL):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'evictions': 0, 'bypassed': 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _lookup(self, key):
+        # (entry, fresh), marks the entry as recently used
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+            return entry, time.monotonic() - entry.stored_at < self.ttl
+
+    def _store(self, key, response):
+        with self._lock:
+            self._entries[key] = _Entry(response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def bypass(self):
+        self._count('bypassed')
+
+    def fetch(self, session, url, params=None, timeout=None):
+        """The cached response for url and params, from the server when missing or stale"""
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        entry, fresh = self._lookup(key)
+        if fresh:
+            self._count('hits')
+            return entry.response
+
+        headers = {}
+        if entry is not None:
+            # Conditional request, a 304 means the stored body is still current
+            if entry.response.headers.get('ETag'):
+                headers['If-None-Match'] = entry.response.headers['ETag']
+            if entry.response.headers.get('Last-Modified'):
+                headers['If-Modified-Since'] = entry.response.headers['Last-Modified']
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidated')
+            with self._lock:
+                entry.stored_at = time.monotonic()
+            return entry.response
+
+        self._count('misses')
+        if response.status_code == 200 and "no-store" not in response.headers.get('Cache-Control', ""):
+            self._store(key, response)
+        return response
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """The shared cache, None when API_CACHE is off"""
+    global _cache
+    if not is_enabled():
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(get_int_setting("API_CACHE_SIZE", DEFAULT_SIZE),
+                                   get_int_setting("API_CACHE_TTL", DEFAULT_TTL))
+        return _cache
+
+
+def response_cache_stats():
+    return dict(_cache.stats) if _cache is not None else None
@@ -0,0 +1,219 @@
+# utils/results_db.py
+"""SQLite store of test results across runs, with a static trend page.
+
+conftest.py records every test phase (setup/call/teardown) with its outcome
+and duration, plus the run environment. The same data feeds duration-based
+sharding and the trend page:
+
+    python -m utils.results_db --trend reports/trends.html --runs 30
+"""
+import argparse
+import html
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+from utils.config import get_base_url, get_setting
+
+DEFAULT_RESULTS_DB = "reports/results.sqlite3"
+DEFAULT_TREND_PAGE = "reports/trends.html"
+
+# A test counts as slower when its latest duration exceeds the median of earlier runs by this factor
+SLOWDOWN_FACTOR = 1.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_group TEXT,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    exit_status INTEGER,
+    shard_index INTEGER,
+    shard_count INTEGER,
+    environment TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL,
+    PRIMARY KEY (run_id, nodeid, phase)
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid);
+"""
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_environment():
+    # What the run was executed against, stored as JSON with the run
+    return {
+        'base_url': get_base_url(),
+        'browser_profile': get_setting("BROWSER_PROFILE"),
+        'driver_pool_size': get_setting("DRIVER_POOL_SIZE"),
+        'workers': get_setting("TEST_WORKERS"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'host': platform.node(),
+        'git_commit': _git_commit(),
+    }
+
+
+class ResultsDB:
+    def __init__(self, path=None):
+        self.path = path or get_setting("RESULTS_DB", DEFAULT_RESULTS_DB)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Parallel workers write at the end of their run, wait for each other's locks
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def record_run(self, started_at, results, exit_status=None, run_group=None,
+                   shard_index=None, shard_count=None, environment=None):
+        """Store one run; results is a list of (nodeid, phase, outcome, duration)"""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (run_group, started_at, finished_at, exit_status, shard_index, shard_count, environment)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (run_group, started_at, datetime.now().isoformat(timespec='seconds'), exit_status,
+                 shard_index, shard_count, json.dumps(environment or {})),
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (run_id, nodeid, phase, outcome, duration) VALUES (?, ?, ?, ?, ?)",
+                [(run_id, nodeid, phase, outcome, duration) for nodeid, phase, outcome, duration in results],
+            )
+        return run_id
+
+    def test_durations(self, runs=5, exclude_group=None):
+        """{nodeid: median total duration} over the latest passing runs of each test, for sharding"""
+        rows = self.connection.execute(
+            "SELECT r.nodeid, r.run_id, SUM(r.duration) FROM results r JOIN runs ON runs.id = r.run_id"
+            " WHERE runs.run_group IS NOT ? OR ? IS NULL"
+            " GROUP BY r.nodeid, r.run_id HAVING SUM(r.outcome = 'failed') = 0"
+            " ORDER BY r.nodeid, r.run_id DESC",
+            (exclude_group, exclude_group),
+        ).fetchall()
+        samples = {}
+        for nodeid, _, duration in rows:
+            values = samples.setdefault(nodeid, [])
+            if len(values) < runs:
+                values.append(duration)
+        return {nodeid: sorted(values)[len(values) // 2] for nodeid, values in samples.items()}
+
+    def trend(self, runs=20):
+        """(run rows, {nodeid: [(run_id, total duration, outcome), ...]}) for the latest runs"""
+        run_rows = self.connection.execute(
+            "SELECT id, started_at, exit_status, shard_index, environment FROM runs ORDER BY id DESC LIMIT ?",
+            (runs,),
+        ).fetchall()[::-1]
+        if not run_rows:
+            return [], {}
+        rows = self.connection.execute(
+            "SELECT nodeid, run_id, SUM(duration), MAX(outcome = 'failed'), MAX(outcome = 'skipped') FROM results"
+            " WHERE run_id >= ? GROUP BY nodeid, run_id ORDER BY nodeid, run_id",
+            (run_rows[0][0],),
+        ).fetchall()
+        tests = {}
+        for nodeid, run_id, duration, failed, skipped in rows:
+            outcome = "failed" if failed else "skipped" if skipped else "passed"
+            tests.setdefault(nodeid, []).append((run_id, duration, outcome))
+        return run_rows, tests
+
+
+def _sparkline(points, width=160, height=28):
+    # Inline SVG of durations, failed runs marked red
+    if len(points) < 2:
+        return ""
+    highest = max(duration for _, duration, _ in points) or 1
+    step = width / (len(points) - 1)
+    coordinates = [(i * step, height - 2 - (duration / highest) * (height - 4))
+                   for i, (_, duration, _) in enumerate(points)]
+    line = " ".join(f"{x:.1f},{y:.1f}" for x, y in coordinates)
+    failures = "".join(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="2.5" fill="#c0392b"/>'
+                       for (x, y), (_, _, outcome) in zip(coordinates, points) if outcome == "failed")
+    return (f'<svg width="{width}" height="{height}"><polyline fill="none" stroke="#2c7be5" '
+            f'stroke-width="1.5" points="{line}"/>{failures}</svg>')
+
+
+def slowdown(points):
+    # Latest duration / median of the earlier ones, None without history
+    if len(points) < 3:
+        return None
+    earlier = sorted(duration for _, duration, _ in points[:-1])
+    median = earlier[len(earlier) // 2]
+    return points[-1][1] / median if median > 0 else None
+
+
+def write_trend_page(db, path=DEFAULT_TREND_PAGE, runs=20):
+    run_rows, tests = db.trend(runs)
+    rows = []
+    for nodeid, points in sorted(tests.items(), key=lambda item: -(slowdown(item[1]) or 0)):
+        ratio = slowdown(points)
+        flag = ' class="slower"' if ratio and ratio >= SLOWDOWN_FACTOR else ""
+        failed = sum(1 for _, _, outcome in points if outcome == "failed")
+        rows.append(
+            f"<tr{flag}><td>{html.escape(nodeid)}</td><td>{_sparkline(points)}</td>"
+            f"<td>{points[-1][1]:.2f}s</td><td>{f'{ratio:.2f}x' if ratio else '-'}</td>"
+            f"<td>{failed}/{len(points)}</td></tr>"
+        )
+    run_items = "".join(
+        f"<li>#{run_id} {html.escape(started_at)}"
+        f"{f' shard {shard_index}' if shard_index is not None else ''} exit {exit_status}</li>"
+        for run_id, started_at, exit_status, shard_index, _ in run_rows
+    )
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Test duration trends</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+td, th {{ border-bottom: 1px solid #ddd; padding: 4px 10px; text-align: left; }}
+tr.slower td {{ background: #fdecea; }}
+</style></head><body>
+<h1>Test duration trends</h1>
+<p>Last {len(run_rows)} runs from {html.escape(db.path)}, generated {datetime.now().isoformat(timespec='seconds')}.
+Highlighted tests are at least {SLOWDOWN_FACTOR}x slower than their median.</p>
+<table><tr><th>Test</th><th>Duration</th><th>Latest</th><th>vs median</th><th>Failed</th></tr>
+{''.join(rows)}
+</table>
+<h2>Runs</h2><ul>{run_items}</ul>
+</body></html>
+"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test duration trends from the results database")
+    parser.add_argument("--db", default=get_setting("RESULTS_DB", DEFAULT_RESULTS_DB))
+    parser.add_argument("--trend", default=DEFAULT_TREND_PAGE, help="Trend page to write")
+    parser.add_argument("--runs", type=int, default=20, help="Number of latest runs shown")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"No results database at {args.db}")
+        return 1
+    db = ResultsDB(args.db)
+    try:
+        print(f"Trend page written to {write_trend_page(db, args.trend, args.runs)}")
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,190 @@
 # utils/screenshot_utils.py
+import atexit
+import base64
 import os
+import queue
+import threading
+from collections import deque
 from datetime import datetime
+from utils.artifact_store import get_artifact_store
+from utils.config import get_bool_setting, get_int_setting, get_setting
+
+# SCREENSHOT_RETENTION values
+RETAIN_ALL = "all"
+RETAIN_ON_FAILURE = "on-failure"
+
+
+def write_png_file(filepath, png_bytes, test=None, step=None):
+    # Through the deduplicating artifact store unless SCREENSHOT_DEDUP is off
+    store = get_artifact_store()
+    if store is not None:
+        return store.store_screenshot(filepath, png_bytes, test, step)
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    with open(filepath, 'wb') as f:
+        f.write(png_bytes)
+    return filepath
+
+
+def screenshot_path(filepath):
+    # The path write_png_file() will use for `filepath`, known before the write
+    store = get_artifact_store()
+    return store.output_path(filepath) if store is not None else filepath
+
+
+class ScreenshotWriter:
+    """Writes screenshots and page sources on background threads.
+
+    The test thread only fetches the base64 payload from the browser and
+    queues it; decoding and disk writes happen on `workers` threads. The
+    queue is bounded, so a slow disk blocks the test instead of using
+    unbounded memory. flush() waits until every queued file is written.
+    """
+
+    def __init__(self, workers=2, max_queue=64):
+        self._queue = queue.Queue(maxsize=max(1, max_queue))
+        self._threads = []
+        self.written = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        for index in range(max(1, workers)):
+            thread = threading.Thread(target=self._work, name=f"screenshot-writer-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def write_png(self, filepath, png_base64, test=None, step=None):
+        self._queue.put(('png', filepath, png_base64, test, step))
+
+    def write_text(self, filepath, text):
+        self._queue.put(('text', filepath, text, None, None))
+
+    def flush(self):
+        # Block until every queued file is on disk
+        self._queue.join()
+
+    def _work(self):
+        while True:
+            kind, filepath, payload, test, step = self._queue.get()
+            try:
+                os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+                if kind == 'png':
+                    write_png_file(filepath, base64.b64decode(payload), test, step)
+                else:
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        f.write(payload)
+                with self._lock:
+                    self.written += 1
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                print(f"Failed to write {filepath}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_screenshot_writer():
+    """Shared background writer, None when SCREENSHOT_ASYNC is disabled"""
+    global _writer
+    if not get_bool_setting("SCREENSHOT_ASYNC", True):
+        return None
+    with _writer_lock:
+        if _writer is None:
+            _writer = ScreenshotWriter(get_int_setting("SCREENSHOT_WRITERS", 2),
+                                       get_int_setting("SCREENSHOT_QUEUE_SIZE", 64))
+            # Files still queued when a plain unittest run ends are written too
+            atexit.register(_writer.flush)
+    return _writer
+
+
+def flush_screenshots():
+    # Called at session end so every queued screenshot is written
+    if _writer is not None:
+        _writer.flush()
+
+
+class StepScreenshotBuffer:
+    """Keeps the last `size` step screenshots of the running test in memory.
+
+    Used when SCREENSHOT_RETENTION=on-failure: persist() writes them when the
+    test fails and returns the paths written, discard() drops them once the
+    test is over.
+    """
+
+    def __init__(self, size=5):
+        self._captures = deque(maxlen=max(1, size))
+
+    def __len__(self):
+        return len(self._captures)
+
+    def add(self, filepath, png_base64, test=None, step=None):
+        self._captures.append((filepath, png_base64, test, step))
+
+    def persist(self):
+        paths = []
+        writer = get_screenshot_writer()
+        while self._captures:
+            filepath, png_base64, test, step = self._captures.popleft()
+            if writer is None:
+                paths.append(write_png_file(filepath, base64.b64decode(png_base64), test, step))
+            else:
+                writer.write_png(filepath, png_base64, test, step)
+                paths.append(screenshot_path(filepath))
+        return paths
+
+    def discard(self):
+        self._captures.clear()
+
+
+_step_buffer = None
+
+
+def get_step_buffer():
+    """Step screenshot buffer, None unless SCREENSHOT_RETENTION=on-failure"""
+    global _step_buffer
+    if get_setting("SCREENSHOT_RETENTION", RETAIN_ALL) != RETAIN_ON_FAILURE:
+        return None
+    if _step_buffer is None:
+        _step_buffer = StepScreenshotBuffer(get_int_setting("SCREENSHOT_BUFFER_SIZE", 5))
+    return _step_buffer
+
+
+def persist_step_screenshots():
+    # Write the buffered step screenshots of the current test (it failed)
+    buffer = get_step_buffer()
+    return buffer.persist() if buffer is not None else []
+
+
+def discard_step_screenshots():
+    # Drop the buffered step screenshots of the current test (it is over)
+    buffer = get_step_buffer()
+    if buffer is not None:
+        buffer.discard()
+
+
+def save_screenshot(driver, filepath, test=None, step=None, png_base64=None):
+    # Grab the PNG on the test thread (unless the caller already did), write it in the
+    # background when enabled. Returns the path the screenshot is saved at, the
+    # extension may differ from filepath's
+    writer = get_screenshot_writer()
+    if writer is None:
+        png_bytes = base64.b64decode(png_base64) if png_base64 else driver.get_screenshot_as_png()
+        return write_png_file(filepath, png_bytes, test, step)
+    writer.write_png(filepath, png_base64 or driver.get_screenshot_as_base64(), test, step)
+    return screenshot_path(filepath)
+
+
+def save_page_source(driver, filepath):
+    source = driver.page_source
+    writer = get_screenshot_writer()
+    if writer is None:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(source)
+    else:
+        writer.write_text(filepath, source)
+
 
 class ScreenshotManager:
     def __init__(self, driver, test_name="test"):
@@ -17,18 +201,21 @@ class ScreenshotManager:
             filename = f"FAILURE_{self.test_name}_{test_method_name}_{timestamp}.png"
             filepath = os.path.join(self.screenshot_dir, filename)
             
-            self.driver.save_screenshot(filepath)
+            filepath = save_screenshot(self.driver, filepath, self.test_name, f"FAILURE_{test_method_name}")
             
             # Also save page source for debugging
             source_filename = filename.replace('.png', '_page_source.html')
             source_filepath = os.path.join(self.screenshot_dir, source_filename)
             
-            with open(source_filepath, 'w', encoding='utf-8') as f:
-                f.write(self.driver.page_source)
+            save_page_source(self.driver, source_filepath)
             
             print(f"Screenshot saved: {filepath}")
             print(f"Page source saved: {source_filepath}")
             
+            # Keep the steps that led to the failure
+            for step_filepath in persist_step_screenshots():
+                print(f"Step screenshot saved: {step_filepath}")
+            
             return filepath
             
         except Exception as e:
@@ -36,13 +223,23 @@ class ScreenshotManager:
             return None
     
     def capture_step_screenshot(self, step_name):
-        """Capture screenshot for successful steps (optional)"""
+        """Capture screenshot for successful steps (optional)
+
+        Returns the saved path, or None when the screenshot is only buffered
+        (SCREENSHOT_RETENTION=on-failure) or could not be taken.
+        """
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"{self.test_name}_{step_name}_{timestamp}.png"
             filepath = os.path.join(self.screenshot_dir, filename)
             
-            self.driver.save_screenshot(filepath)
+            buffer = get_step_buffer()
+            if buffer is not None:
+                # Only written to disk if the test fails, persist() reports the paths then
+                buffer.add(filepath, self.driver.get_screenshot_as_base64(), self.test_name, step_name)
+                return None
+            
+            filepath = save_screenshot(self.driver, filepath, self.test_name, step_name)
             print(f"Step screenshot saved: {filepath}")
             
             return filepath
@@ -0,0 +1,85 @@
+# utils/session_login.py
+"""Log a browser in without driving the login form.
+
+The account is checked (or created) through APIClient, the login form is
+posted with requests, and the resulting session cookies are injected into
+the WebDriver before its first navigation:
+
+    cookies = api_login(email, password)
+    inject_cookies(driver, cookies)
+    driver.get(base_url)   # already logged in
+"""
+import re
+import requests
+from selenium.common.exceptions import WebDriverException
+from utils.api_client import APIClient
+from utils.config import get_base_url
+from utils.http_transport import default_timeout, mount_transport
+
+CSRF_FIELD = re.compile(r'name=["\']csrfmiddlewaretoken["\']\s+value=["\']([^"\']+)["\']')
+
+
+def ensure_user(email, password, user_data=None, base_url=None):
+    """Check the credentials with verifyLogin, create the account if it does not exist"""
+    client = APIClient(base_url)
+    try:
+        response = client.verify_login(email, password)
+        data = response['data']
+        if isinstance(data, dict) and data.get('responseCode') == 200:
+            return True
+        if user_data is None:
+            print(f"❌ verifyLogin failed for {email}: {data}")
+            return False
+        response = client.create_account(dict(user_data, email=email, password=password))
+        data = response['data']
+        return isinstance(data, dict) and data.get('responseCode') == 201
+    finally:
+        client.session.close()
+
+
+def api_login(email, password, base_url=None, user_data=None):
+    """Log in over HTTP and return the session cookies, None when login failed"""
+    base_url = (base_url or get_base_url()).rstrip('/')
+    if not ensure_user(email, password, user_data, base_url):
+        return None
+
+    with requests.Session() as session:
+        mount_transport(session)
+        login_url = f"{base_url}/login"
+        page = session.get(login_url, timeout=default_timeout())
+        match = CSRF_FIELD.search(page.text)
+        form = {
+            'csrfmiddlewaretoken': match.group(1) if match else "",
+            'email': email,
+            'password': password,
+        }
+        # Django checks the Referer of HTTPS form posts
+        response = session.post(login_url, data=form, headers={'Referer': login_url}, timeout=default_timeout())
+        if "Logged in as" not in response.text:
+            print(f"❌ API login failed for {email} (HTTP {response.status_code})")
+            return None
+        return list(session.cookies)
+
+
+def inject_cookies(driver, cookies, base_url=None):
+    """Add requests cookies to the browser, works before the first navigation on Chrome"""
+    base_url = (base_url or get_base_url()).rstrip('/')
+    try:
+        for cookie in cookies:
+            params = {
+                'name': cookie.name,
+                'value': cookie.value,
+                'url': base_url + (cookie.path or "/"),
+                'path': cookie.path or "/",
+                'secure': bool(cookie.secure),
+                'httpOnly': cookie.has_nonstandard_attr('HttpOnly'),
+            }
+            if cookie.expires:
+                params['expires'] = cookie.expires
+            driver.execute_cdp_cmd("Network.setCookie", params)
+    except (AttributeError, WebDriverException):
+        # No CDP: cookies can only be added for the domain that is currently open
+        driver.get(base_url + "/robots.txt")
+        for cookie in cookies:
+            driver.add_cookie({'name': cookie.name, 'value': cookie.value, 'path': cookie.path or "/",
+                               'secure': bool(cookie.secure)})
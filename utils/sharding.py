@@ -0,0 +1,63 @@
+# utils/sharding.py
+import json
+import os
+
+DEFAULT_DURATIONS_FILE = "reports/durations.json"
+
+# Weight used for tests that have never been timed
+DEFAULT_TEST_DURATION = 1.0
+
+
+def load_durations(path=DEFAULT_DURATIONS_FILE):
+    # Load recorded test durations {nodeid: seconds}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(new_durations, path=DEFAULT_DURATIONS_FILE):
+    # Merge durations from this run into the durations file
+    durations = load_durations(path)
+    durations.update(new_durations)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(durations, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    return durations
+
+
+def default_duration(durations):
+    # Median of the known durations, the weight given to tests never timed
+    if not durations:
+        return DEFAULT_TEST_DURATION
+    known = sorted(durations.values())
+    return known[len(known) // 2]
+
+
+def estimate_duration(nodeid, durations, default=None):
+    # Known duration, or the median of known tests for new ones
+    if nodeid in durations:
+        return durations[nodeid]
+    return default_duration(durations) if default is None else default
+
+
+def assign_shards(nodeids, durations, shard_count):
+    """Split tests into shard_count groups with similar total duration.
+
+    Longest-processing-time first: tests are sorted by expected duration and
+    each one goes to the shard with the smallest total so far. The result is
+    deterministic, so every worker computes the same assignment on its own.
+    """
+    shards = [[] for _ in range(shard_count)]
+    totals = [0.0] * shard_count
+    default = default_duration(durations)
+    estimates = {nodeid: estimate_duration(nodeid, durations, default) for nodeid in nodeids}
+    weighted = sorted(nodeids, key=lambda n: (-estimates[n], n))
+    for nodeid in weighted:
+        index = min(range(shard_count), key=lambda i: (totals[i], i))
+        shards[index].append(nodeid)
+        totals[index] += estimates[nodeid]
+    return shards, totals
@@ -0,0 +1,216 @@
+# utils/user_pool.py
+"""Pre-provisioned test accounts leased to tests one at a time.
+
+The pytest session provisions USER_POOL_SIZE accounts at once with
+AsyncAPIClient before the first test (plain unittest runs on the first
+lease). Accounts are saved to USER_POOL_FILE (per site and shard), so the
+next run only re-checks them with verifyLogin instead of creating new ones;
+saved accounts that fail the check are deleted. With USER_POOL_PERSIST=0
+(the default for the local stand-in server) they are deleted at session
+end instead.
+
+    with get_user_pool().lease() as user:
+        client.verify_login(user['email'], user['password'])
+"""
+import json
+import os
+import queue
+import threading
+import uuid
+from collections.abc import Mapping
+from contextlib import contextmanager
+from utils.async_api_client import AsyncAPIClient
+from utils.config import get_base_url, get_bool_setting, get_cache_dir, get_int_setting, get_setting
+
+DEFAULT_POOL_SIZE = 4
+
+
+def new_user_data(prefix="pool"):
+    # createAccount form data for a new, unique account
+    email = f"{prefix}{uuid.uuid4().hex[:12]}@example.com"
+    return {
+        'name': "Pool User", 'email': email, 'password': f"{prefix}password123",
+        'title': "Mr", 'birth_date': "1", 'birth_month': "1", 'birth_year': "1990",
+        'firstname': "Pool", 'lastname': "User", 'company': "Test Company",
+        'address1': "123 Test Street", 'country': "United States", 'zipcode': "12345",
+        'state': "California", 'city': "Los Angeles", 'mobile_number': "1234567890",
+    }
+
+
+def _response_code(response):
+    data = response.get('data') if isinstance(response, Mapping) else None
+    return data.get('responseCode') if isinstance(data, dict) else None
+
+
+def _describe_failure(response):
+    # Why a createAccount call did not create the account
+    if isinstance(response, Exception):
+        return f"{type(response).__name__}: {response}"
+    return f"responseCode {_response_code(response)}"
+
+
+class UserPool:
+    def __init__(self, size=DEFAULT_POOL_SIZE, base_url=None, path=None, persist=True):
+        self.size = max(1, size)
+        self.base_url = (base_url or get_base_url()).rstrip('/')
+        self.path = path or get_setting("USER_POOL_FILE", os.path.join(get_cache_dir(), "user_pool.json"))
+        self.persist = persist
+        # Parallel workers must never lease the same account
+        self.key = f"{self.base_url}#shard{get_int_setting('SHARD_INDEX', 0)}"
+        self.users = []
+        self.stats = {'reused': 0, 'created': 0, 'retired': 0, 'deleted': 0}
+        self._available = queue.Queue()
+        self._lock = threading.Lock()
+        self._provisioned = False
+        # Last reason an account could not be created, reported when the pool is empty
+        self.provision_error = None
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        pools = self._load()
+        pools[self.key] = self.users
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(pools, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Could not save user pool: {e}")
+
+    def provision(self):
+        """Check saved accounts and create the missing ones, all concurrently"""
+        with self._lock:
+            if self._provisioned:
+                return
+            saved = self._load().get(self.key, []) if self.persist else []
+
+            if saved:
+                responses = AsyncAPIClient(self.base_url).run_batch(
+                    [("verify_login", user['email'], user['password']) for user in saved],
+                    return_exceptions=True,
+                )
+                healthy = [user for user, response in zip(saved, responses) if _response_code(response) == 200]
+                self.users = healthy[:self.size]
+                self.stats['reused'] = len(self.users)
+                # Accounts that failed the check or no longer fit the pool are not kept, remove them
+                dropped = [user for user in saved if user not in self.users]
+                if dropped:
+                    self._delete_accounts(dropped)
+
+            missing = [new_user_data() for _ in range(self.size - len(self.users))]
+            if missing:
+                responses = AsyncAPIClient(self.base_url).run_batch(
+                    [("create_account", user) for user in missing], return_exceptions=True,
+                )
+                created = [user for user, response in zip(missing, responses) if _response_code(response) == 201]
+                failures = [response for response in responses if _response_code(response) != 201]
+                if failures:
+                    self.provision_error = _describe_failure(failures[0])
+                self.users.extend(created)
+                self.stats['created'] = len(created)
+
+            for user in self.users:
+                self._available.put(user)
+            if self.persist:
+                self._save()
+            self._provisioned = True
+            print(f"👥 User pool ready: {self.stats['reused']} reused, {self.stats['created']} created")
+
+    def _top_up(self):
+        # Replace accounts retired during this session
+        user = new_user_data()
+        responses = AsyncAPIClient(self.base_url, concurrency=1).run_batch([("create_account", user)],
+                                                                            return_exceptions=True)
+        if _response_code(responses[0]) != 201:
+            self.provision_error = _describe_failure(responses[0])
+            return
+        with self._lock:
+            self.users.append(user)
+            self.stats['created'] += 1
+        self._available.put(user)
+
+    def acquire(self, timeout=30):
+        # Exclusive checkout, blocks while every account is leased
+        self.provision()
+        if self._available.empty() and len(self.users) < self.size:
+            self._top_up()
+        if not self.users:
+            # No account exists, so none can be released: fail now instead of after the timeout
+            raise RuntimeError(f"User pool has no accounts for {self.base_url}: {self.provision_error}")
+        try:
+            return self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No pooled user available within {timeout}s") from None
+
+    def release(self, user):
+        self._available.put(user)
+
+    def retire(self, user):
+        # The test deleted the account (or changed its password), never lease it again
+        with self._lock:
+            if user in self.users:
+                self.users.remove(user)
+                self.stats['retired'] += 1
+                if self.persist:
+                    self._save()
+
+    @contextmanager
+    def lease(self, timeout=30):
+        user = self.acquire(timeout)
+        try:
+            yield user
+        finally:
+            if user in self.users:
+                self.release(user)
+
+    def close(self):
+        """Save the pool for the next run, or delete every account when not persisting"""
+        if not self._provisioned:
+            return
+        if self.persist:
+            self._save()
+            return
+        self._delete_accounts(self.users)
+        self.users = []
+
+    def _delete_accounts(self, users):
+        # Best effort: an account whose password changed cannot be deleted and is left behind
+        responses = AsyncAPIClient(self.base_url).run_batch(
+            [("delete_account", user['email'], user['password']) for user in users],
+            return_exceptions=True,
+        )
+        self.stats['deleted'] += sum(1 for response in responses if _response_code(response) == 200)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_user_pool():
+    """Session-wide pool for the current BASE_URL, provisioned by conftest.py before the first test"""
+    global _pool
+    with _pool_lock:
+        base_url = get_base_url()
+        if _pool is None or _pool.base_url != base_url.rstrip('/'):
+            if _pool is not None:
+                _pool.close()
+            # The local stand-in server forgets its accounts on exit, so nothing is kept for it
+            persist = get_bool_setting("USER_POOL_PERSIST", not get_bool_setting("LOCAL_SERVER"))
+            _pool = UserPool(get_int_setting("USER_POOL_SIZE", DEFAULT_POOL_SIZE), base_url, persist=persist)
+    return _pool
+
+
+def close_user_pool():
+    # Called at session end
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None